@@ -0,0 +1,37 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+import os
+import sys
+import asyncio
+
+# add ../../Sources to the PYTHONPATH
+sys.path.append(os.path.join("..", "..", "Sources"))
+from yocto_asyncio import *
+
+
+async def watchSensor(api, sensor):
+    hwid = await sensor.get_hardwareId()
+    unit = await sensor.get_unit()
+    async for measure in api.timedReports(sensor):
+        print("%s: %s %s (timed report)" % (hwid, measure.get_averageValue(), unit))
+
+
+async def main():
+    errmsg = YRefParam()
+    async with YAsyncAPI() as api:
+        # Setup the API to use local USB devices
+        if await api.run(YAPI.RegisterHub, "usb", errmsg) != YAPI.SUCCESS:
+            sys.exit("init error" + errmsg.value)
+        tasks = []
+        sensor = YSensor.FirstSensor()
+        while sensor is not None:
+            tasks.append(asyncio.ensure_future(watchSensor(api, api.wrap(sensor))))
+            sensor = sensor.nextSensor()
+        if len(tasks) == 0:
+            sys.exit("No sensor connected (check USB cable)")
+        print('Hit Ctrl-C to Stop ')
+        await asyncio.gather(*tasks)
+    YAPI.FreeAPI()
+
+
+asyncio.run(main())
@@ -0,0 +1,46 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# Measures the time needed to apply a 5-point linear calibration to the
+# values of a datalogger stream, comparing the single-value handler called
+# once per value with the batch handler (bisection), and with NumPy arrays
+# when NumPy is installed.
+# No Yoctopuce device is needed.
+#
+import sys
+import os
+import random
+import timeit
+
+# add ../../Sources to the PYTHONPATH
+sys.path.append(os.path.join("..", "..", "Sources"))
+from yocto_api import *
+
+
+def main():
+    calibType = 5
+    rawValues = [0.0, 10.0, 20.0, 30.0, 40.0]
+    refValues = [0.2, 10.1, 20.5, 29.8, 40.3]
+    values = [random.uniform(-5.0, 45.0) for i in range(100000)]
+    handler = YAPI.LinearCalibrationHandler
+    loops = 3
+    scalar = min(timeit.repeat(lambda: [handler(v, calibType, [], rawValues, refValues) for v in values],
+                               number=loops, repeat=3))
+    batch = min(timeit.repeat(
+        lambda: YAPI.LinearCalibrationBatchHandler(values, calibType, [], rawValues, refValues),
+        number=loops, repeat=3))
+    print("%-12s %10.2f ms" % ("scalar", scalar / loops * 1000))
+    print("%-12s %10.2f ms" % ("batch", batch / loops * 1000))
+    try:
+        import numpy
+    except ImportError:
+        return
+    npvalues = numpy.array(values)
+    vectorized = min(timeit.repeat(
+        lambda: YAPI.LinearCalibrationBatchHandler(npvalues, calibType, [], rawValues, refValues),
+        number=loops, repeat=3))
+    print("%-12s %10.2f ms" % ("batch numpy", vectorized / loops * 1000))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# Measures the throughput of value and timed-report notifications dispatch
+# for 100 to 10000 registered callbacks, comparing the former linear scan of
+# the callback lists with the descriptor-indexed lookup.
+# No Yoctopuce device is needed: functions get fake descriptors and the
+# native callbacks are invoked directly.
+#
+import sys
+import os
+import ctypes
+import random
+import timeit
+
+# add ../../Sources to the PYTHONPATH
+sys.path.append(os.path.join("..", "..", "Sources"))
+from yocto_api import *
+
+
+def legacyFunctionUpdate(f, data):
+    for i in range(len(YFunction._FunctionCallbacks)):
+        descriptor = YFunction._FunctionCallbacks[i].get_functionDescriptor()
+        if descriptor == f:
+            ev = YAPI._Event()
+            ev.setFunVal(YFunction._FunctionCallbacks[i], data.decode(YAPI.DefaultEncoding))
+            YAPI._DataEvents.append(ev)
+            return 0
+    return 0
+
+
+def main():
+    report = (ctypes.c_ubyte * 9)(1, 0, 0, 0, 0, 0, 0, 0, 0)
+    print("%10s %18s %18s %18s" % ("callbacks", "legacy [notif/s]", "indexed [notif/s]", "timed [notif/s]"))
+    for ncallbacks in (100, 1000, 10000):
+        functions = []
+        for i in range(ncallbacks):
+            func = YFunction("function%d" % i)
+            func._fundescr = 0x10000 + i
+            functions.append(func)
+        YFunction._FunctionCallbacks[:] = functions
+        YFunction._TimedReportCallbackList[:] = functions
+        YFunction._InvalidateCallbackIndexes()
+        notifications = [random.choice(functions)._fundescr for i in range(2000)]
+        legacy = min(timeit.repeat(lambda: [legacyFunctionUpdate(f, b"21.5") for f in notifications],
+                                   number=1, repeat=3))
+        YAPI._DataEvents.clear()
+        indexed = min(timeit.repeat(
+            lambda: [YAPI.native_yFunctionUpdateCallback(f, b"21.5") for f in notifications],
+            number=1, repeat=3))
+        YAPI._DataEvents.clear()
+        timed = min(timeit.repeat(
+            lambda: [YAPI.native_yTimedReportCallback(f, 0.0, report, 9, 0.1) for f in notifications],
+            number=1, repeat=3))
+        YAPI._DataEvents.clear()
+        n = len(notifications)
+        print("%10d %18.0f %18.0f %18.0f" % (ncallbacks, n / legacy, n / indexed, n / timed))
+    del YFunction._FunctionCallbacks[:]
+    del YFunction._TimedReportCallbackList[:]
+    YFunction._InvalidateCallbackIndexes()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,57 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# Measures the time needed to extract the consolidated records of several
+# sensors (one hour of measures each, at slightly different rates), from
+# devices with a given round-trip time (20 ms by default), comparing the
+# record-by-record YConsolidatedDataSet.nextRecord() with the batch
+# nextRecords(), which loads the sensors in parallel and merges them
+# with a heap.
+# No Yoctopuce device is needed: downloads are simulated with a delay.
+#   python bench_consolidated.py [number of sensors] [round-trip time in ms]
+#
+import sys
+import os
+import time
+
+# add ../../Sources to the PYTHONPATH
+sys.path.append(os.path.join("..", "..", "Sources"))
+from yocto_api import *
+from fakedevice import FakeSensor
+
+
+def main():
+    nsensors = 16
+    latency = 0.02
+    if len(sys.argv) > 1:
+        nsensors = int(sys.argv[1])
+    if len(sys.argv) > 2:
+        latency = float(sys.argv[2]) / 1000.0
+    sensors = [FakeSensor(1, interval=1 + i % 3, latency=latency) for i in range(nsensors)]
+
+    start = time.time()
+    consolidated = YConsolidatedDataSet(0, 0, sensors)
+    records = []
+    record = []
+    while consolidated.nextRecord(record) < 100:
+        records.append(record[:])
+    single = time.time() - start
+
+    start = time.time()
+    consolidated = YConsolidatedDataSet(0, 0, sensors)
+    count = 0
+    columns = consolidated.nextRecords(10000)
+    check = []
+    while len(columns[0]) > 0:
+        count += len(columns[0])
+        check += [list(rec) for rec in zip(*columns)]
+        columns = consolidated.nextRecords(10000)
+    batch = time.time() - start
+    assert repr(check) == repr(records)
+    print("%-12s %10s %10s" % ("method", "time [s]", "records"))
+    print("%-12s %10.2f %10d" % ("nextRecord", single, len(records)))
+    print("%-12s %10.2f %10d" % ("nextRecords", batch, count))
+
+
+if __name__ == '__main__':
+    main()
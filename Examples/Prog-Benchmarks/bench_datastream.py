@@ -0,0 +1,110 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# Measures the time needed to decode a datalogger stream (one hour of
+# min/avg/max measures recorded every second), comparing the former
+# character-by-character and row-by-row decoding with the table-driven
+# YAPI._decodeWords() and the columnar YDataStream._parseStream().
+# No Yoctopuce device is needed: the stream payload is synthetic.
+#
+import sys
+import os
+import random
+import timeit
+
+# add ../../Sources to the PYTHONPATH
+sys.path.append(os.path.join("..", "..", "Sources"))
+from yocto_api import *
+from fakedevice import encodeWords
+
+
+def legacyDecodeWords(sdat):
+    p = 0
+    udat = []
+    while p < len(sdat):
+        c = sdat[p]
+        p += 1
+        if c == '*':
+            val = 0
+        elif c == 'X':
+            val = 0xffff
+        elif c == 'Y':
+            val = 0x7fff
+        elif c >= 'a':
+            srcpos = int(len(udat) - 1 - (ord(c) - ord('a')))
+            if srcpos < 0:
+                val = 0
+            else:
+                val = udat[srcpos]
+        else:
+            if p + 2 > len(sdat):
+                return udat
+            val = (ord(c) - ord('0'))
+            c = sdat[p]
+            p += 1
+            val += (ord(c) - ord('0')) << 5
+            c = sdat[p]
+            p += 1
+            if c == 'z':
+                c = "\\"
+            val += (ord(c) - ord('0')) << 10
+        udat.append(val)
+    return udat
+
+
+def legacyParseStream(stream, udat):
+    values = []
+    dat = []
+    idx = 0
+    while idx + 3 < len(udat):
+        del dat[:]
+        if (udat[idx] == 65535) and (udat[idx + 1] == 65535):
+            dat.append(float('nan'))
+            dat.append(float('nan'))
+            dat.append(float('nan'))
+        else:
+            dat.append(stream._decodeVal(udat[idx + 2] + (((udat[idx + 3]) << 16))))
+            dat.append(stream._decodeAvg(udat[idx] + ((((udat[idx + 1]) ^ 0x8000) << 16)), 1))
+            dat.append(stream._decodeVal(udat[idx + 4] + (((udat[idx + 5]) << 16))))
+        idx = idx + 6
+        values.append(dat[:])
+    return values
+
+
+class FakeParent(object):
+    def __init__(self, payload):
+        self._payload = payload
+
+    def _json_get_string(self, data):
+        return self._payload
+
+
+def main():
+    words = []
+    for i in range(3600):
+        avg = 0x80000000 + int(21500 + 500 * random.random())
+        words += [avg & 0xffff, avg >> 16, 21000, 0, 22500, 0]
+    payload = encodeWords(words)
+    stream = YDataStream(FakeParent(payload))
+    stream._isAvg = True
+    stream._isClosed = True
+    loops = 10
+    assert legacyDecodeWords(payload) == YAPI._decodeWords(payload)
+    legacy = min(timeit.repeat(lambda: legacyDecodeWords(payload), number=loops, repeat=3))
+    table = min(timeit.repeat(lambda: YAPI._decodeWords(payload), number=loops, repeat=3))
+    print("decodeWords : legacy %8.2f ms, table-driven %8.2f ms" % (legacy / loops * 1000, table / loops * 1000))
+
+    def parseColumns():
+        stream._isLoaded = False
+        stream._parseStream(payload)
+
+    parseColumns()
+    assert legacyParseStream(stream, legacyDecodeWords(payload)) == stream.get_dataRows()
+    legacy = min(timeit.repeat(lambda: legacyParseStream(stream, legacyDecodeWords(payload)),
+                               number=loops, repeat=3))
+    columns = min(timeit.repeat(parseColumns, number=loops, repeat=3))
+    print("parseStream : legacy %8.2f ms, columnar     %8.2f ms" % (legacy / loops * 1000, columns / loops * 1000))
+
+
+if __name__ == '__main__':
+    main()
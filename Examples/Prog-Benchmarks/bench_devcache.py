@@ -0,0 +1,48 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# Measures the cost of the device cache lookup done on every attribute read
+# (YDevice.getDevice), comparing the former linear scan with the
+# descriptor-indexed cache, for an increasing number of simulated devices.
+# No Yoctopuce device is needed: YDevice objects are created directly.
+#
+import sys
+import os
+import timeit
+
+# add ../../Sources to the PYTHONPATH
+sys.path.append(os.path.join("..", "..", "Sources"))
+from yocto_api import *
+
+
+def legacyGetDevice(devCache, devdescr):
+    for idx in range(len(devCache)):
+        if devCache[idx]._devdescr == devdescr:
+            return devCache[idx]
+    dev = YDevice(devdescr)
+    devCache.append(dev)
+    return dev
+
+
+def main():
+    print("%8s %14s %14s %14s" % ("devices", "legacy [us]", "indexed [us]", "unplug [us]"))
+    for ndevices in (10, 100, 800, 5000):
+        legacyCache = [YDevice(devdescr) for devdescr in range(ndevices)]
+        YAPI.YDevice_devCache.clear()
+        for devdescr in range(ndevices):
+            YDevice.getDevice(devdescr)
+        # look up every device in turn, as when reading one function on each module
+        lookups = list(range(ndevices)) * max(1, 20000 // ndevices)
+        legacy = min(timeit.repeat(lambda: [legacyGetDevice(legacyCache, d) for d in lookups],
+                                   number=1, repeat=3))
+        indexed = min(timeit.repeat(lambda: [YDevice.getDevice(d) for d in lookups], number=1, repeat=3))
+        unplug = min(timeit.repeat(lambda: [YDevice.UnplugDevice(d) for d in range(ndevices)],
+                                   setup=lambda: [YDevice.getDevice(d) for d in range(ndevices)],
+                                   number=1, repeat=3))
+        print("%8d %14.3f %14.3f %14.3f" % (ndevices, legacy / len(lookups) * 1e6,
+                                            indexed / len(lookups) * 1e6, unplug / ndevices * 1e6))
+    YAPI.YDevice_devCache.clear()
+
+
+if __name__ == '__main__':
+    main()
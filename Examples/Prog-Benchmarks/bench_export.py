@@ -0,0 +1,67 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# Measures the time needed to export the consolidated records of several
+# sensors (one day of measures recorded every second), from devices with a
+# given round-trip time (20 ms by default), comparing the line-by-line
+# formatting of the Prog-ExportCSV example with YDataExporter writing CSV,
+# and Arrow and Parquet files when pyarrow is installed.
+# No Yoctopuce device is needed: downloads are simulated with a delay.
+#   python bench_export.py [number of sensors] [round-trip time in ms]
+#
+import sys
+import os
+import time
+import tempfile
+
+# add ../../Sources to the PYTHONPATH
+sys.path.append(os.path.join("..", "..", "Sources"))
+from yocto_api import *
+from yocto_export import *
+from fakedevice import FakeSensor
+
+
+def exportLines(sensors, fileName):
+    # as done by the Prog-ExportCSV example
+    data = YConsolidatedDataSet(0, 0, sensors)
+    record = []
+    with open(fileName, "w") as f:
+        while data.nextRecord(record) < 100:
+            line = "%.3f" % record[0]
+            for idx in range(1, len(record)):
+                line += ";%.3f" % record[idx]
+            f.write(line + "\n")
+
+
+def main():
+    nsensors = 4
+    latency = 0.02
+    if len(sys.argv) > 1:
+        nsensors = int(sys.argv[1])
+    if len(sys.argv) > 2:
+        latency = float(sys.argv[2]) / 1000.0
+    sensors = [FakeSensor(24, latency=latency, hardwareId="METEOMK2-%05d.temperature" % i)
+               for i in range(nsensors)]
+    tmpdir = tempfile.mkdtemp()
+    print("%-20s %10s %12s" % ("method", "time [s]", "size [MB]"))
+    fileName = os.path.join(tmpdir, "lines.csv")
+    start = time.time()
+    exportLines(sensors, fileName)
+    print("%-20s %10.2f %12.1f" % ("nextRecord lines", time.time() - start, os.path.getsize(fileName) / 1e6))
+    for ext in ("csv", "arrow", "parquet"):
+        fileName = os.path.join(tmpdir, "export." + ext)
+        start = time.time()
+        try:
+            YDataExporter(fileName).exportConsolidatedDataSet(YConsolidatedDataSet(0, 0, sensors))
+        except YAPI_Exception as ex:
+            print("%-20s %s" % ("YDataExporter " + ext, ex.errorMessage))
+            continue
+        print("%-20s %10.2f %12.1f" % ("YDataExporter " + ext, time.time() - start,
+                                       os.path.getsize(fileName) / 1e6))
+    for fileName in os.listdir(tmpdir):
+        os.remove(os.path.join(tmpdir, fileName))
+    os.rmdir(tmpdir)
+
+
+if __name__ == '__main__':
+    main()
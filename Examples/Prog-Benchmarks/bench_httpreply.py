@@ -0,0 +1,40 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# Measures the cost of copying a native HTTP reply buffer into Python,
+# comparing the former byte-per-byte loop with YAPI._ptrToBytearray().
+# No Yoctopuce device is needed: replies are simulated with ctypes buffers.
+#
+import sys
+import os
+import timeit
+import ctypes
+
+# add ../../Sources to the PYTHONPATH
+sys.path.append(os.path.join("..", "..", "Sources"))
+from yocto_api import *
+
+
+def legacyCopy(reply_c, reply_size):
+    bb = bytearray()
+    for i in range(reply_size):
+        bb.append(reply_c[i])
+    return bb
+
+
+def main():
+    print("%8s %16s %16s %8s" % ("size", "legacy [us/KB]", "bulk [us/KB]", "speedup"))
+    for size in (1024, 4096, 16384, 65536):
+        raw = (ctypes.c_ubyte * size)(*[i & 0xff for i in range(size)])
+        reply_c = ctypes.cast(raw, ctypes.POINTER(ctypes.c_ubyte))
+        assert legacyCopy(reply_c, size) == YAPI._ptrToBytearray(reply_c, size)
+        loops = max(1, 262144 // size)
+        legacy = min(timeit.repeat(lambda: legacyCopy(reply_c, size), number=loops, repeat=3))
+        bulk = min(timeit.repeat(lambda: YAPI._ptrToBytearray(reply_c, size), number=loops * 100, repeat=3))
+        legacy_kb = legacy / loops / (size / 1024.0) * 1e6
+        bulk_kb = bulk / (loops * 100) / (size / 1024.0) * 1e6
+        print("%8d %16.2f %16.3f %7.0fx" % (size, legacy_kb, bulk_kb, legacy_kb / bulk_kb))
+
+
+if __name__ == '__main__':
+    main()
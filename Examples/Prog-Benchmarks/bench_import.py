@@ -0,0 +1,42 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# Measures the time needed to import the library in a fresh interpreter, as
+# seen by short-lived scripts: yocto_api alone, and yocto_api with one
+# function class. Each import is done in a new process and the median of
+# several runs is reported.
+# No Yoctopuce device is needed.
+#
+import sys
+import os
+import subprocess
+
+# ../../Sources, where the library is located
+SOURCES = os.path.abspath(os.path.join("..", "..", "Sources"))
+
+PROBE = """
+import sys, time
+sys.path.insert(0, %r)
+start = time.time()
+import %s
+print(time.time() - start)
+"""
+
+
+def importTime(modules, runs):
+    timings = []
+    for i in range(runs):
+        out = subprocess.check_output([sys.executable, "-c", PROBE % (SOURCES, modules)])
+        timings.append(float(out.decode().strip()))
+    timings.sort()
+    return timings[len(timings) // 2]
+
+
+def main():
+    runs = 15
+    for modules in ("yocto_api", "yocto_api, yocto_temperature", "yocto_api, yocto_datalogger"):
+        print("%-32s %8.2f ms" % (modules, importTime(modules, runs) * 1000))
+
+
+if __name__ == '__main__':
+    main()
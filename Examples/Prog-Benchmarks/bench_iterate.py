@@ -0,0 +1,62 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# Measures the peak memory used to read all measures of a dataset of one-hour
+# streams (one measure per second), when loading the whole dataset with
+# loadMore() and get_measures(), and when iterating over the dataset with
+# iterMeasures() and iterMeasuresArrays(), which release each stream once
+# consumed. The peak memory of the iterators does not depend on the number
+# of streams.
+# No Yoctopuce device is needed: the streams are synthetic.
+#   python bench_iterate.py [number of streams]
+#
+import sys
+import os
+import time
+import tracemalloc
+
+# add ../../Sources to the PYTHONPATH
+sys.path.append(os.path.join("..", "..", "Sources"))
+from yocto_api import *
+from fakedevice import FakeSensor
+
+
+def loadAll(dataset):
+    while dataset.loadMore() < 100:
+        pass
+    return len(dataset.get_measures())
+
+
+def iterate(dataset):
+    count = 0
+    for measure in dataset.iterMeasures():
+        count += 1
+    return count
+
+
+def iterateArrays(dataset):
+    count = 0
+    for chunk in dataset.iterMeasuresArrays():
+        count += len(chunk["averageValue"])
+    return count
+
+
+def main():
+    nstreams = 24
+    if len(sys.argv) > 1:
+        nstreams = int(sys.argv[1])
+    sensor = FakeSensor(nstreams)
+    print("%-20s %10s %12s %10s" % ("method", "time [s]", "peak [MB]", "measures"))
+    for name, method in (("loadMore", loadAll), ("iterMeasures", iterate), ("iterMeasuresArrays", iterateArrays)):
+        dataset = sensor.get_recordedData(0, 0)
+        tracemalloc.start()
+        start = time.time()
+        count = method(dataset)
+        elapsed = time.time() - start
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        print("%-20s %10.2f %12.1f %10d" % (name, elapsed, peak / 1e6, count))
+
+
+if __name__ == '__main__':
+    main()
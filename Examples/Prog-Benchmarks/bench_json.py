@@ -0,0 +1,88 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# Measures the time needed to parse a device api.json reply with each JSON
+# backend available (see YAPI.SelectJsonBackend()).
+# Without argument, a synthetic api.json of a hub with many functions is used.
+# Recorded replies can be given on the command line instead:
+#   python bench_json.py api1.json api2.json ...
+#
+import sys
+import os
+import json
+import timeit
+
+# add ../../Sources to the PYTHONPATH
+sys.path.append(os.path.join("..", "..", "Sources"))
+from yocto_api import *
+
+
+def syntheticApi(nfunctions):
+    api = {"module": {"productName": "YoctoHub-Ethernet", "serialNumber": "YHUBETH1-12345",
+                      "logicalName": "", "productId": 14, "productRelease": 1,
+                      "firmwareRelease": "58000", "persistentSettings": 1, "luminosity": 50,
+                      "beacon": 0, "upTime": 123456789, "usbCurrent": 120, "rebootCountdown": 0,
+                      "userVar": 0}}
+    for i in range(nfunctions):
+        api["genericSensor%d" % (i + 1)] = {
+            "logicalName": "sensor\"%d\"" % i, "advertisedValue": "%.3f" % (i * 1.25),
+            "unit": "mA", "currentValue": i * 65536, "lowestValue": -12.5, "highestValue": 1234.75,
+            "currentRawValue": i * 1024, "logFrequency": "1/s", "reportFrequency": "OFF",
+            "advMode": 0, "calibrationParam": "0,", "resolution": 0.001, "sensorState": 0,
+            "signalValue": 4.021, "signalUnit": "mA", "signalRange": "4...20",
+            "valueRange": "0...1000", "signalBias": 0.0, "signalSampling": 1, "enabled": 1}
+    api["services"] = {"whitePages": [{"serialNumber": "SER%05d" % i, "logicalName": "",
+                                       "productName": "Yocto-4-20mA-Rx", "productId": 73,
+                                       "networkUrl": "/bySerial/SER%05d/api" % i, "beacon": 0,
+                                       "index": i} for i in range(8)],
+                       "yellowPages": {}}
+    return json.dumps(api)
+
+
+def dumpTree(node):
+    typ = node.getJSONType()
+    if typ == YJSONType.OBJECT:
+        return [(key, dumpTree(node.get(key))) for key in node._keys]
+    if typ == YJSONType.ARRAY:
+        return [dumpTree(item) for item in node._arrayValue]
+    return node.toString()
+
+
+def parseApi(payload):
+    p = YJSONObject(payload, 0, len(payload))
+    p.parse()
+    return p
+
+
+def main():
+    payloads = []
+    if len(sys.argv) > 1:
+        for fname in sys.argv[1:]:
+            with open(fname, "rb") as f:
+                payloads.append((os.path.basename(fname), f.read().decode(YAPI.DefaultEncoding)))
+    else:
+        for nfunctions in (4, 40, 400):
+            payloads.append(("%d functions" % nfunctions, syntheticApi(nfunctions)))
+    backends = ["legacy", "json"]
+    try:
+        import orjson
+        backends.append("orjson")
+    except ImportError:
+        pass
+    print("%-16s %8s" % ("payload", "size") + "".join(["%14s" % (b + " [ms]") for b in backends]))
+    for name, payload in payloads:
+        YAPI.SelectJsonBackend("legacy")
+        reference = dumpTree(parseApi(payload))
+        loops = max(1, 200000 // len(payload))
+        line = "%-16s %8d" % (name, len(payload))
+        for backend in backends:
+            YAPI.SelectJsonBackend(backend)
+            assert dumpTree(parseApi(payload)) == reference, backend
+            elapsed = min(timeit.repeat(lambda: parseApi(payload), number=loops, repeat=3))
+            line += "%14.3f" % (elapsed / loops * 1000)
+        print(line)
+    YAPI.SelectJsonBackend("auto")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# Measures the memory used by the YMeasure objects of a large dataset (one
+# day of data recorded every second), comparing the former dict-based
+# measures holding two datetime objects with the current slotted YMeasure.
+# Python 3.4 or later is needed (tracemalloc). No Yoctopuce device is needed.
+#
+import sys
+import os
+import datetime
+import time
+import tracemalloc
+
+# add ../../Sources to the PYTHONPATH
+sys.path.append(os.path.join("..", "..", "Sources"))
+from yocto_api import *
+
+
+class LegacyMeasure(object):
+    def __init__(self, start, end, minVal, avgVal, maxVal):
+        self._start = start
+        self._end = end
+        self._minVal = minVal
+        self._avgVal = avgVal
+        self._maxVal = maxVal
+        rounded = int(start * 100 + 0.5)
+        self._start_datetime = datetime.datetime.fromtimestamp(rounded / 100.0)
+        rounded = int(end * 100 + 0.5)
+        self._end_datetime = datetime.datetime.fromtimestamp(rounded / 100.0)
+
+
+def buildDataset(cls, count):
+    # same construction pattern as YDataSet.loadMore()
+    t0 = 1700000000
+    measures = []
+    for i in range(count):
+        avg = 20.0 + (i % 1000) / 100.0
+        measures.append(cls(t0 + i, t0 + i + 1, avg - 0.5, avg, avg + 0.5))
+    return measures
+
+
+def measure(cls, count):
+    tracemalloc.start()
+    start = time.time()
+    measures = buildDataset(cls, count)
+    elapsed = time.time() - start
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del measures
+    return size, elapsed
+
+
+def main():
+    count = 86400
+    print("%-12s %12s %14s %10s" % ("measures", "total [MB]", "per measure [B]", "build [s]"))
+    for name, cls in (("legacy", LegacyMeasure), ("YMeasure", YMeasure)):
+        size, elapsed = measure(cls, count)
+        print("%-12s %12.1f %14.1f %10.2f" % (name, size / 1048576.0, size / float(count), elapsed))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,37 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# Measures the time needed to load a dataset of 60 one-hour streams from a
+# device with a given round-trip time (50 ms by default), with loadMore()
+# downloading one stream at a time or prefetching several streams in parallel
+# (see YDataSet.set_prefetchDepth()).
+# No Yoctopuce device is needed: downloads are simulated with a delay.
+#   python bench_prefetch.py [round-trip time in ms]
+#
+import sys
+import os
+import time
+
+# add ../../Sources to the PYTHONPATH
+sys.path.append(os.path.join("..", "..", "Sources"))
+from yocto_api import *
+from fakedevice import FakeSensor
+
+
+def main():
+    latency = 0.05
+    if len(sys.argv) > 1:
+        latency = float(sys.argv[1]) / 1000.0
+    sensor = FakeSensor(60, latency=latency)
+    print("%8s %10s %10s" % ("depth", "time [s]", "measures"))
+    for depth in (0, 2, 4, 8):
+        dataset = sensor.get_recordedData(0, 0)
+        dataset.set_prefetchDepth(depth)
+        start = time.time()
+        while dataset.loadMore() < 100:
+            pass
+        print("%8d %10.2f %10d" % (depth, time.time() - start, len(dataset.get_measures())))
+
+
+if __name__ == '__main__':
+    main()
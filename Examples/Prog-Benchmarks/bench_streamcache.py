@@ -0,0 +1,45 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# Measures the time needed to load the same dataset of 60 closed one-hour
+# streams twice, from a device with a given round-trip time (50 ms by
+# default), without and with the local datalogger stream cache (see
+# YAPI.SetDataStreamCache()). The second run with the cache does not
+# download anything.
+# No Yoctopuce device is needed: downloads are simulated with a delay.
+#   python bench_streamcache.py [round-trip time in ms]
+#
+import sys
+import os
+import time
+import tempfile
+
+# add ../../Sources to the PYTHONPATH
+sys.path.append(os.path.join("..", "..", "Sources"))
+from yocto_api import *
+from fakedevice import FakeSensor
+
+
+def main():
+    latency = 0.05
+    if len(sys.argv) > 1:
+        latency = float(sys.argv[1]) / 1000.0
+    dbfile = os.path.join(tempfile.mkdtemp(), "streams.db")
+    print("%-16s %10s %10s %10s" % ("cache", "run", "time [s]", "downloads"))
+    for cache in (None, ":memory:", dbfile):
+        YAPI.SetDataStreamCache(cache)
+        for run in (1, 2):
+            sensor = FakeSensor(60, latency=latency)
+            start = time.time()
+            dataset = sensor.get_recordedData(0, 0)
+            while dataset.loadMore() < 100:
+                pass
+            elapsed = time.time() - start
+            assert len(dataset.get_measures()) == 60 * 3600
+            print("%-16s %10d %10.2f %10d" % (os.path.basename(str(cache)), run, elapsed, sensor.downloads))
+    YAPI.SetDataStreamCache(None)
+    os.remove(dbfile)
+
+
+if __name__ == '__main__':
+    main()
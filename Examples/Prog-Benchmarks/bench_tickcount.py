@@ -0,0 +1,35 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# Measures the cost of the cache expiration check done by every get_xxx()
+# method, comparing the former datetime-based tick count with the integer
+# millisecond counter returned by YAPI.GetTickCount().
+# No Yoctopuce device is needed.
+#
+import sys
+import os
+import datetime
+import timeit
+
+# add ../../Sources to the PYTHONPATH
+sys.path.append(os.path.join("..", "..", "Sources"))
+from yocto_api import *
+
+
+def main():
+    loops = 1000000
+    expiration = datetime.datetime.today() + datetime.timedelta(milliseconds=5)
+    legacy = min(timeit.repeat(lambda: expiration <= datetime.datetime.today(), number=loops, repeat=3))
+    expiration_ms = YAPI.GetTickCount() + 5
+    ticks = min(timeit.repeat(lambda: expiration_ms <= YAPI.GetTickCount(), number=loops, repeat=3))
+    print("datetime check   : %.3f us" % (legacy / loops * 1e6))
+    print("tick count check : %.3f us" % (ticks / loops * 1e6))
+    legacy = min(timeit.repeat(lambda: datetime.datetime.today() + datetime.timedelta(milliseconds=5),
+                               number=loops, repeat=3))
+    ticks = min(timeit.repeat(lambda: YAPI.GetTickCount() + YAPI.DefaultCacheValidity, number=loops, repeat=3))
+    print("datetime expiry  : %.3f us" % (legacy / loops * 1e6))
+    print("tick count expiry: %.3f us" % (ticks / loops * 1e6))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+#
+# Helpers shared by the datalogger benchmarks, to run them without any
+# Yoctopuce device.
+#
+import sys
+import os
+import time
+
+# add ../../Sources to the PYTHONPATH
+sys.path.append(os.path.join("..", "..", "Sources"))
+from yocto_api import *
+
+
+def encodeWords(words):
+    # encodes 16 bit words as in the logger.json streams of the devices
+    res = []
+    for w in words:
+        c3 = chr(48 + (w >> 10))
+        if c3 == "\\":
+            c3 = "z"
+        res.append(chr(48 + (w & 31)) + chr(48 + ((w >> 5) & 31)) + c3)
+    return "".join(res)
+
+
+def streamPayload(nrows):
+    # rows of min/avg/max measures, the average increasing by 0.001 on each row
+    words = []
+    for i in range(nrows):
+        words += [(21500 + i) & 0xffff, 0x8000, 21000, 0, 22500, 0]
+    return encodeWords(words)
+
+
+class FakeSensor(object):
+    # answers the logger.json requests of the streams of a sensor after the round-trip
+    # time (in seconds), each stream holding one hour of measures
+    def __init__(self, nstreams=1, interval=1, latency=0.0, hardwareId="METEOMK2-12345.temperature"):
+        self._nstreams = nstreams
+        self._interval = interval
+        self._latency = latency
+        self._hardwareId = hardwareId
+        self._payload = bytearray('"' + streamPayload(3600 // interval) + '"', YAPI.DefaultEncoding)
+        self.downloads = 0
+
+    def get_hardwareId(self):
+        return self._hardwareId
+
+    def _download(self, url):
+        self.downloads += 1
+        if self._latency > 0:
+            time.sleep(self._latency)
+        return self._payload
+
+    def _json_get_string(self, data):
+        return data.decode(YAPI.DefaultEncoding)[1:-1]
+
+    def get_recordedData(self, startTime, endTime):
+        # the streams are created for each dataset, as done by the devices
+        functionId = self._hardwareId.split(".")[1]
+        dataset = YDataSet(self, functionId, "'C", startTime, endTime)
+        for i in range(self._nstreams):
+            stream = YDataStream(self)
+            stream._functionId = functionId
+            stream._runNo = 1
+            stream._utcStamp = 1700000000 + 3600 * i
+            stream._startTime = stream._utcStamp
+            stream._dataSamplesInterval = self._interval
+            stream._nRows = 3600 // self._interval
+            stream._isAvg = True
+            stream._isClosed = True
+            dataset._streams.append(stream)
+        dataset._progress = 0
+        return dataset
@@ -44,14 +44,17 @@ __docformat__ = 'restructuredtext en'
 import datetime
 import ctypes
 import math
-import platform
 # import abc  (not supported in 2.5.x)
-import random
 import sys
 import os
 import time
+import json
 import array
 import binascii
+import bisect
+import collections
+import heapq
+import itertools
 from ctypes import *
 
 
@@ -60,11 +63,15 @@ from ctypes import *
 #
 
 def YRelTickCountPython2x(dt):
+    if not isinstance(dt, datetime.datetime):
+        return int(dt)
     td = dt - datetime.datetime(1970, 1, 1)
     return int(round((td.seconds + td.days * 24 * 3600 * 1000) + td.microseconds / 1000))
 
 
 def YRelTickCountPython3x(dt):
+    if not isinstance(dt, datetime.datetime):
+        return int(dt)
     td = dt - datetime.datetime(1970, 1, 1)
     return int(round(td.total_seconds() * 1000.0))
 
@@ -73,6 +80,20 @@ if sys.version_info < (3, 0):
 else:
     YRelTickCount = YRelTickCountPython3x
 
+# monotonic clock (in seconds) used by YAPI.GetTickCount(), not affected by
+# system time adjustments when available (python 3.3+)
+if hasattr(time, "monotonic"):
+    _yMonotonic = time.monotonic
+else:
+    _yMonotonic = time.time
+
+
+def _yDurationMs(duration):
+    # durations are integers in milliseconds, datetime.timedelta is still accepted
+    if isinstance(duration, datetime.timedelta):
+        return (duration.days * 86400 + duration.seconds) * 1000 + duration.microseconds // 1000
+    return duration
+
 # Ugly global var for Python 2 compatibility
 yLogFct = None
 yDeviceLogFct = None
@@ -110,6 +131,108 @@ class Tjstate:
 
 
 class YJSONContent(object):
+    __slots__ = ("_data", "_data_start", "_data_len", "_data_boundary", "_type")
+    # JSON decoding backend, resolved on first parse (see YAPI.SelectJsonBackend)
+    _jsonBackend = None
+    _jsonDecoder = None
+    _jsonLoads = None
+
+    @staticmethod
+    def _selectBackend(backend):
+        decoder = None
+        loads = None
+        if backend is None or backend == "" or backend == "auto":
+            if sys.version_info[0] < 3:
+                # python 2.x stdlib decoder returns unicode strings, keep byte strings as before
+                backend = "legacy"
+            else:
+                try:
+                    import orjson
+                    backend = "orjson"
+                except ImportError:
+                    backend = "json"
+        if backend == "orjson":
+            import orjson
+            loads = orjson.loads
+        elif backend != "json" and backend != "legacy":
+            raise YAPI.YAPI_Exception(YAPI.INVALID_ARGUMENT, "Unknown JSON backend: " + str(backend))
+        if backend != "legacy":
+            if sys.version_info < (3, 7):
+                decoder = json.JSONDecoder(object_pairs_hook=collections.OrderedDict)
+            else:
+                decoder = json.JSONDecoder()
+        YJSONContent._jsonDecoder = decoder
+        YJSONContent._jsonLoads = loads
+        YJSONContent._jsonBackend = backend
+        return backend
+
+    @staticmethod
+    def _fromValue(value):
+        # build a YJSON node from a value decoded by the JSON backend
+        if isinstance(value, dict):
+            res = YJSONObject(None, 0, 0)
+            res._loadValue(value)
+        elif isinstance(value, list):
+            res = YJSONArray(None, 0, 0)
+            res._loadValue(value)
+        elif isinstance(value, float):
+            res = YJSONNumber(None, 0, 0)
+            res._doubleValue = value
+            res._isFloat = True
+        elif isinstance(value, bool):
+            res = YJSONNumber(None, 0, 0)
+            res._intValue = int(value)
+        elif isinstance(value, int):
+            res = YJSONNumber(None, 0, 0)
+            res._intValue = value
+        else:
+            res = YJSONString(None, 0, 0)
+            if value is None:
+                value = ""
+            res._stringValue = value
+        return res
+
+    def _parseFast(self):
+        # Decode the whole value at once with the selected backend. Returns False
+        # when the legacy parser must be used instead (legacy backend, unexpected
+        # type or malformed data, so that the legacy parser reports the error).
+        if YJSONContent._jsonBackend is None:
+            YJSONContent._selectBackend("auto")
+        decoder = YJSONContent._jsonDecoder
+        data = self._data
+        if decoder is None or data is None:
+            return False
+        if self._data_boundary < len(data):
+            data = data[:self._data_boundary]
+        start = YJSONContent.SkipGarbage(data, self._data_start, len(data))
+        end = -1
+        value = None
+        if YJSONContent._jsonLoads is not None:
+            try:
+                if start > 0:
+                    value = YJSONContent._jsonLoads(data[start:])
+                else:
+                    value = YJSONContent._jsonLoads(data)
+                end = len(data)
+            except ValueError:
+                # trailing garbage, let the stdlib decoder find the end of value
+                pass
+        if end < 0:
+            try:
+                value, end = decoder.raw_decode(data, start)
+            except ValueError:
+                return False
+        if not self._loadValue(value):
+            return False
+        self._data_len = end - self._data_start
+        return True
+
+    def _loadValue(self, value):
+        return False
+
+    def _sameAs(self, other):
+        return False
+
     @staticmethod
     def ParseJson(data, start, stop):
         cur_pos = YJSONContent.SkipGarbage(data, start, stop)
@@ -162,11 +285,21 @@ class YJSONContent(object):
 
 
 class YJSONString(YJSONContent):
+    __slots__ = ("_stringValue",)
+
     def __init__(self, data, start, stop):
         super(YJSONString, self).__init__(data, start, stop, YJSONType.STRING)
         self._stringValue = None
 
+    def _loadValue(self, value):
+        if not isinstance(value, str):
+            return False
+        self._stringValue = value
+        return True
+
     def parse(self):
+        if self._parseFast():
+            return self._data_len
         value = ""
         cur_pos = YJSONContent.SkipGarbage(self._data, self._data_start, self._data_boundary)
 
@@ -202,7 +335,13 @@ class YJSONString(YJSONContent):
 
         raise YAPI.YAPI_Exception(YAPI.INVALID_ARGUMENT, self.formatError("unexpected end of data", cur_pos))
 
+    _escapeTable = {ord('"'): u'\\"', ord('\\'): u'\\\\', ord('/'): u'\\/', ord('\b'): u'\\b',
+                    ord('\f'): u'\\f', ord('\n'): u'\\n', ord('\r'): u'\\r', ord('\t'): u'\\t'}
+
     def toJSON(self):
+        if sys.version_info[0] >= 3:
+            res = '"' + self._stringValue.translate(YJSONString._escapeTable) + '"'
+            return bytearray(res, YAPI.DefaultEncoding)
         res = '"'
         le = len(self._stringValue)
         for i in range(0, le):
@@ -234,18 +373,35 @@ class YJSONString(YJSONContent):
     def toString(self):
         return self._stringValue
 
+    def _sameAs(self, other):
+        return other._type == YJSONType.STRING and other._stringValue == self._stringValue
+
     def setContent(self, value):
         self._stringValue = value
 
 
 class YJSONNumber(YJSONContent):
+    __slots__ = ("_intValue", "_doubleValue", "_isFloat")
+
     def __init__(self, data, start, stop):
         super(YJSONNumber, self).__init__(data, start, stop, YJSONType.NUMBER)
         self._intValue = 0
         self._doubleValue = 0
         self._isFloat = False
 
+    def _loadValue(self, value):
+        if isinstance(value, float):
+            self._doubleValue = value
+            self._isFloat = True
+        elif isinstance(value, int):
+            self._intValue = int(value)
+        else:
+            return False
+        return True
+
     def parse(self):
+        if self._parseFast():
+            return self._data_len
         neg = False
         cur_pos = YJSONContent.SkipGarbage(self._data, self._data_start, self._data_boundary)
         if cur_pos >= self._data_boundary or self._data is None:
@@ -313,8 +469,17 @@ class YJSONNumber(YJSONContent):
         else:
             return str(self._intValue)
 
+    def _sameAs(self, other):
+        if other._type != YJSONType.NUMBER or other._isFloat != self._isFloat:
+            return False
+        if self._isFloat:
+            return other._doubleValue == self._doubleValue
+        return other._intValue == self._intValue
+
 
 class YJSONArray(YJSONContent):
+    __slots__ = ("_arrayValue",)
+
     def __init__(self, data, start, stop):
         super(YJSONArray, self).__init__(data, start, stop, YJSONType.ARRAY)
         self._arrayValue = []
@@ -322,7 +487,16 @@ class YJSONArray(YJSONContent):
     def length(self):
         return len(self._arrayValue)
 
+    def _loadValue(self, value):
+        if not isinstance(value, list):
+            return False
+        fromValue = YJSONContent._fromValue
+        self._arrayValue = [fromValue(item) for item in value]
+        return True
+
     def parse(self):
+        if self._parseFast():
+            return self._data_len
         cur_pos = YJSONContent.SkipGarbage(self._data, self._data_start, self._data_boundary)
         if cur_pos >= self._data_boundary or self._data[cur_pos] != '[':
             raise YAPI.YAPI_Exception(YAPI.INVALID_ARGUMENT, self.formatError("Opening braces was expected", cur_pos))
@@ -426,6 +600,14 @@ class YJSONArray(YJSONContent):
         ystr = self._arrayValue[i]
         return ystr.getDouble()
 
+    def _sameAs(self, other):
+        if other._type != YJSONType.ARRAY or len(other._arrayValue) != len(self._arrayValue):
+            return False
+        for i in range(len(self._arrayValue)):
+            if not self._arrayValue[i]._sameAs(other._arrayValue[i]):
+                return False
+        return True
+
     def put(self, flatAttr):
         strobj = YJSONString(None, 0, 0)
         strobj.setContent(flatAttr)
@@ -457,12 +639,27 @@ class YJSONArray(YJSONContent):
 
 
 class YJSONObject(YJSONContent):
+    __slots__ = ("_parsed", "_keys")
+
     def __init__(self, data, start, stop):
         super(YJSONObject, self).__init__(data, start, stop, YJSONType.OBJECT)
         self._parsed = {}
         self._keys = []
 
+    def _loadValue(self, value):
+        if not isinstance(value, dict):
+            return False
+        fromValue = YJSONContent._fromValue
+        parsed = self._parsed
+        keys = self._keys
+        for key, item in value.items():
+            parsed[key] = fromValue(item)
+            keys.append(key)
+        return True
+
     def parse(self):
+        if self._parseFast():
+            return self._data_len
         current_name = ""
         name_start = self._data_start
         cur_pos = YJSONContent.SkipGarbage(self._data, self._data_start, self._data_boundary)
@@ -679,6 +876,55 @@ class YJSONObject(YJSONContent):
     def getKeyFromIdx(self, i):
         return self._keys[i]
 
+    def _sameAs(self, other):
+        if other._type != YJSONType.OBJECT or other._keys != self._keys:
+            return False
+        otherParsed = other._parsed
+        for key in self._keys:
+            if not self._parsed[key]._sameAs(otherParsed[key]):
+                return False
+        return True
+
+    def _mergeUnchanged(self, previous):
+        # Replace the members equal to those of a previous version of this object by
+        # the previous objects, so that unchanged members can be detected by identity.
+        # Returns the list of members that have changed.
+        changed = []
+        parsed = self._parsed
+        prevParsed = previous._parsed
+        for key in self._keys:
+            prev = prevParsed.get(key)
+            if prev is not None and parsed[key]._sameAs(prev):
+                parsed[key] = prev
+            else:
+                changed.append(key)
+        return changed
+
+    def _changedKeys(self, previous):
+        # members that are not the same objects as in a previous version (see _mergeUnchanged)
+        prevParsed = previous._parsed
+        parsed = self._parsed
+        return [key for key in self._keys if prevParsed.get(key) is not parsed[key]]
+
+    def _diffFunctions(self, previous):
+        # Compares a new api.json with the previous one, keeping the previous objects of
+        # unchanged functions. Returns the changed keys, indexed by function.
+        changes = {}
+        parsed = self._parsed
+        prevParsed = previous._parsed
+        for funcid in self._keys:
+            node = parsed[funcid]
+            prev = prevParsed.get(funcid)
+            if prev is None or node._type != YJSONType.OBJECT or prev._type != YJSONType.OBJECT:
+                changes[funcid] = list(getattr(node, "_keys", []))
+                continue
+            changed = node._mergeUnchanged(prev)
+            if len(changed) == 0 and node._keys == prev._keys:
+                parsed[funcid] = prev
+            else:
+                changes[funcid] = changed
+        return changes
+
 
 # --- (generated code: YAPIContext class start)
 #noinspection PyProtectedMember
@@ -957,6 +1203,25 @@ class YAPIContext(object):
 #--- (end of generated code: YAPIContext functions)
 
 
+class _YLazyBinding(object):
+    # Declares a function of the yapi shared library. The ctypes prototype is
+    # only set up when the function is first used, and the bound function then
+    # replaces this object in the YAPI class, so that later calls are direct.
+    def __init__(self, name, restype, argtypes):
+        self._name = name
+        self._restype = restype
+        self._argtypes = argtypes
+
+    def __get__(self, instance, owner):
+        if not YAPI._ydllLoaded:
+            YAPI.yloadYapiCDLL()
+        cfunc = getattr(YAPI._yApiCLib, self._name)
+        cfunc.restype = self._restype
+        cfunc.argtypes = self._argtypes
+        setattr(YAPI, "_" + self._name, cfunc)
+        return cfunc
+
+
 # noinspection PyClassHasNoInit,PyProtectedMember
 # noinspection PyUnresolvedReferences
 class YAPI:
@@ -973,7 +1238,7 @@ class YAPI:
     # Default cache validity (in [ms]) before reloading data from device. This saves a lots of traffic.
     # Note that a value under 2 ms makes little sense since a USB bus itself has a 2ms round-trip period
     DefaultEncoding = "latin-1"
-    DefaultCacheValidity = datetime.timedelta(milliseconds=5)
+    DefaultCacheValidity = 5
     INVALID_STRING = "!INVALID!"
     INVALID_DOUBLE = -1.79769313486231E+308
     MIN_DOUBLE = float('-inf')
@@ -1029,9 +1294,37 @@ class YAPI:
 
     C_INTSIZE = 4  # we assume an int size is 4 byte
 
-    _PlugEvents = []
-    _DataEvents = []
+    _PlugEvents = collections.deque()
+    _DataEvents = collections.deque()
     _CalibHandlers = {}
+    _BatchCalibHandlers = {}
+
+    # Policies applied when the data event queue is full (see SetEventQueueLimit)
+    EVENTQUEUE_DROP_OLDEST = 0
+    EVENTQUEUE_COALESCE_LATEST = 1
+    _DataEventsMaxDepth = 0
+    _DataEventsPolicy = EVENTQUEUE_DROP_OLDEST
+    # pending value event of each function, only maintained by COALESCE_LATEST policy
+    _PendingValueEvents = {}
+    _EventQueueStats = {"dataQueueHighWater": 0, "plugQueueHighWater": 0,
+                        "droppedEvents": 0, "coalescedEvents": 0}
+    # background event pump thread, see StartEventPump
+    _eventPump = None
+    _lastEventPump = None
+
+    # cache policies: class name -> {attribute name or "*": (validity in ms, stale-while-revalidate)}
+    _cachePolicies = {}
+    # policies resolved for each python class, including those of its parent classes
+    _resolvedCachePolicies = {}
+    # background refresh of the functions served stale (stale-while-revalidate)
+    _refreshQueue = collections.deque()
+    _refreshPending = set()
+    _refreshCondition = None
+    _refreshThread = None
+    # expiration given to the cache while a get_xxx() method reads it, see _policyGetter
+    _PINNED_CACHE = float("inf")
+    # local store of closed datalogger streams, see SetDataStreamCache
+    _streamCache = None
 
     #  private extern static void DllCallTest(ref yDeviceSt data);
     # _DllCallTest = yApiCLib.DllCallTest
@@ -1041,8 +1334,27 @@ class YAPI:
     _yApiCLibFile = ""
     _yApiCLibFileFallback = ""
     _yApiCLib = None
+    _platformInfo = None
     _yapiContext = YAPIContext()
 
+    @staticmethod
+    def SelectJsonBackend(backend):
+        """
+        Select the decoder used to parse the JSON data sent by the devices.
+        By default, the fastest available decoder is used: orjson when the
+        module is installed, and the standard json module otherwise. The
+        legacy character-based parser remains available for compatibility,
+        and is always used with Python 2.x.
+
+        @param backend : A string containing the decoder to use.
+                Possibles value are: "auto", "orjson", "json", "legacy"
+
+        @return a string containing the name of the selected decoder.
+
+        On failure, throws an exception.
+        """
+        return YJSONContent._selectBackend(backend)
+
     @staticmethod
     def SelectArchitecture(arch):
         """
@@ -1065,7 +1377,7 @@ class YAPI:
         """
 
         libpath = os.path.dirname(__file__)
-        system = platform.system()
+        system = YAPI._getPlatform()[0]
         if libpath == '':
             libpath = '.'
         if system == 'Windows':
@@ -1108,13 +1420,22 @@ class YAPI:
         else:
             raise NotImplementedError("unsupported platform " + system + ", contact support@yoctopuce.com.")
 
+    @staticmethod
+    def _getPlatform():
+        # (system, machine, pointer size) of the running interpreter, detected once.
+        # platform.architecture() is not used, as it spawns the "file" command.
+        if YAPI._platformInfo is None:
+            import platform
+            import struct
+            arch = "%dbit" % (struct.calcsize("P") * 8)
+            YAPI._platformInfo = (platform.system(), platform.machine(), arch)
+        return YAPI._platformInfo
+
     @staticmethod
     def yloadYapiCDLL():
         if YAPI._yApiCLibFile == "":
             libpath = os.path.dirname(__file__)
-            system = platform.system()
-            arch = platform.architecture()[0]
-            machine = platform.machine()
+            system, machine, arch = YAPI._getPlatform()
             if libpath == '':
                 libpath = '.'
             #
@@ -1139,7 +1460,7 @@ class YAPI:
             #
             #  LINUX (INTEL + ARM)
             #
-            elif platform.system() == 'Linux':
+            elif system == 'Linux':
                 if machine.find("aarch64") >= 0 or machine.find("arm") >= 0:
                     if arch == '64bit':
                         YAPI._yApiCLibFile = libpath + "/cdll/libyapi-aarch64.so"
@@ -1166,7 +1487,7 @@ class YAPI:
             #
             #  Mac OS X
             #
-            elif platform.system() == 'Darwin':
+            elif system == 'Darwin':
                 if sys.maxsize > 2 ** 32:
                     YAPI._yApiCLibFile = libpath + "/cdll/libyapi.dylib"
                     YAPI._yApiCLibFile = os.path.abspath(YAPI._yApiCLibFile)
@@ -1209,218 +1530,84 @@ class YAPI:
                 "Unable to import YAPI shared library (" + YAPI._yApiCLibFile +
                 "), make sure it is available and accessible.")
 
+        # The native functions are declared below as _YLazyBinding class attributes,
+        # and bound on first use. Functions bound here would simply replace them.
         ##--- (generated code: YFunction dlldef)
-        YAPI._yapiInitAPI = YAPI._yApiCLib.yapiInitAPI
-        YAPI._yapiInitAPI.restypes = ctypes.c_int
-        YAPI._yapiInitAPI.argtypes = [ctypes.c_int, ctypes.c_char_p]
-        YAPI._yapiFreeAPI = YAPI._yApiCLib.yapiFreeAPI
-        YAPI._yapiFreeAPI.restypes = None
-        YAPI._yapiFreeAPI.argtypes = []
-        YAPI._yapiSetTraceFile = YAPI._yApiCLib.yapiSetTraceFile
-        YAPI._yapiSetTraceFile.restypes = None
-        YAPI._yapiSetTraceFile.argtypes = [ctypes.c_char_p]
-        YAPI._yapiRegisterLogFunction = YAPI._yApiCLib.yapiRegisterLogFunction
-        YAPI._yapiRegisterLogFunction.restypes = None
-        YAPI._yapiRegisterLogFunction.argtypes = [ctypes.c_void_p]
-        YAPI._yapiRegisterDeviceArrivalCallback = YAPI._yApiCLib.yapiRegisterDeviceArrivalCallback
-        YAPI._yapiRegisterDeviceArrivalCallback.restypes = None
-        YAPI._yapiRegisterDeviceArrivalCallback.argtypes = [ctypes.c_void_p]
-        YAPI._yapiRegisterDeviceRemovalCallback = YAPI._yApiCLib.yapiRegisterDeviceRemovalCallback
-        YAPI._yapiRegisterDeviceRemovalCallback.restypes = None
-        YAPI._yapiRegisterDeviceRemovalCallback.argtypes = [ctypes.c_void_p]
-        YAPI._yapiRegisterDeviceChangeCallback = YAPI._yApiCLib.yapiRegisterDeviceChangeCallback
-        YAPI._yapiRegisterDeviceChangeCallback.restypes = None
-        YAPI._yapiRegisterDeviceChangeCallback.argtypes = [ctypes.c_void_p]
-        YAPI._yapiRegisterDeviceConfigChangeCallback = YAPI._yApiCLib.yapiRegisterDeviceConfigChangeCallback
-        YAPI._yapiRegisterDeviceConfigChangeCallback.restypes = None
-        YAPI._yapiRegisterDeviceConfigChangeCallback.argtypes = [ctypes.c_void_p]
-        YAPI._yapiRegisterFunctionUpdateCallback = YAPI._yApiCLib.yapiRegisterFunctionUpdateCallback
-        YAPI._yapiRegisterFunctionUpdateCallback.restypes = None
-        YAPI._yapiRegisterFunctionUpdateCallback.argtypes = [ctypes.c_void_p]
-        YAPI._yapiRegisterTimedReportCallback = YAPI._yApiCLib.yapiRegisterTimedReportCallback
-        YAPI._yapiRegisterTimedReportCallback.restypes = None
-        YAPI._yapiRegisterTimedReportCallback.argtypes = [ctypes.c_void_p]
-        YAPI._yapiLockDeviceCallBack = YAPI._yApiCLib.yapiLockDeviceCallBack
-        YAPI._yapiLockDeviceCallBack.restypes = ctypes.c_int
-        YAPI._yapiLockDeviceCallBack.argtypes = [ctypes.c_char_p]
-        YAPI._yapiUnlockDeviceCallBack = YAPI._yApiCLib.yapiUnlockDeviceCallBack
-        YAPI._yapiUnlockDeviceCallBack.restypes = ctypes.c_int
-        YAPI._yapiUnlockDeviceCallBack.argtypes = [ctypes.c_char_p]
-        YAPI._yapiLockFunctionCallBack = YAPI._yApiCLib.yapiLockFunctionCallBack
-        YAPI._yapiLockFunctionCallBack.restypes = ctypes.c_int
-        YAPI._yapiLockFunctionCallBack.argtypes = [ctypes.c_char_p]
-        YAPI._yapiUnlockFunctionCallBack = YAPI._yApiCLib.yapiUnlockFunctionCallBack
-        YAPI._yapiUnlockFunctionCallBack.restypes = ctypes.c_int
-        YAPI._yapiUnlockFunctionCallBack.argtypes = [ctypes.c_char_p]
-        YAPI._yapiRegisterHub = YAPI._yApiCLib.yapiRegisterHub
-        YAPI._yapiRegisterHub.restypes = ctypes.c_int
-        YAPI._yapiRegisterHub.argtypes = [ctypes.c_char_p, ctypes.c_char_p]
-        YAPI._yapiPreregisterHub = YAPI._yApiCLib.yapiPreregisterHub
-        YAPI._yapiPreregisterHub.restypes = ctypes.c_int
-        YAPI._yapiPreregisterHub.argtypes = [ctypes.c_char_p, ctypes.c_char_p]
-        YAPI._yapiUnregisterHub = YAPI._yApiCLib.yapiUnregisterHub
-        YAPI._yapiUnregisterHub.restypes = None
-        YAPI._yapiUnregisterHub.argtypes = [ctypes.c_char_p]
-        YAPI._yapiUpdateDeviceList = YAPI._yApiCLib.yapiUpdateDeviceList
-        YAPI._yapiUpdateDeviceList.restypes = ctypes.c_int
-        YAPI._yapiUpdateDeviceList.argtypes = [ctypes.c_uint, ctypes.c_char_p]
-        YAPI._yapiHandleEvents = YAPI._yApiCLib.yapiHandleEvents
-        YAPI._yapiHandleEvents.restypes = ctypes.c_int
-        YAPI._yapiHandleEvents.argtypes = [ctypes.c_char_p]
-        YAPI._yapiGetTickCount = YAPI._yApiCLib.yapiGetTickCount
-        YAPI._yapiGetTickCount.restypes = ctypes.c_ulonglong
-        YAPI._yapiGetTickCount.argtypes = []
-        YAPI._yapiCheckLogicalName = YAPI._yApiCLib.yapiCheckLogicalName
-        YAPI._yapiCheckLogicalName.restypes = ctypes.c_int
-        YAPI._yapiCheckLogicalName.argtypes = [ctypes.c_char_p]
-        YAPI._yapiGetAPIVersion = YAPI._yApiCLib.yapiGetAPIVersion
-        YAPI._yapiGetAPIVersion.restypes = ctypes.c_ushort
-        YAPI._yapiGetAPIVersion.argtypes = [ctypes.c_void_p, ctypes.c_void_p]
-        YAPI._yapiGetDevice = YAPI._yApiCLib.yapiGetDevice
-        YAPI._yapiGetDevice.restypes = ctypes.c_int
-        YAPI._yapiGetDevice.argtypes = [ctypes.c_char_p, ctypes.c_char_p]
-        YAPI._yapiGetDeviceInfo = YAPI._yApiCLib.yapiGetDeviceInfo
-        YAPI._yapiGetDeviceInfo.restypes = ctypes.c_int
-        YAPI._yapiGetDeviceInfo.argtypes = [ctypes.c_int, ctypes.c_void_p, ctypes.c_char_p]
-        YAPI._yapiGetFunction = YAPI._yApiCLib.yapiGetFunction
-        YAPI._yapiGetFunction.restypes = ctypes.c_int
-        YAPI._yapiGetFunction.argtypes = [ctypes.c_char_p, ctypes.c_char_p, ctypes.c_char_p]
-        YAPI._yapiGetFunctionsByClass = YAPI._yApiCLib.yapiGetFunctionsByClass
-        YAPI._yapiGetFunctionsByClass.restypes = ctypes.c_int
-        YAPI._yapiGetFunctionsByClass.argtypes = [ctypes.c_char_p, ctypes.c_int, ctypes.c_void_p, ctypes.c_int, ctypes.c_void_p, ctypes.c_char_p]
-        YAPI._yapiGetFunctionsByDevice = YAPI._yApiCLib.yapiGetFunctionsByDevice
-        YAPI._yapiGetFunctionsByDevice.restypes = ctypes.c_int
-        YAPI._yapiGetFunctionsByDevice.argtypes = [ctypes.c_int, ctypes.c_int, ctypes.c_void_p, ctypes.c_int, ctypes.c_void_p, ctypes.c_char_p]
-        YAPI._yapiGetFunctionInfoEx = YAPI._yApiCLib.yapiGetFunctionInfoEx
-        YAPI._yapiGetFunctionInfoEx.restypes = ctypes.c_int
-        YAPI._yapiGetFunctionInfoEx.argtypes = [ctypes.c_int, ctypes.c_void_p, ctypes.c_char_p, ctypes.c_char_p, ctypes.c_char_p, ctypes.c_char_p, ctypes.c_char_p, ctypes.c_char_p]
-        YAPI._yapiHTTPRequestSyncStart = YAPI._yApiCLib.yapiHTTPRequestSyncStart
-        YAPI._yapiHTTPRequestSyncStart.restypes = ctypes.c_int
-        YAPI._yapiHTTPRequestSyncStart.argtypes = [ctypes.c_void_p, ctypes.c_char_p, ctypes.c_char_p, POINTER(POINTER(ctypes.c_ubyte)), ctypes.c_void_p, ctypes.c_char_p]
-        YAPI._yapiHTTPRequestSyncStartEx = YAPI._yApiCLib.yapiHTTPRequestSyncStartEx
-        YAPI._yapiHTTPRequestSyncStartEx.restypes = ctypes.c_int
-        YAPI._yapiHTTPRequestSyncStartEx.argtypes = [ctypes.c_void_p, ctypes.c_char_p, ctypes.c_char_p, ctypes.c_int, POINTER(POINTER(ctypes.c_ubyte)), ctypes.c_void_p, ctypes.c_char_p]
-        YAPI._yapiHTTPRequestSyncDone = YAPI._yApiCLib.yapiHTTPRequestSyncDone
-        YAPI._yapiHTTPRequestSyncDone.restypes = ctypes.c_int
-        YAPI._yapiHTTPRequestSyncDone.argtypes = [ctypes.c_void_p, ctypes.c_char_p]
-        YAPI._yapiHTTPRequestAsync = YAPI._yApiCLib.yapiHTTPRequestAsync
-        YAPI._yapiHTTPRequestAsync.restypes = ctypes.c_int
-        YAPI._yapiHTTPRequestAsync.argtypes = [ctypes.c_char_p, ctypes.c_char_p, ctypes.c_void_p, ctypes.c_void_p, ctypes.c_char_p]
-        YAPI._yapiHTTPRequestAsyncEx = YAPI._yApiCLib.yapiHTTPRequestAsyncEx
-        YAPI._yapiHTTPRequestAsyncEx.restypes = ctypes.c_int
-        YAPI._yapiHTTPRequestAsyncEx.argtypes = [ctypes.c_char_p, ctypes.c_char_p, ctypes.c_int, ctypes.c_void_p, ctypes.c_void_p, ctypes.c_char_p]
-        YAPI._yapiHTTPRequest = YAPI._yApiCLib.yapiHTTPRequest
-        YAPI._yapiHTTPRequest.restypes = ctypes.c_int
-        YAPI._yapiHTTPRequest.argtypes = [ctypes.c_char_p, ctypes.c_char_p, ctypes.c_char_p, ctypes.c_int, ctypes.c_void_p, ctypes.c_char_p]
-        YAPI._yapiGetDevicePath = YAPI._yApiCLib.yapiGetDevicePath
-        YAPI._yapiGetDevicePath.restypes = ctypes.c_int
-        YAPI._yapiGetDevicePath.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_char_p, ctypes.c_int, ctypes.c_void_p, ctypes.c_char_p]
-        YAPI._yapiSleep = YAPI._yApiCLib.yapiSleep
-        YAPI._yapiSleep.restypes = ctypes.c_int
-        YAPI._yapiSleep.argtypes = [ctypes.c_int, ctypes.c_char_p]
-        YAPI._yapiRegisterHubDiscoveryCallback = YAPI._yApiCLib.yapiRegisterHubDiscoveryCallback
-        YAPI._yapiRegisterHubDiscoveryCallback.restypes = None
-        YAPI._yapiRegisterHubDiscoveryCallback.argtypes = [ctypes.c_void_p]
-        YAPI._yapiTriggerHubDiscovery = YAPI._yApiCLib.yapiTriggerHubDiscovery
-        YAPI._yapiTriggerHubDiscovery.restypes = ctypes.c_int
-        YAPI._yapiTriggerHubDiscovery.argtypes = [ctypes.c_char_p]
-        YAPI._yapiRegisterDeviceLogCallback = YAPI._yApiCLib.yapiRegisterDeviceLogCallback
-        YAPI._yapiRegisterDeviceLogCallback.restypes = None
-        YAPI._yapiRegisterDeviceLogCallback.argtypes = [ctypes.c_void_p]
-        YAPI._yapiGetAllJsonKeys = YAPI._yApiCLib.yapiGetAllJsonKeys
-        YAPI._yapiGetAllJsonKeys.restypes = ctypes.c_int
-        YAPI._yapiGetAllJsonKeys.argtypes = [ctypes.c_char_p, ctypes.c_char_p, ctypes.c_int, ctypes.c_void_p, ctypes.c_char_p]
-        YAPI._yapiCheckFirmware = YAPI._yApiCLib.yapiCheckFirmware
-        YAPI._yapiCheckFirmware.restypes = ctypes.c_int
-        YAPI._yapiCheckFirmware.argtypes = [ctypes.c_char_p, ctypes.c_char_p, ctypes.c_char_p, ctypes.c_char_p, ctypes.c_int, ctypes.c_void_p, ctypes.c_char_p]
-        YAPI._yapiGetBootloaders = YAPI._yApiCLib.yapiGetBootloaders
-        YAPI._yapiGetBootloaders.restypes = ctypes.c_int
-        YAPI._yapiGetBootloaders.argtypes = [ctypes.c_char_p, ctypes.c_int, ctypes.c_void_p, ctypes.c_char_p]
-        YAPI._yapiUpdateFirmwareEx = YAPI._yApiCLib.yapiUpdateFirmwareEx
-        YAPI._yapiUpdateFirmwareEx.restypes = ctypes.c_int
-        YAPI._yapiUpdateFirmwareEx.argtypes = [ctypes.c_char_p, ctypes.c_char_p, ctypes.c_char_p, ctypes.c_int, ctypes.c_int, ctypes.c_char_p]
-        YAPI._yapiHTTPRequestSyncStartOutOfBand = YAPI._yApiCLib.yapiHTTPRequestSyncStartOutOfBand
-        YAPI._yapiHTTPRequestSyncStartOutOfBand.restypes = ctypes.c_int
-        YAPI._yapiHTTPRequestSyncStartOutOfBand.argtypes = [ctypes.c_void_p, ctypes.c_int, ctypes.c_char_p, ctypes.c_char_p, ctypes.c_int, ctypes.c_void_p, ctypes.c_void_p, ctypes.c_void_p, ctypes.c_void_p, ctypes.c_char_p]
-        YAPI._yapiHTTPRequestAsyncOutOfBand = YAPI._yApiCLib.yapiHTTPRequestAsyncOutOfBand
-        YAPI._yapiHTTPRequestAsyncOutOfBand.restypes = ctypes.c_int
-        YAPI._yapiHTTPRequestAsyncOutOfBand.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_char_p, ctypes.c_int, ctypes.c_void_p, ctypes.c_void_p, ctypes.c_char_p]
-        YAPI._yapiTestHub = YAPI._yApiCLib.yapiTestHub
-        YAPI._yapiTestHub.restypes = ctypes.c_int
-        YAPI._yapiTestHub.argtypes = [ctypes.c_char_p, ctypes.c_int, ctypes.c_char_p]
-        YAPI._yapiJsonGetPath = YAPI._yApiCLib.yapiJsonGetPath
-        YAPI._yapiJsonGetPath.restypes = ctypes.c_int
-        YAPI._yapiJsonGetPath.argtypes = [ctypes.c_char_p, ctypes.c_char_p, ctypes.c_int, ctypes.c_void_p, ctypes.c_char_p]
-        YAPI._yapiJsonDecodeString = YAPI._yApiCLib.yapiJsonDecodeString
-        YAPI._yapiJsonDecodeString.restypes = ctypes.c_int
-        YAPI._yapiJsonDecodeString.argtypes = [ctypes.c_char_p, ctypes.c_char_p]
-        YAPI._yapiGetSubdevices = YAPI._yApiCLib.yapiGetSubdevices
-        YAPI._yapiGetSubdevices.restypes = ctypes.c_int
-        YAPI._yapiGetSubdevices.argtypes = [ctypes.c_char_p, ctypes.c_char_p, ctypes.c_int, ctypes.c_void_p, ctypes.c_char_p]
-        YAPI._yapiFreeMem = YAPI._yApiCLib.yapiFreeMem
-        YAPI._yapiFreeMem.restypes = None
-        YAPI._yapiFreeMem.argtypes = [ctypes.c_void_p]
-        YAPI._yapiGetDevicePathEx = YAPI._yApiCLib.yapiGetDevicePathEx
-        YAPI._yapiGetDevicePathEx.restypes = ctypes.c_int
-        YAPI._yapiGetDevicePathEx.argtypes = [ctypes.c_char_p, ctypes.c_char_p, ctypes.c_char_p, ctypes.c_int, ctypes.c_void_p, ctypes.c_char_p]
-        YAPI._yapiSetNetDevListValidity = YAPI._yApiCLib.yapiSetNetDevListValidity
-        YAPI._yapiSetNetDevListValidity.restypes = None
-        YAPI._yapiSetNetDevListValidity.argtypes = [ctypes.c_int]
-        YAPI._yapiGetNetDevListValidity = YAPI._yApiCLib.yapiGetNetDevListValidity
-        YAPI._yapiGetNetDevListValidity.restypes = ctypes.c_int
-        YAPI._yapiGetNetDevListValidity.argtypes = []
-        YAPI._yapiRegisterBeaconCallback = YAPI._yApiCLib.yapiRegisterBeaconCallback
-        YAPI._yapiRegisterBeaconCallback.restypes = None
-        YAPI._yapiRegisterBeaconCallback.argtypes = [ctypes.c_void_p]
-        YAPI._yapiStartStopDeviceLogCallback = YAPI._yApiCLib.yapiStartStopDeviceLogCallback
-        YAPI._yapiStartStopDeviceLogCallback.restypes = None
-        YAPI._yapiStartStopDeviceLogCallback.argtypes = [ctypes.c_char_p, ctypes.c_int]
-        YAPI._yapiIsModuleWritable = YAPI._yApiCLib.yapiIsModuleWritable
-        YAPI._yapiIsModuleWritable.restypes = ctypes.c_int
-        YAPI._yapiIsModuleWritable.argtypes = [ctypes.c_char_p, ctypes.c_char_p]
-        YAPI._yapiGetDLLPath = YAPI._yApiCLib.yapiGetDLLPath
-        YAPI._yapiGetDLLPath.restypes = ctypes.c_int
-        YAPI._yapiGetDLLPath.argtypes = [ctypes.c_char_p, ctypes.c_int, ctypes.c_char_p]
-        YAPI._yapiSetNetworkTimeout = YAPI._yApiCLib.yapiSetNetworkTimeout
-        YAPI._yapiSetNetworkTimeout.restypes = None
-        YAPI._yapiSetNetworkTimeout.argtypes = [ctypes.c_int]
-        YAPI._yapiGetNetworkTimeout = YAPI._yApiCLib.yapiGetNetworkTimeout
-        YAPI._yapiGetNetworkTimeout.restypes = ctypes.c_int
-        YAPI._yapiGetNetworkTimeout.argtypes = []
-        YAPI._yapiAddUdevRulesForYocto = YAPI._yApiCLib.yapiAddUdevRulesForYocto
-        YAPI._yapiAddUdevRulesForYocto.restypes = ctypes.c_int
-        YAPI._yapiAddUdevRulesForYocto.argtypes = [ctypes.c_int, ctypes.c_char_p]
-        YAPI._yapiSetSSLCertificateSrv = YAPI._yApiCLib.yapiSetSSLCertificateSrv
-        YAPI._yapiSetSSLCertificateSrv.restypes = ctypes.c_int
-        YAPI._yapiSetSSLCertificateSrv.argtypes = [ctypes.c_char_p, ctypes.c_char_p, ctypes.c_char_p]
-        YAPI._yapiAddSSLCertificateCli = YAPI._yApiCLib.yapiAddSSLCertificateCli
-        YAPI._yapiAddSSLCertificateCli.restypes = ctypes.c_int
-        YAPI._yapiAddSSLCertificateCli.argtypes = [ctypes.c_char_p, ctypes.c_int, ctypes.c_char_p]
-        YAPI._yapiSetNetworkSecurityOptions = YAPI._yApiCLib.yapiSetNetworkSecurityOptions
-        YAPI._yapiSetNetworkSecurityOptions.restypes = ctypes.c_int
-        YAPI._yapiSetNetworkSecurityOptions.argtypes = [ctypes.c_int, ctypes.c_char_p]
-        YAPI._yapiGetRemoteCertificate = YAPI._yApiCLib.yapiGetRemoteCertificate
-        YAPI._yapiGetRemoteCertificate.restypes = ctypes.c_int
-        YAPI._yapiGetRemoteCertificate.argtypes = [ctypes.c_char_p, ctypes.c_ulonglong, ctypes.c_char_p, ctypes.c_int, ctypes.c_void_p, ctypes.c_char_p]
-        YAPI._yapiGetNextHubRef = YAPI._yApiCLib.yapiGetNextHubRef
-        YAPI._yapiGetNextHubRef.restypes = ctypes.c_int
-        YAPI._yapiGetNextHubRef.argtypes = [ctypes.c_int]
-        YAPI._yapiGetHubStrAttr = YAPI._yApiCLib.yapiGetHubStrAttr
-        YAPI._yapiGetHubStrAttr.restypes = ctypes.c_int
-        YAPI._yapiGetHubStrAttr.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_char_p, ctypes.c_int, ctypes.c_void_p]
-        YAPI._yapiGetHubIntAttr = YAPI._yApiCLib.yapiGetHubIntAttr
-        YAPI._yapiGetHubIntAttr.restypes = ctypes.c_int
-        YAPI._yapiGetHubIntAttr.argtypes = [ctypes.c_int, ctypes.c_char_p]
-        YAPI._yapiSetHubIntAttr = YAPI._yApiCLib.yapiSetHubIntAttr
-        YAPI._yapiSetHubIntAttr.restypes = ctypes.c_int
-        YAPI._yapiSetHubIntAttr.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_int]
-        YAPI._yapiSetTrustedCertificatesList = YAPI._yApiCLib.yapiSetTrustedCertificatesList
-        YAPI._yapiSetTrustedCertificatesList.restypes = ctypes.c_int
-        YAPI._yapiSetTrustedCertificatesList.argtypes = [ctypes.c_char_p, ctypes.c_char_p]
     #--- (end of generated code: YFunction dlldef)
 
         YAPI._ydllLoaded = True
 
+    # native functions of the shared library, bound on first use (see _YLazyBinding)
+    _yapiInitAPI = _YLazyBinding("yapiInitAPI", ctypes.c_int, [ctypes.c_int, ctypes.c_char_p])
+    _yapiFreeAPI = _YLazyBinding("yapiFreeAPI", None, [])
+    _yapiSetTraceFile = _YLazyBinding("yapiSetTraceFile", None, [ctypes.c_char_p])
+    _yapiRegisterLogFunction = _YLazyBinding("yapiRegisterLogFunction", None, [ctypes.c_void_p])
+    _yapiRegisterDeviceArrivalCallback = _YLazyBinding("yapiRegisterDeviceArrivalCallback", None, [ctypes.c_void_p])
+    _yapiRegisterDeviceRemovalCallback = _YLazyBinding("yapiRegisterDeviceRemovalCallback", None, [ctypes.c_void_p])
+    _yapiRegisterDeviceChangeCallback = _YLazyBinding("yapiRegisterDeviceChangeCallback", None, [ctypes.c_void_p])
+    _yapiRegisterDeviceConfigChangeCallback = _YLazyBinding("yapiRegisterDeviceConfigChangeCallback", None, [ctypes.c_void_p])
+    _yapiRegisterFunctionUpdateCallback = _YLazyBinding("yapiRegisterFunctionUpdateCallback", None, [ctypes.c_void_p])
+    _yapiRegisterTimedReportCallback = _YLazyBinding("yapiRegisterTimedReportCallback", None, [ctypes.c_void_p])
+    _yapiLockDeviceCallBack = _YLazyBinding("yapiLockDeviceCallBack", ctypes.c_int, [ctypes.c_char_p])
+    _yapiUnlockDeviceCallBack = _YLazyBinding("yapiUnlockDeviceCallBack", ctypes.c_int, [ctypes.c_char_p])
+    _yapiLockFunctionCallBack = _YLazyBinding("yapiLockFunctionCallBack", ctypes.c_int, [ctypes.c_char_p])
+    _yapiUnlockFunctionCallBack = _YLazyBinding("yapiUnlockFunctionCallBack", ctypes.c_int, [ctypes.c_char_p])
+    _yapiRegisterHub = _YLazyBinding("yapiRegisterHub", ctypes.c_int, [ctypes.c_char_p, ctypes.c_char_p])
+    _yapiPreregisterHub = _YLazyBinding("yapiPreregisterHub", ctypes.c_int, [ctypes.c_char_p, ctypes.c_char_p])
+    _yapiUnregisterHub = _YLazyBinding("yapiUnregisterHub", None, [ctypes.c_char_p])
+    _yapiUpdateDeviceList = _YLazyBinding("yapiUpdateDeviceList", ctypes.c_int, [ctypes.c_uint, ctypes.c_char_p])
+    _yapiHandleEvents = _YLazyBinding("yapiHandleEvents", ctypes.c_int, [ctypes.c_char_p])
+    _yapiGetTickCount = _YLazyBinding("yapiGetTickCount", ctypes.c_ulonglong, [])
+    _yapiCheckLogicalName = _YLazyBinding("yapiCheckLogicalName", ctypes.c_int, [ctypes.c_char_p])
+    _yapiGetAPIVersion = _YLazyBinding("yapiGetAPIVersion", ctypes.c_ushort, [ctypes.c_void_p, ctypes.c_void_p])
+    _yapiGetDevice = _YLazyBinding("yapiGetDevice", ctypes.c_int, [ctypes.c_char_p, ctypes.c_char_p])
+    _yapiGetDeviceInfo = _YLazyBinding("yapiGetDeviceInfo", ctypes.c_int, [ctypes.c_int, ctypes.c_void_p, ctypes.c_char_p])
+    _yapiGetFunction = _YLazyBinding("yapiGetFunction", ctypes.c_int, [ctypes.c_char_p, ctypes.c_char_p, ctypes.c_char_p])
+    _yapiGetFunctionsByClass = _YLazyBinding("yapiGetFunctionsByClass", ctypes.c_int, [ctypes.c_char_p, ctypes.c_int, ctypes.c_void_p, ctypes.c_int, ctypes.c_void_p, ctypes.c_char_p])
+    _yapiGetFunctionsByDevice = _YLazyBinding("yapiGetFunctionsByDevice", ctypes.c_int, [ctypes.c_int, ctypes.c_int, ctypes.c_void_p, ctypes.c_int, ctypes.c_void_p, ctypes.c_char_p])
+    _yapiGetFunctionInfoEx = _YLazyBinding("yapiGetFunctionInfoEx", ctypes.c_int, [ctypes.c_int, ctypes.c_void_p, ctypes.c_char_p, ctypes.c_char_p, ctypes.c_char_p, ctypes.c_char_p, ctypes.c_char_p, ctypes.c_char_p])
+    _yapiHTTPRequestSyncStart = _YLazyBinding("yapiHTTPRequestSyncStart", ctypes.c_int, [ctypes.c_void_p, ctypes.c_char_p, ctypes.c_char_p, POINTER(POINTER(ctypes.c_ubyte)), ctypes.c_void_p, ctypes.c_char_p])
+    _yapiHTTPRequestSyncStartEx = _YLazyBinding("yapiHTTPRequestSyncStartEx", ctypes.c_int, [ctypes.c_void_p, ctypes.c_char_p, ctypes.c_char_p, ctypes.c_int, POINTER(POINTER(ctypes.c_ubyte)), ctypes.c_void_p, ctypes.c_char_p])
+    _yapiHTTPRequestSyncDone = _YLazyBinding("yapiHTTPRequestSyncDone", ctypes.c_int, [ctypes.c_void_p, ctypes.c_char_p])
+    _yapiHTTPRequestAsync = _YLazyBinding("yapiHTTPRequestAsync", ctypes.c_int, [ctypes.c_char_p, ctypes.c_char_p, ctypes.c_void_p, ctypes.c_void_p, ctypes.c_char_p])
+    _yapiHTTPRequestAsyncEx = _YLazyBinding("yapiHTTPRequestAsyncEx", ctypes.c_int, [ctypes.c_char_p, ctypes.c_char_p, ctypes.c_int, ctypes.c_void_p, ctypes.c_void_p, ctypes.c_char_p])
+    _yapiHTTPRequest = _YLazyBinding("yapiHTTPRequest", ctypes.c_int, [ctypes.c_char_p, ctypes.c_char_p, ctypes.c_char_p, ctypes.c_int, ctypes.c_void_p, ctypes.c_char_p])
+    _yapiGetDevicePath = _YLazyBinding("yapiGetDevicePath", ctypes.c_int, [ctypes.c_int, ctypes.c_char_p, ctypes.c_char_p, ctypes.c_int, ctypes.c_void_p, ctypes.c_char_p])
+    _yapiSleep = _YLazyBinding("yapiSleep", ctypes.c_int, [ctypes.c_int, ctypes.c_char_p])
+    _yapiRegisterHubDiscoveryCallback = _YLazyBinding("yapiRegisterHubDiscoveryCallback", None, [ctypes.c_void_p])
+    _yapiTriggerHubDiscovery = _YLazyBinding("yapiTriggerHubDiscovery", ctypes.c_int, [ctypes.c_char_p])
+    _yapiRegisterDeviceLogCallback = _YLazyBinding("yapiRegisterDeviceLogCallback", None, [ctypes.c_void_p])
+    _yapiGetAllJsonKeys = _YLazyBinding("yapiGetAllJsonKeys", ctypes.c_int, [ctypes.c_char_p, ctypes.c_char_p, ctypes.c_int, ctypes.c_void_p, ctypes.c_char_p])
+    _yapiCheckFirmware = _YLazyBinding("yapiCheckFirmware", ctypes.c_int, [ctypes.c_char_p, ctypes.c_char_p, ctypes.c_char_p, ctypes.c_char_p, ctypes.c_int, ctypes.c_void_p, ctypes.c_char_p])
+    _yapiGetBootloaders = _YLazyBinding("yapiGetBootloaders", ctypes.c_int, [ctypes.c_char_p, ctypes.c_int, ctypes.c_void_p, ctypes.c_char_p])
+    _yapiUpdateFirmwareEx = _YLazyBinding("yapiUpdateFirmwareEx", ctypes.c_int, [ctypes.c_char_p, ctypes.c_char_p, ctypes.c_char_p, ctypes.c_int, ctypes.c_int, ctypes.c_char_p])
+    _yapiHTTPRequestSyncStartOutOfBand = _YLazyBinding("yapiHTTPRequestSyncStartOutOfBand", ctypes.c_int, [ctypes.c_void_p, ctypes.c_int, ctypes.c_char_p, ctypes.c_char_p, ctypes.c_int, ctypes.c_void_p, ctypes.c_void_p, ctypes.c_void_p, ctypes.c_void_p, ctypes.c_char_p])
+    _yapiHTTPRequestAsyncOutOfBand = _YLazyBinding("yapiHTTPRequestAsyncOutOfBand", ctypes.c_int, [ctypes.c_int, ctypes.c_char_p, ctypes.c_char_p, ctypes.c_int, ctypes.c_void_p, ctypes.c_void_p, ctypes.c_char_p])
+    _yapiTestHub = _YLazyBinding("yapiTestHub", ctypes.c_int, [ctypes.c_char_p, ctypes.c_int, ctypes.c_char_p])
+    _yapiJsonGetPath = _YLazyBinding("yapiJsonGetPath", ctypes.c_int, [ctypes.c_char_p, ctypes.c_char_p, ctypes.c_int, ctypes.c_void_p, ctypes.c_char_p])
+    _yapiJsonDecodeString = _YLazyBinding("yapiJsonDecodeString", ctypes.c_int, [ctypes.c_char_p, ctypes.c_char_p])
+    _yapiGetSubdevices = _YLazyBinding("yapiGetSubdevices", ctypes.c_int, [ctypes.c_char_p, ctypes.c_char_p, ctypes.c_int, ctypes.c_void_p, ctypes.c_char_p])
+    _yapiFreeMem = _YLazyBinding("yapiFreeMem", None, [ctypes.c_void_p])
+    _yapiGetDevicePathEx = _YLazyBinding("yapiGetDevicePathEx", ctypes.c_int, [ctypes.c_char_p, ctypes.c_char_p, ctypes.c_char_p, ctypes.c_int, ctypes.c_void_p, ctypes.c_char_p])
+    _yapiSetNetDevListValidity = _YLazyBinding("yapiSetNetDevListValidity", None, [ctypes.c_int])
+    _yapiGetNetDevListValidity = _YLazyBinding("yapiGetNetDevListValidity", ctypes.c_int, [])
+    _yapiRegisterBeaconCallback = _YLazyBinding("yapiRegisterBeaconCallback", None, [ctypes.c_void_p])
+    _yapiStartStopDeviceLogCallback = _YLazyBinding("yapiStartStopDeviceLogCallback", None, [ctypes.c_char_p, ctypes.c_int])
+    _yapiIsModuleWritable = _YLazyBinding("yapiIsModuleWritable", ctypes.c_int, [ctypes.c_char_p, ctypes.c_char_p])
+    _yapiGetDLLPath = _YLazyBinding("yapiGetDLLPath", ctypes.c_int, [ctypes.c_char_p, ctypes.c_int, ctypes.c_char_p])
+    _yapiSetNetworkTimeout = _YLazyBinding("yapiSetNetworkTimeout", None, [ctypes.c_int])
+    _yapiGetNetworkTimeout = _YLazyBinding("yapiGetNetworkTimeout", ctypes.c_int, [])
+    _yapiAddUdevRulesForYocto = _YLazyBinding("yapiAddUdevRulesForYocto", ctypes.c_int, [ctypes.c_int, ctypes.c_char_p])
+    _yapiSetSSLCertificateSrv = _YLazyBinding("yapiSetSSLCertificateSrv", ctypes.c_int, [ctypes.c_char_p, ctypes.c_char_p, ctypes.c_char_p])
+    _yapiAddSSLCertificateCli = _YLazyBinding("yapiAddSSLCertificateCli", ctypes.c_int, [ctypes.c_char_p, ctypes.c_int, ctypes.c_char_p])
+    _yapiSetNetworkSecurityOptions = _YLazyBinding("yapiSetNetworkSecurityOptions", ctypes.c_int, [ctypes.c_int, ctypes.c_char_p])
+    _yapiGetRemoteCertificate = _YLazyBinding("yapiGetRemoteCertificate", ctypes.c_int, [ctypes.c_char_p, ctypes.c_ulonglong, ctypes.c_char_p, ctypes.c_int, ctypes.c_void_p, ctypes.c_char_p])
+    _yapiGetNextHubRef = _YLazyBinding("yapiGetNextHubRef", ctypes.c_int, [ctypes.c_int])
+    _yapiGetHubStrAttr = _YLazyBinding("yapiGetHubStrAttr", ctypes.c_int, [ctypes.c_int, ctypes.c_char_p, ctypes.c_char_p, ctypes.c_int, ctypes.c_void_p])
+    _yapiGetHubIntAttr = _YLazyBinding("yapiGetHubIntAttr", ctypes.c_int, [ctypes.c_int, ctypes.c_char_p])
+    _yapiSetHubIntAttr = _YLazyBinding("yapiSetHubIntAttr", ctypes.c_int, [ctypes.c_int, ctypes.c_char_p, ctypes.c_int])
+    _yapiSetTrustedCertificatesList = _YLazyBinding("yapiSetTrustedCertificatesList", ctypes.c_int, [ctypes.c_char_p, ctypes.c_char_p])
+
     # noinspection PyUnresolvedReferences,PyTypeChecker
     class yDeviceSt(ctypes.Structure):
         _pack_ = 1
@@ -1452,7 +1639,9 @@ class YAPI:
     class yFACE_STATUS:
         YFACE_EMPTY, YFACE_RUNNING, YFACE_ERROR = range(3)
 
-    class _Event:
+    class _Event(object):
+        __slots__ = ("ev", "module", "func", "value", "timestamp", "duration", "report",
+                     "serial", "url", "beacon", "queued")
         ARRIVAL, REMOVAL, CHANGE, FUN_VALUE, FUN_TIMEDREPORT, FUN_REFRESH, \
             HUB_DISCOVERY, CONFCHANGE, BEACON_CHANGE, YAPI_NOP = range(10)
 
@@ -1467,6 +1656,7 @@ class YAPI:
             self.serial = None
             self.url = None
             self.beacon = -1
+            self.queued = 0.0
 
         def setArrival(self, module):
             self.ev = self.ARRIVAL
@@ -1548,6 +1738,129 @@ class YAPI:
             elif self.ev == self.FUN_REFRESH:
                 self.func.isOnline()
 
+    class _EventPumpThread(object):
+        # Background thread waiting for device notifications in the native library,
+        # handing the resulting data events over to an executor. Events of a same
+        # function (or module) are invoked in order, one at a time, while events of
+        # different functions may run in parallel.
+        def __init__(self, executor, sliceMs):
+            import threading
+            if executor is None:
+                import concurrent.futures
+                executor = concurrent.futures.ThreadPoolExecutor(max_workers=4)
+                self._ownExecutor = True
+            else:
+                self._ownExecutor = False
+            self._executor = executor
+            self._sliceMs = sliceMs
+            self._lock = threading.Lock()
+            self._pending = {}
+            self._stats = {}
+            self._stopEvent = threading.Event()
+            # set in the executor threads while they invoke callbacks
+            self._worker = threading.local()
+            self._thread = threading.Thread(target=self._run, name="YAPI event pump")
+            self._thread.daemon = True
+
+        def start(self):
+            self._thread.start()
+
+        def stop(self):
+            self._stopEvent.set()
+            self._thread.join()
+            if self._ownExecutor:
+                # when called from a callback, waiting for the executor threads
+                # would wait for the calling thread itself
+                inCallback = getattr(self._worker, "active", False)
+                self._executor.shutdown(wait=not inCallback)
+
+        def _run(self):
+            errBuffer = ctypes.create_string_buffer(YAPI.YOCTO_ERRMSG_LEN)
+            errmsg = YRefParam()
+            while not self._stopEvent.is_set():
+                # the native library handles device notifications while sleeping
+                YAPI._yapiSleep(self._sliceMs, errBuffer)
+                if len(YAPI._DataEvents) > 0:
+                    for ev in YAPI._takeDataEvents(errmsg):
+                        self.dispatch(ev)
+
+        def dispatch(self, ev):
+            key = ev.func
+            if key is None:
+                key = ev.module
+            with self._lock:
+                queue = self._pending.get(key)
+                if queue is not None:
+                    queue.append(ev)
+                    return
+                self._pending[key] = collections.deque([ev])
+            self._executor.submit(self._invoke, key)
+
+        def _invoke(self, key):
+            while True:
+                with self._lock:
+                    queue = self._pending[key]
+                    if not queue:
+                        del self._pending[key]
+                        return
+                    ev = queue.popleft()
+                start = _yMonotonic()
+                error = None
+                self._worker.active = True
+                try:
+                    ev.invokeData()
+                except Exception as ex:
+                    error = ex
+                    self._logError(ev, ex)
+                finally:
+                    self._worker.active = False
+                end = _yMonotonic()
+                self._record(key, start - ev.queued, end - start, error)
+
+        def _logError(self, ev, ex):
+            # report the failure through the function registered by RegisterLogFunction()
+            global yLogFct
+            if yLogFct is None:
+                return
+            target = ev.func
+            if target is None:
+                target = ev.module
+            try:
+                name = target.describe()
+            except Exception:
+                name = str(target)
+            # noinspection PyCallingNonCallable
+            yLogFct("Exception in callback of %s: %s: %s\n" % (name, type(ex).__name__, ex))
+
+        def _record(self, key, latency, duration, error):
+            with self._lock:
+                stats = self._stats.get(key)
+                if stats is None:
+                    stats = {"count": 0, "errors": 0, "lastError": None,
+                             "totalLatency": 0.0, "maxLatency": 0.0,
+                             "totalDuration": 0.0, "maxDuration": 0.0}
+                    self._stats[key] = stats
+                stats["count"] += 1
+                stats["totalLatency"] += latency
+                stats["totalDuration"] += duration
+                if latency > stats["maxLatency"]:
+                    stats["maxLatency"] = latency
+                if duration > stats["maxDuration"]:
+                    stats["maxDuration"] = duration
+                if error is not None:
+                    stats["errors"] += 1
+                    stats["lastError"] = error
+
+        def getStats(self):
+            res = {}
+            with self._lock:
+                for key in self._stats:
+                    stats = dict(self._stats[key])
+                    stats["avgLatency"] = stats["totalLatency"] / stats["count"]
+                    stats["avgDuration"] = stats["totalDuration"] / stats["count"]
+                    res[key] = stats
+            return res
+
     ##--- (generated code: YFunction return codes)
     # Yoctopuce error codes, used by default as function return value
     SUCCESS = 0                    # everything worked all right
@@ -1583,7 +1896,8 @@ class YAPI:
     class YAPI_Exception(YAPI_Exception):
         pass
 
-    YDevice_devCache = []
+    # YDevice objects indexed by device descriptor
+    YDevice_devCache = {}
 
     # - Types used for internal yapi callbacks
     _yapiLogFunc = ctypes.CFUNCTYPE(None, ctypes.c_char_p, ctypes.c_int)
@@ -1601,6 +1915,13 @@ class YAPI:
 
     _yapiDeviceLogCallback = ctypes.CFUNCTYPE(None, ctypes.c_int, ctypes.c_char_p)
 
+    _yapiRequestAsyncCallback = ctypes.CFUNCTYPE(None, ctypes.c_void_p, POINTER(c_ubyte), ctypes.c_uint,
+                                                 ctypes.c_int, ctypes.c_char_p)
+
+    # futures of the asynchronous requests in progress, indexed by the context given to the native library
+    _pendingRequests = {}
+    _requestContexts = itertools.count(1)
+
     @staticmethod
     def YISERR(retcode):
         if retcode < 0:
@@ -1836,10 +2157,230 @@ class YAPI:
 
         @return a long integer corresponding to the millisecond counter.
         """
-        # for python, since some implementations don't support 64bits integers
-        # GetTickCount returns a datetime object instead of a u64
-        # noinspection PyUnresolvedReferences
-        return datetime.datetime.today()
+        return int(_yMonotonic() * 1000)
+
+    @staticmethod
+    def SetCachePolicy(className, attrName, cacheValidityMs, staleWhileRevalidate=False):
+        """
+        Changes the validity period of the cached attributes of a class of
+        functions, or of one attribute of a class, instead of the global cache
+        validity set by SetCacheValidity(). For instance, currentValue can be
+        reloaded every 50 ms while the global cache validity is longer. Policies
+        of a class also apply to its subclasses (e.g. "Sensor" applies to all
+        sensors), the most specific policy wins.
+
+        Each get_xxx() method reloads the function only once its own attribute
+        has expired: as all attributes are loaded at once, the other attributes
+        are refreshed at the same time. With stale-while-revalidate, get_xxx()
+        returns the expired value immediately and the function is reloaded by a
+        background thread. A validity given to load() explicitly keeps all
+        attributes valid during that time, whatever their policy.
+
+        @param className : the name of the function class, such as "Temperature"
+                or "Sensor" (or the class itself, e.g. YTemperature)
+        @param attrName : the name of the attribute as in the REST API (e.g. "currentValue"),
+                or "*" for all attributes of the class without a specific policy
+        @param cacheValidityMs : an integer corresponding to the validity of the attribute,
+                in milliseconds, or None to remove the policy
+        @param staleWhileRevalidate : True to return expired values immediately and
+                refresh them in the background
+
+        @return YAPI.SUCCESS when the call succeeds.
+        """
+        if not isinstance(className, str):
+            className = className.__name__
+        if className[:1] == "Y" and className[1:2].isupper():
+            className = className[1:]
+        if attrName is None or attrName == "":
+            attrName = "*"
+        policies = dict(YAPI._cachePolicies)
+        classPolicies = dict(policies.get(className, {}))
+        if cacheValidityMs is None:
+            classPolicies.pop(attrName, None)
+        else:
+            classPolicies[attrName] = (_yDurationMs(cacheValidityMs), staleWhileRevalidate)
+        if classPolicies:
+            policies[className] = classPolicies
+        else:
+            policies.pop(className, None)
+        YAPI._resolvedCachePolicies = {}
+        YAPI._cachePolicies = policies
+        classes = [YFunction]
+        while classes:
+            cls = classes.pop()
+            YAPI._installPolicyGetters(cls)
+            classes.extend(cls.__subclasses__())
+        return YAPI.SUCCESS
+
+    @staticmethod
+    def ClearCachePolicies():
+        """
+        Removes all the cache policies set by SetCachePolicy(), so that the global
+        cache validity applies again to all attributes.
+
+        @return YAPI.SUCCESS when the call succeeds.
+        """
+        YAPI._cachePolicies = {}
+        YAPI._resolvedCachePolicies = {}
+        return YAPI.SUCCESS
+
+    @staticmethod
+    def _getCachePolicies(cls):
+        resolved = YAPI._resolvedCachePolicies.get(cls)
+        if resolved is None:
+            resolved = {}
+            # apply the policies of the parent classes first, most specific last
+            for klass in reversed(cls.__mro__):
+                name = klass.__name__
+                if name[:1] == "Y":
+                    name = name[1:]
+                policies = YAPI._cachePolicies.get(name)
+                if policies is not None:
+                    resolved.update(policies)
+            YAPI._resolvedCachePolicies[cls] = resolved
+        return resolved
+
+    @staticmethod
+    def _installPolicyGetters(cls):
+        # wraps the cached get_xxx() methods of the class and of its parent classes,
+        # so that each attribute is reloaded according to its own cache policy
+        for klass in cls.__mro__:
+            if not issubclass(klass, YFunction) or "_policyGettersInstalled" in klass.__dict__:
+                continue
+            for name, getter in list(klass.__dict__.items()):
+                code = getattr(getter, "__code__", None)
+                # getters of attributes loaded once (e.g. serialNumber) do not check the time
+                if name[:4] != "get_" or code is None or "_cacheExpiration" not in code.co_names \
+                        or "GetTickCount" not in code.co_names:
+                    continue
+                setattr(klass, name, YAPI._policyGetter(name[4:], getter))
+            klass._policyGettersInstalled = True
+
+    @staticmethod
+    def _policyGetter(attrName, getter):
+        def get(self):
+            policies = YAPI._getCachePolicies(type(self))
+            if not policies:
+                return getter(self)
+            policy = policies.get(attrName)
+            if policy is None:
+                policy = policies.get("*")
+            if policy is None:
+                policy = (_yDurationMs(YAPI._yapiContext.GetCacheValidity()), False)
+            now = YAPI.GetTickCount()
+            # the cache is valid until the end of the validity given to load(), or
+            # until the attribute expires, unless it has been invalidated since
+            loaded = self._lastLoadTick > 0 and self._cacheExpiration == self._loadExpiration
+            if not loaded or (now >= self._cacheExpiration and now >= self._lastLoadTick + policy[0]):
+                if loaded and policy[1]:
+                    # serve the expired value, refreshed in the background
+                    YAPI._scheduleRefresh(self)
+                elif self.load(0) != YAPI.SUCCESS:
+                    # let the getter report the error
+                    return getter(self)
+            expiration = self._loadExpiration
+            self._cacheExpiration = YAPI._PINNED_CACHE
+            try:
+                return getter(self)
+            finally:
+                if self._cacheExpiration == YAPI._PINNED_CACHE:
+                    self._cacheExpiration = expiration
+        get.__name__ = getter.__name__
+        get.__doc__ = getter.__doc__
+        return get
+
+    @staticmethod
+    def _scheduleRefresh(func):
+        import threading
+        if YAPI._refreshCondition is None:
+            YAPI._refreshCondition = threading.Condition()
+        with YAPI._refreshCondition:
+            if func in YAPI._refreshPending:
+                return
+            YAPI._refreshPending.add(func)
+            YAPI._refreshQueue.append(func)
+            if YAPI._refreshThread is None or not YAPI._refreshThread.is_alive():
+                YAPI._refreshThread = threading.Thread(target=YAPI._refreshWorker, name="YAPI cache refresh")
+                YAPI._refreshThread.daemon = True
+                YAPI._refreshThread.start()
+            YAPI._refreshCondition.notify()
+
+    @staticmethod
+    def _refreshWorker():
+        cond = YAPI._refreshCondition
+        while True:
+            with cond:
+                while len(YAPI._refreshQueue) == 0:
+                    cond.wait()
+                func = YAPI._refreshQueue.popleft()
+            if func is None:
+                # stopped by FreeAPI
+                return
+            try:
+                # attributes then expire according to their policy
+                func.load(0)
+            except YAPI_Exception:
+                # the error is kept in the function object, the next get_xxx() will retry
+                pass
+            with cond:
+                YAPI._refreshPending.discard(func)
+
+    @staticmethod
+    def _stopRefreshWorker():
+        import threading
+        cond = YAPI._refreshCondition
+        if cond is None:
+            return
+        with cond:
+            thread = YAPI._refreshThread
+            YAPI._refreshQueue.clear()
+            YAPI._refreshPending.clear()
+            if thread is not None and thread.is_alive():
+                YAPI._refreshQueue.append(None)
+                cond.notify()
+            YAPI._refreshThread = None
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+        with cond:
+            YAPI._refreshQueue.clear()
+
+    @staticmethod
+    def SetDataStreamCache(path):
+        """
+        Enables a local cache of the datalogger streams. Once closed, a stream
+        of the datalogger never changes: when the cache is enabled, closed
+        streams are stored after their first download, and YDataSet objects
+        load them from the cache instead of the device afterwards. Only the
+        streams still being recorded, or missing from the cache, are downloaded.
+        The streams are identified by the serial number of the device, the
+        function, the run number and the start time of the stream.
+
+        @param path : the name of an SQLite database file, which is created if needed,
+                ":memory:" to keep the streams in memory only, or None to disable the cache
+
+        @return YAPI.SUCCESS when the call succeeds.
+
+        On failure, throws an exception.
+        """
+        previous = YAPI._streamCache
+        YAPI._streamCache = None
+        if previous is not None:
+            previous.close()
+        if path is not None:
+            YAPI._streamCache = _YStreamCache(path)
+        return YAPI.SUCCESS
+
+    @staticmethod
+    def ClearDataStreamCache():
+        """
+        Removes all the streams stored in the datalogger stream cache
+        (see SetDataStreamCache).
+
+        @return YAPI.SUCCESS when the call succeeds.
+        """
+        if YAPI._streamCache is not None:
+            YAPI._streamCache.clear()
+        return YAPI.SUCCESS
 
     @staticmethod
     def SetTraceFile(filename):
@@ -1870,9 +2411,7 @@ class YAPI:
         On failure returns a negative error code.
         """
         errBuffer = ctypes.create_string_buffer(YAPI.YOCTO_ERRMSG_LEN)
-        if type(ms_duration) == type(int()):
-            ms_duration = datetime.timedelta(milliseconds=ms_duration)
-        timeout = YAPI.GetTickCount() + ms_duration
+        timeout = YAPI.GetTickCount() + _yDurationMs(ms_duration)
         res = YAPI.SUCCESS
 
         ok = True
@@ -1993,38 +2532,44 @@ class YAPI:
         else:
             return res
 
+    # contribution of the 2nd and 3rd characters of an encoded word, by character code
+    _wordDigit2 = [(c - 48) << 5 for c in range(256)]
+    _wordDigit3 = [(c - 48) << 10 for c in range(256)]
+    _wordDigit3[ord('z')] = (ord('\\') - 48) << 10
+
     @staticmethod
     def _decodeWords(sdat):
-        p = 0
+        codes = bytearray(sdat, YAPI.DefaultEncoding)
+        digit2 = YAPI._wordDigit2
+        digit3 = YAPI._wordDigit3
         udat = []
-        while p < len(sdat):
-            c = sdat[p]
+        append = udat.append
+        n = len(codes)
+        p = 0
+        while p < n:
+            c = codes[p]
             p += 1
-            if c == '*':
-                val = 0
-            elif c == 'X':
-                val = 0xffff
-            elif c == 'Y':
-                val = 0x7fff
-            elif c >= 'a':
-                srcpos = int(len(udat) - 1 - (ord(c) - ord('a')))
+            if c >= 97:
+                # 'a'..: repeat a previous word
+                srcpos = len(udat) - 1 - (c - 97)
                 if srcpos < 0:
-                    val = 0
+                    append(0)
                 else:
-                    val = udat[srcpos]
+                    append(udat[srcpos])
+            elif c == 42:
+                # '*'
+                append(0)
+            elif c == 88:
+                # 'X'
+                append(0xffff)
+            elif c == 89:
+                # 'Y'
+                append(0x7fff)
             else:
-                if p + 2 > len(sdat):
+                if p + 2 > n:
                     return udat
-                val = (ord(c) - ord('0'))
-                c = sdat[p]
-                p += 1
-                val += (ord(c) - ord('0')) << 5
-                c = sdat[p]
-                p += 1
-                if c == 'z':
-                    c = "\\"
-                val += (ord(c) - ord('0')) << 10
-            udat.append(val)
+                append(c - 48 + digit2[codes[p]] + digit3[codes[p + 1]])
+                p += 2
         return udat
 
     @staticmethod
@@ -2082,6 +2627,15 @@ class YAPI:
             return 0
         return int(val[: p])
 
+    @staticmethod
+    def _ptrToBytearray(ptr, size):
+        # copy a reply buffer owned by the native library with a single memmove,
+        # rather than one Python-level append per byte
+        bb = bytearray(size)
+        if size > 0:
+            ctypes.memmove((ctypes.c_char * size).from_buffer(bb), ptr, size)
+        return bb
+
     @staticmethod
     def _bytesToHexStr(bindata):
         return (binascii.hexlify(bindata)).decode().upper()
@@ -2124,15 +2678,22 @@ class YAPI:
                 # noinspection PyAttributeOutsideInit
                 errmsg.value = (errBuffer.value).decode(YAPI.DefaultEncoding)
             return res
+        if YAPI._eventPump is not None:
+            # callbacks are invoked by the event pump
+            return YAPI.SUCCESS
         while len(YAPI._DataEvents) > 0:
-            YAPI.yapiLockFunctionCallBack(errmsg)
-            if not (len(YAPI._DataEvents)):
-                YAPI.yapiUnlockFunctionCallBack(errmsg)
-                break
-
-            ev = YAPI._DataEvents.pop(0)
-            YAPI.yapiUnlockFunctionCallBack(errmsg)
-            ev.invokeData()
+            batch = YAPI._takeDataEvents(errmsg)
+            try:
+                while batch:
+                    batch.popleft().invokeData()
+            finally:
+                if batch:
+                    # a callback raised an exception: keep the remaining events queued
+                    YAPI.yapiLockFunctionCallBack(errmsg)
+                    batch.extend(YAPI._DataEvents)
+                    YAPI._DataEvents.clear()
+                    YAPI._DataEvents.extend(batch)
+                    YAPI.yapiUnlockFunctionCallBack(errmsg)
         return YAPI.SUCCESS
 
     @staticmethod
@@ -2205,13 +2766,14 @@ class YAPI:
     @staticmethod
     def native_yDeviceArrivalCallback(d):
         YDevice.PlugDevice(d)
+        YFunction._InvalidateCallbackIndexes()
         infos = YAPI.emptyDeviceSt()
         for i in range(len(YFunction._FunctionCallbacks)):
             descriptor = YFunction._FunctionCallbacks[i].get_functionDescriptor()
             if descriptor == YFunction.FUNCTIONDESCRIPTOR_INVALID:
                 ev = YAPI._Event()
                 ev.setFunRefresh(YFunction._FunctionCallbacks[i])
-                YAPI._DataEvents.append(ev)
+                YAPI._queueDataEvent(ev)
         errmsgRef = YRefParam()
         if YAPI.yapiGetDeviceInfo(d, infos, errmsgRef) != YAPI.SUCCESS:
             return
@@ -2221,7 +2783,7 @@ class YAPI:
         if yArrivalFct is not None:
             ev = YAPI._Event()
             ev.setArrival(modul)
-            YAPI._PlugEvents.append(ev)
+            YAPI._queuePlugEvent(ev)
 
     @staticmethod
     def native_HubDiscoveryCallback(serial_ptr, url_ptr):
@@ -2229,7 +2791,7 @@ class YAPI:
         url = (url_ptr).decode(YAPI.DefaultEncoding)
         ev = YAPI._Event()
         ev.setHubDiscovery(serial, url)
-        YAPI._PlugEvents.append(ev)
+        YAPI._queuePlugEvent(ev)
 
     @staticmethod
     def native_DeviceLogCallback(d, line):
@@ -2330,7 +2892,7 @@ class YAPI:
         modul = YModule.FindModule((infos.serial).decode(YAPI.DefaultEncoding) + ".module")
         ev = YAPI._Event()
         ev.setChange(modul)
-        YAPI._PlugEvents.append(ev)
+        YAPI._queuePlugEvent(ev)
         return
 
     @staticmethod
@@ -2349,7 +2911,7 @@ class YAPI:
         if modul in YModule._moduleCallbackList and YModule._moduleCallbackList[modul] > 0:
             ev = YAPI._Event()
             ev.setConfigChange(modul)
-            YAPI._DataEvents.append(ev)
+            YAPI._queueDataEvent(ev)
         return 0
 
     @staticmethod
@@ -2362,45 +2924,331 @@ class YAPI:
         if modul in YModule._moduleCallbackList and YModule._moduleCallbackList[modul] > 0:
             ev = YAPI._Event()
             ev.setBeaconChange(modul, beacon)
-            YAPI._DataEvents.append(ev)
+            YAPI._queueDataEvent(ev)
         return 0
 
     @staticmethod
     def queuesCleanUp():
-        del YAPI._PlugEvents[:]
-        del YAPI._DataEvents[:]
+        YAPI._PlugEvents.clear()
+        YAPI._DataEvents.clear()
+        YAPI._PendingValueEvents.clear()
+
+    @staticmethod
+    def _takeDataEvents(errmsg=None):
+        # take the whole batch of pending events at once
+        YAPI.yapiLockFunctionCallBack(errmsg)
+        batch = collections.deque(YAPI._DataEvents)
+        YAPI._DataEvents.clear()
+        YAPI._PendingValueEvents.clear()
+        YAPI.yapiUnlockFunctionCallBack(errmsg)
+        return batch
+
+    @staticmethod
+    def StartEventPump(executor=None, sliceMs=10):
+        """
+        Starts a background thread that handles the notifications sent by the
+        devices, so that value, timed report, configuration change and beacon
+        callbacks no longer need calls to HandleEvents() or Sleep(). Callbacks
+        are invoked through the executor: the callbacks of a same function are
+        invoked in order, one at a time, while callbacks of different functions
+        may run in parallel, so a slow callback does not delay the others.
+        Exceptions raised by the callbacks are reported to the function registered
+        by RegisterLogFunction() and counted in GetCallbackStats().
+        Device arrival and removal callbacks are still invoked by UpdateDeviceList().
+
+        @param executor : a concurrent.futures.Executor used to invoke the callbacks,
+                or None to use a dedicated pool of 4 threads.
+        @param sliceMs : the longest time (in milliseconds) the pump thread waits
+                for notifications before checking whether it should stop.
+
+        @return YAPI.SUCCESS when the call succeeds.
+
+        On failure, throws an exception or returns a negative error code.
+        """
+        if not YAPI._apiInitialized:
+            if not YAPI.ExceptionsDisabled:
+                raise YAPI.YAPI_Exception(YAPI.NOT_INITIALIZED, "API not initialized")
+            return YAPI.NOT_INITIALIZED
+        if YAPI._eventPump is not None:
+            return YAPI.SUCCESS
+        pump = YAPI._EventPumpThread(executor, sliceMs)
+        pump.start()
+        YAPI._eventPump = pump
+        return YAPI.SUCCESS
+
+    @staticmethod
+    def StopEventPump():
+        """
+        Stops the background thread started by StartEventPump(). Callbacks already
+        handed over to the executor are completed first, except when this method is
+        called from a callback: it then returns without waiting for the callbacks
+        still running. Pending notifications are handled again by HandleEvents()
+        afterwards.
+
+        @return YAPI.SUCCESS when the call succeeds.
+        """
+        pump = YAPI._eventPump
+        if pump is not None:
+            YAPI._eventPump = None
+            YAPI._lastEventPump = pump
+            pump.stop()
+        return YAPI.SUCCESS
+
+    @staticmethod
+    def GetCallbackStats():
+        """
+        Returns latency statistics of the callbacks invoked by the event pump.
+        Latencies are measured from the time the notification is received until
+        the callback is invoked, durations are the time spent in the callback.
+
+        @return a dictionary indexed by YFunction (or YModule) object, giving for each
+                one a dictionary with the keys count, errors, lastError, avgLatency,
+                maxLatency, totalLatency, avgDuration, maxDuration and totalDuration
+                (times in seconds). The dictionary is empty when the pump has never
+                been started.
+        """
+        pump = YAPI._eventPump
+        if pump is None:
+            pump = YAPI._lastEventPump
+        if pump is None:
+            return {}
+        return pump.getStats()
+
+    @staticmethod
+    def _queuePlugEvent(ev):
+        YAPI._PlugEvents.append(ev)
+        depth = len(YAPI._PlugEvents)
+        if depth > YAPI._EventQueueStats["plugQueueHighWater"]:
+            YAPI._EventQueueStats["plugQueueHighWater"] = depth
+
+    @staticmethod
+    def _queueDataEvent(ev):
+        queue = YAPI._DataEvents
+        maxDepth = YAPI._DataEventsMaxDepth
+        if maxDepth > 0:
+            pending = YAPI._PendingValueEvents
+            if YAPI._DataEventsPolicy == YAPI.EVENTQUEUE_COALESCE_LATEST and ev.ev == YAPI._Event.FUN_VALUE:
+                prev = pending.get(ev.func)
+                if prev is not None:
+                    # only the latest value of each function matters
+                    prev.value = ev.value
+                    YAPI._EventQueueStats["coalescedEvents"] += 1
+                    return
+                pending[ev.func] = ev
+            while len(queue) >= maxDepth:
+                dropped = queue.popleft()
+                if pending and pending.get(dropped.func) is dropped:
+                    del pending[dropped.func]
+                YAPI._EventQueueStats["droppedEvents"] += 1
+        ev.queued = _yMonotonic()
+        queue.append(ev)
+        depth = len(queue)
+        if depth > YAPI._EventQueueStats["dataQueueHighWater"]:
+            YAPI._EventQueueStats["dataQueueHighWater"] = depth
+
+    @staticmethod
+    def SetEventQueueLimit(maxDepth, policy=EVENTQUEUE_DROP_OLDEST):
+        """
+        Limits the number of value and timed report notifications kept in queue
+        until the next call to HandleEvents(). When notifications arrive faster
+        than the application handles them, the queue would otherwise grow without
+        bound. Device arrival and removal events are never dropped.
+
+        @param maxDepth : the maximal number of queued notifications, or 0 for no limit.
+        @param policy : YAPI.EVENTQUEUE_DROP_OLDEST to drop the oldest notification
+                when the queue is full, or YAPI.EVENTQUEUE_COALESCE_LATEST to replace
+                the pending value notification of the same function by the latest value
+                (falling back to dropping the oldest notification).
+
+        @return YAPI.SUCCESS when the call succeeds.
+
+        On failure, throws an exception or returns a negative error code.
+        """
+        if maxDepth < 0 or (policy != YAPI.EVENTQUEUE_DROP_OLDEST and policy != YAPI.EVENTQUEUE_COALESCE_LATEST):
+            if not YAPI.ExceptionsDisabled:
+                raise YAPI.YAPI_Exception(YAPI.INVALID_ARGUMENT, "Invalid event queue limit")
+            return YAPI.INVALID_ARGUMENT
+        YAPI._DataEventsMaxDepth = maxDepth
+        YAPI._DataEventsPolicy = policy
+        YAPI._PendingValueEvents.clear()
+        return YAPI.SUCCESS
+
+    @staticmethod
+    def GetEventQueueStats():
+        """
+        Returns counters about the event queues filled by the devices notifications.
+
+        @return a dictionary with the current depth of the data and plug queues
+                (dataQueueDepth, plugQueueDepth), their highest depth observed
+                (dataQueueHighWater, plugQueueHighWater), the number of notifications
+                dropped (droppedEvents) and coalesced (coalescedEvents) because of the
+                limit set by SetEventQueueLimit().
+        """
+        res = dict(YAPI._EventQueueStats)
+        res["dataQueueDepth"] = len(YAPI._DataEvents)
+        res["plugQueueDepth"] = len(YAPI._PlugEvents)
+        return res
+
+    @staticmethod
+    def native_yRequestAsyncCallback(context, result, resultlen, retcode, errmsg):
+        future = YAPI._pendingRequests.pop(context, None)
+        if future is None:
+            return
+        if YAPI.YISERR(retcode):
+            if errmsg is not None:
+                errmsg = (errmsg).decode(YAPI.DefaultEncoding)
+            else:
+                errmsg = "asynchronous request failed"
+            future.set_exception(YAPI.YAPI_Exception(retcode, errmsg))
+        elif result:
+            future.set_result(YAPI._ptrToBytearray(result, resultlen))
+        else:
+            future.set_result(bytearray())
+
+    @staticmethod
+    def _newRequestContext(future):
+        # context values are small integers passed to the native library as void*
+        context = next(YAPI._requestContexts)
+        YAPI._pendingRequests[context] = future
+        return context
 
     @staticmethod
     def native_yFunctionUpdateCallback(f, data):
         if data is None:
             return
         # look if we have a know objet online
-        for i in range(len(YFunction._FunctionCallbacks)):
-            descriptor = YFunction._FunctionCallbacks[i].get_functionDescriptor()
-            if descriptor == f:
-                ev = YAPI._Event()
-                ev.setFunVal(YFunction._FunctionCallbacks[i], (data).decode(YAPI.DefaultEncoding))
-                YAPI._DataEvents.append(ev)
-                return 0
+        func = YFunction._FindValueCallback(f)
+        if func is not None:
+            ev = YAPI._Event()
+            ev.setFunVal(func, (data).decode(YAPI.DefaultEncoding))
+            YAPI._queueDataEvent(ev)
         return 0
 
     @staticmethod
     def native_yTimedReportCallback(f, timestamp, data, dataLen, duration):
-        for i in range(len(YFunction._TimedReportCallbackList)):
-            if YFunction._TimedReportCallbackList[i].get_functionDescriptor() == f:
-                report = []
-                for d in range(dataLen):
-                    report.append(int(data[d]))
-                ev = YAPI._Event()
-                ev.setTimedReport(YFunction._TimedReportCallbackList[i], timestamp, duration, report)
-                YAPI._DataEvents.append(ev)
-                return
+        func = YFunction._FindTimedReportCallback(f)
+        if func is not None:
+            report = []
+            for d in range(dataLen):
+                report.append(int(data[d]))
+            ev = YAPI._Event()
+            ev.setTimedReport(func, timestamp, duration, report)
+            YAPI._queueDataEvent(ev)
+            return
         return 0
 
     @staticmethod
     def RegisterCalibrationHandler(calibType, callback):
         key = str(calibType)
         YAPI._CalibHandlers[key] = callback
+        # a batch handler registered for the former handler does not apply anymore
+        YAPI._BatchCalibHandlers.pop(key, None)
+
+    @staticmethod
+    def RegisterBatchCalibrationHandler(calibType, callback):
+        """
+        Registers a calibration handler working on a whole sequence of values,
+        used when decoding datalogger streams and timed reports. The handler is
+        called as callback(values, calibType, params, rawValues, refValues) and
+        must return the list of calibrated values, in the same order. It must
+        give the same results as the handler registered with
+        RegisterCalibrationHandler() for the same calibration type, which remains
+        used for single values. Registering a new single-value handler for a
+        calibration type removes its batch handler.
+
+        @param calibType : the calibration type
+        @param callback : the batch calibration handler, or None to remove it
+        """
+        key = str(calibType)
+        if callback is None:
+            YAPI._BatchCalibHandlers.pop(key, None)
+        else:
+            YAPI._BatchCalibHandlers[key] = callback
+
+    @staticmethod
+    def ApplyCalibration(values, calibType, params, rawValues, refValues):
+        """
+        Applies a calibration to a sequence of values, using the batch handler
+        registered for the calibration type when available, and the single-value
+        handler otherwise. Values are returned unchanged when no handler is
+        registered for the calibration type.
+
+        @param values : a list, array('d') or NumPy array of raw values
+        @param calibType : the calibration type
+        @param params : the calibration parameters
+        @param rawValues : the raw values of the calibration points
+        @param refValues : the reference values of the calibration points
+
+        @return the list of calibrated values (a NumPy array for NumPy input)
+        """
+        return YAPI._applyCalibration(YAPI._getCalibrationHandler(calibType), values,
+                                      calibType, params, rawValues, refValues)
+
+    @staticmethod
+    def _applyCalibration(calhdl, values, calibType, params, rawValues, refValues):
+        batch = YAPI._BatchCalibHandlers.get(str(calibType))
+        if batch is not None:
+            return batch(values, calibType, params, rawValues, refValues)
+        if calhdl is None:
+            return values
+        # invalid (NaN) values are left as is
+        return [v if v != v else calhdl(v, calibType, params, rawValues, refValues) for v in values]
+
+    # noinspection PyUnusedLocal
+    @staticmethod
+    def LinearCalibrationBatchHandler(values, calibType, params, rawValues, refValues):
+        """
+        Batch version of LinearCalibrationHandler(). The interpolation segment of
+        each value is found by bisection (numpy.searchsorted for NumPy arrays)
+        instead of a linear search, with the same results.
+        """
+        if calibType < YAPI.YOCTO_CALIB_TYPE_OFS:
+            npt = calibType % 10
+            if npt > len(rawValues):
+                npt = len(rawValues)
+            if npt > len(refValues):
+                npt = len(refValues)
+        else:
+            npt = len(refValues)
+        if npt < 1:
+            npt = 1
+        raw = list(rawValues[:npt])
+        adjs = [refValues[k] - raw[k] for k in range(npt)]
+        for k in range(1, npt):
+            if raw[k] <= raw[k - 1]:
+                # points not sorted: only the linear search gives the same results
+                handler = YAPI.LinearCalibrationHandler
+                return [handler(v, calibType, params, rawValues, refValues) for v in values]
+        last = npt - 1
+        if hasattr(values, "dtype"):
+            import numpy
+            rawArr = numpy.array(raw)
+            adjArr = numpy.array(adjs)
+            idx = numpy.searchsorted(rawArr[:last], values, side="left")
+            x = rawArr[idx]
+            adj = adjArr[idx]
+            prev = numpy.maximum(idx - 1, 0)
+            x2 = rawArr[prev]
+            adj2 = adjArr[prev]
+            interp = (idx > 0) & (values < x)
+            with numpy.errstate(divide="ignore", invalid="ignore"):
+                adj = numpy.where(interp, adj2 + (adj - adj2) * (values - x2) / (x - x2), adj)
+            return values + adj
+        bisect_left = bisect.bisect_left
+        adj0 = adjs[0]
+        res = []
+        append = res.append
+        for v in values:
+            i = bisect_left(raw, v, 0, last)
+            if i == 0:
+                append(v + adj0)
+            elif v < raw[i]:
+                x2 = raw[i - 1]
+                adj2 = adjs[i - 1]
+                append(v + (adj2 + (adjs[i] - adj2) * (v - x2) / (raw[i] - x2)))
+            else:
+                append(v + adjs[i])
+        return res
 
     # noinspection PyUnusedLocal
     @staticmethod
@@ -2431,6 +3279,8 @@ class YAPI:
     @staticmethod
     def native_yDeviceRemovalCallback(d):
         global yRemovalFct
+        YDevice.UnplugDevice(d)
+        YFunction._InvalidateCallbackIndexes()
         infos = YAPI.emptyDeviceSt()
         errmsgRef = YRefParam()
         if yRemovalFct is None:
@@ -2441,7 +3291,7 @@ class YAPI:
         modul = YModule.FindModule((infos.serial).decode(YAPI.DefaultEncoding) + ".module")
         ev = YAPI._Event()
         ev.setRemoval(modul)
-        YAPI._PlugEvents.append(ev)
+        YAPI._queuePlugEvent(ev)
         return 0
 
     @staticmethod
@@ -2553,6 +3403,7 @@ class YAPI:
                 return YAPI.VERSION_MISMATCH
 
         YAPI.pymodule_initialization()
+        _yCreateNativeAnchors()
 
         # noinspection PyUnresolvedReferences
         res = YAPI._yapiInitAPI(mode, errmsg_buffer)
@@ -2584,7 +3435,9 @@ class YAPI:
 
         for i in range(21):
             YAPI.RegisterCalibrationHandler(i, YAPI.LinearCalibrationHandler)
+            YAPI.RegisterBatchCalibrationHandler(i, YAPI.LinearCalibrationBatchHandler)
         YAPI.RegisterCalibrationHandler(YAPI.YOCTO_CALIB_TYPE_OFS, YAPI.LinearCalibrationHandler)
+        YAPI.RegisterBatchCalibrationHandler(YAPI.YOCTO_CALIB_TYPE_OFS, YAPI.LinearCalibrationBatchHandler)
         YAPI._apiInitialized = True
         return res
 
@@ -2611,6 +3464,8 @@ class YAPI:
         yFreeAPI(), or your program will crash.
         """
         if YAPI._apiInitialized:
+            YAPI.StopEventPump()
+            YAPI._stopRefreshWorker()
             # noinspection PyUnresolvedReferences
             YAPI._yapiFreeAPI()
             YAPI.pymodule_cleanup()
@@ -2792,9 +3647,19 @@ class YAPI:
                     errmsg.value = (errmsg_buffer.value).decode(YAPI.DefaultEncoding)
         while len(YAPI._PlugEvents) > 0:
             YAPI.yapiLockDeviceCallBack(errmsg)
-            p = YAPI._PlugEvents.pop(0)
+            batch = collections.deque(YAPI._PlugEvents)
+            YAPI._PlugEvents.clear()
             YAPI.yapiUnlockDeviceCallBack(errmsg)
-            p.invokePlug()
+            try:
+                while batch:
+                    batch.popleft().invokePlug()
+            finally:
+                if batch:
+                    YAPI.yapiLockDeviceCallBack(errmsg)
+                    batch.extend(YAPI._PlugEvents)
+                    YAPI._PlugEvents.clear()
+                    YAPI._PlugEvents.extend(batch)
+                    YAPI.yapiUnlockDeviceCallBack(errmsg)
         return res
 
     @staticmethod
@@ -2946,9 +3811,14 @@ class YAPI:
 
     @staticmethod
     def pymodule_cleanup():
-        del YAPI.YDevice_devCache[:]
-        del YAPI._PlugEvents[:]
-        del YAPI._DataEvents[:]
+        YAPI.YDevice_devCache.clear()
+        pending = list(YAPI._pendingRequests.values())
+        YAPI._pendingRequests.clear()
+        for future in pending:
+            future.set_exception(YAPI.YAPI_Exception(YAPI.NOT_INITIALIZED, "API freed before request completion"))
+        YAPI._PlugEvents.clear()
+        YAPI._DataEvents.clear()
+        YAPI._PendingValueEvents.clear()
         YFunction._CalibHandlers.clear()
 
     @staticmethod
@@ -3178,6 +4048,49 @@ class YFirmwareUpdate(object):
 #--- (end of generated code: YFirmwareUpdate functions)
 
 
+class _YStreamCache(object):
+    # SQLite store of the payload of closed datalogger streams,
+    # keyed by (serial, functionId, runNo, utcStamp)
+    def __init__(self, path):
+        import sqlite3
+        import threading
+        self._lock = threading.Lock()
+        self._sqlite = sqlite3
+        try:
+            self._db = sqlite3.connect(path, check_same_thread=False)
+            self._db.execute("CREATE TABLE IF NOT EXISTS streams (serial TEXT, functionId TEXT, "
+                             "runNo INTEGER, utcStamp INTEGER, data BLOB, "
+                             "PRIMARY KEY (serial, functionId, runNo, utcStamp))")
+            self._db.commit()
+        except sqlite3.Error as ex:
+            raise YAPI.YAPI_Exception(YAPI.IO_ERROR, "Cannot open stream cache " + str(path) + ": " + str(ex))
+
+    def get(self, key):
+        with self._lock:
+            row = self._db.execute("SELECT data FROM streams WHERE serial=? AND functionId=? AND runNo=? AND utcStamp=?",
+                                   key).fetchone()
+        if row is None:
+            return None
+        return bytearray(row[0])
+
+    def put(self, key, data):
+        if not isinstance(data, (bytes, bytearray)):
+            data = data.encode(YAPI.DefaultEncoding)
+        with self._lock:
+            self._db.execute("INSERT OR REPLACE INTO streams (serial, functionId, runNo, utcStamp, data) "
+                             "VALUES (?, ?, ?, ?, ?)", key + (self._sqlite.Binary(bytes(data)),))
+            self._db.commit()
+
+    def clear(self):
+        with self._lock:
+            self._db.execute("DELETE FROM streams")
+            self._db.commit()
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+
 # --- (generated code: YDataStream class start)
 #noinspection PyProtectedMember
 class YDataStream(object):
@@ -3200,6 +4113,102 @@ class YDataStream(object):
     DATA_INVALID = YAPI.INVALID_DOUBLE
     DURATION_INVALID = -1
 
+    # Decoded measures are kept by column, as one array('d') per column.
+    # The rows returned by get_dataRows() are only built when requested.
+    _columns = None
+    _rows = None
+    # serial number of the device, and whether the stream is in the stream cache
+    _cacheSerial = None
+    _inCache = False
+
+    def _cacheKey(self):
+        if self._cacheSerial is None:
+            try:
+                hwid = self._parent.get_hardwareId()
+            except YAPI_Exception:
+                return None
+            if hwid == YFunction.HARDWAREID_INVALID:
+                return None
+            self._cacheSerial = hwid.split(".")[0]
+        return self._cacheSerial, self._functionId, self._runNo, self._utcStamp
+
+    def _loadFromCache(self):
+        # load a closed stream from the stream cache (see YAPI.SetDataStreamCache)
+        cache = YAPI._streamCache
+        if cache is None or not self._isClosed:
+            return False
+        key = self._cacheKey()
+        if key is None:
+            return False
+        data = cache.get(key)
+        if data is None:
+            return False
+        self._inCache = True
+        self._parseStream(data)
+        return self._isLoaded
+
+    def _storeInCache(self, sdata):
+        cache = YAPI._streamCache
+        if cache is None or self._inCache or not self._isClosed:
+            return
+        key = self._cacheKey()
+        if key is not None:
+            cache.put(key, sdata)
+            self._inCache = True
+
+    def _get_values(self):
+        if self._rows is None:
+            if self._columns:
+                self._rows = [list(row) for row in zip(*self._columns)]
+            else:
+                self._rows = []
+        return self._rows
+
+    def _set_values(self, rows):
+        self._rows = rows
+        self._columns = None
+
+    _values = property(_get_values, _set_values)
+
+    def _getColumns(self):
+        # decoded columns, as array('d') objects (empty list if not loaded)
+        if self._columns is None:
+            rows = self._rows
+            if rows:
+                self._columns = [array.array('d', col) for col in zip(*rows)]
+            else:
+                return []
+        return self._columns
+
+    def _loadedRows(self):
+        # rows already decoded, without reloading the stream (see get_dataRows)
+        if self._rows is not None:
+            return self._rows
+        if self._columns:
+            return list(zip(*self._columns))
+        return []
+
+    def _releaseData(self):
+        # forget the decoded measures, they are decoded again when the stream is reloaded
+        self._columns = None
+        self._rows = None
+        self._isLoaded = False
+
+    def _rowCount(self):
+        if self._columns is not None:
+            if self._columns:
+                return len(self._columns[0])
+            return 0
+        if self._rows is None:
+            return 0
+        return len(self._rows)
+
+    def _calibrateColumn(self, values):
+        # apply the calibration to decoded values, in one call when a batch handler is available
+        if self._caltyp == 0 or self._calhdl is None:
+            return values
+        return YAPI._applyCalibration(self._calhdl, values, self._caltyp, self._calpar, self._calraw, self._calref)
+
     def __init__(self, parent, dataset=None, encoded=None):
         # --- (generated code: YDataStream attributes)
         self._parent = None
@@ -3316,9 +4325,7 @@ class YDataStream(object):
         return 0
 
     def _parseStream(self, sdata):
-        # idx
         udat = []
-        dat = []
         if self._isLoaded and not (self._isClosed):
             return YAPI.SUCCESS
         if len(sdata) == 0:
@@ -3326,33 +4333,35 @@ class YDataStream(object):
             return YAPI.SUCCESS
 
         udat = YAPI._decodeWords(self._parent._json_get_string(sdata))
-        del self._values[:]
-        idx = 0
+        # decode the whole stream column by column: each row is made of 6 words
+        # (avg low/high, min low/high, max low/high) or 2 words (avg low/high),
+        # 0xffff 0xffff marking an invalid row. The average is offset by 2^31,
+        # min and max are signed 32 bit values, all in thousandths.
+        nan = float('nan')
         if self._isAvg:
-            while idx + 3 < len(udat):
-                del dat[:]
-                if (udat[idx] == 65535) and (udat[idx + 1] == 65535):
-                    dat.append(float('nan'))
-                    dat.append(float('nan'))
-                    dat.append(float('nan'))
-                else:
-                    dat.append(self._decodeVal(udat[idx + 2] + (((udat[idx + 3]) << 16))))
-                    dat.append(self._decodeAvg(udat[idx] + ((((udat[idx + 1]) ^ 0x8000) << 16)), 1))
-                    dat.append(self._decodeVal(udat[idx + 4] + (((udat[idx + 5]) << 16))))
-                idx = idx + 6
-                self._values.append(dat[:])
+            n = len(udat) // 6
+            avgLow = udat[0:n * 6:6]
+            avgHigh = udat[1:n * 6:6]
+            avg = [nan if lo == 0xffff and hi == 0xffff else (lo + (hi << 16) - 0x80000000) / 1000.0
+                   for lo, hi in zip(avgLow, avgHigh)]
+            minv = [((lo + (hi << 16)) ^ 0x80000000) - 0x80000000
+                    for lo, hi in zip(udat[2:n * 6:6], udat[3:n * 6:6])]
+            maxv = [((lo + (hi << 16)) ^ 0x80000000) - 0x80000000
+                    for lo, hi in zip(udat[4:n * 6:6], udat[5:n * 6:6])]
+            minv = [nan if a != a else v / 1000.0 for a, v in zip(avg, minv)]
+            maxv = [nan if a != a else v / 1000.0 for a, v in zip(avg, maxv)]
+            columns = [self._calibrateColumn(minv), self._calibrateColumn(avg), self._calibrateColumn(maxv)]
         else:
-            while idx + 1 < len(udat):
-                del dat[:]
-                if (udat[idx] == 65535) and (udat[idx + 1] == 65535):
-                    dat.append(float('nan'))
-                else:
-                    dat.append(self._decodeAvg(udat[idx] + ((((udat[idx + 1]) ^ 0x8000) << 16)), 1))
-                self._values.append(dat[:])
-                idx = idx + 2
-
-        self._nRows = len(self._values)
+            n = len(udat) // 2
+            avg = [nan if lo == 0xffff and hi == 0xffff else (lo + (hi << 16) - 0x80000000) / 1000.0
+                   for lo, hi in zip(udat[0:n * 2:2], udat[1:n * 2:2])]
+            columns = [self._calibrateColumn(avg)]
+        self._columns = [array.array('d', col) for col in columns]
+        self._rows = None
+
+        self._nRows = n
         self._isLoaded = True
+        self._storeInCache(sdata)
         return YAPI.SUCCESS
 
     def _wasLoaded(self):
@@ -3374,6 +4383,8 @@ class YDataStream(object):
         return url
 
     def loadStream(self):
+        if self._loadFromCache():
+            return YAPI.SUCCESS
         return self._parseStream(self._parent._download(self._get_url()))
 
     def _decodeVal(self, w):
@@ -3586,7 +4597,7 @@ class YDataStream(object):
 
         On failure, throws an exception or returns an empty array.
         """
-        if (len(self._values) == 0) or not (self._isClosed):
+        if (self._rowCount() == 0) or not (self._isClosed):
             self.loadStream()
         return self._values
 
@@ -3607,13 +4618,14 @@ class YDataStream(object):
 
         On failure, throws an exception or returns YDataStream.DATA_INVALID.
         """
-        if (len(self._values) == 0) or not (self._isClosed):
+        if (self._rowCount() == 0) or not (self._isClosed):
             self.loadStream()
-        if row >= len(self._values):
+        if row >= self._rowCount():
             return YDataStream.DATA_INVALID
-        if col >= len(self._values[row]):
+        columns = self._getColumns()
+        if col >= len(columns):
             return YDataStream.DATA_INVALID
-        return self._values[row][col]
+        return columns[col][row]
 
 #--- (end of generated code: YDataStream implementation)
 # --- (generated code: YDataStream functions)
@@ -3634,6 +4646,9 @@ class YMeasure(object):
     #--- (end of generated code: YMeasure class start)
     # --- (generated code: YMeasure definitions)
     #--- (end of generated code: YMeasure definitions)
+    # datalogger downloads create millions of measures: no per-instance dict,
+    # and the datetime objects are only created on demand
+    __slots__ = ("_start", "_end", "_minVal", "_avgVal", "_maxVal")
 
     def __init__(self, start, end, minVal, avgVal, maxVal):
         # --- (generated code: YMeasure attributes)
@@ -3648,20 +4663,18 @@ class YMeasure(object):
         self._minVal = minVal
         self._avgVal = avgVal
         self._maxVal = maxVal
-        rounded = int(start * 100 + 0.5)
-        self._start_datetime = datetime.datetime.fromtimestamp(rounded / 100.0)
-        rounded = int(end * 100 + 0.5)
-        self._end_datetime = datetime.datetime.fromtimestamp(rounded / 100.0)
 
     def get_startTimeUTC_asDatetime(self):
         """
         """
-        return self._start_datetime
+        rounded = int(self._start * 100 + 0.5)
+        return datetime.datetime.fromtimestamp(rounded / 100.0)
 
     def get_endTimeUTC_asDatetime(self):
         """
         """
-        return self._end_datetime
+        rounded = int(self._end * 100 + 0.5)
+        return datetime.datetime.fromtimestamp(rounded / 100.0)
 
     # --- (generated code: YMeasure implementation)
     def get_startTimeUTC(self):
@@ -3765,6 +4778,13 @@ class YDataSet(object):
         self._summaryTotalTime = 0
         #--- (end of generated code: YDataSet attributes)
         self._summary = YMeasure(0, 0, 0, 0, 0)
+        self._prefetchDepth = 0
+        self._prefetchExecutor = None
+        self._prefetched = {}
+        self._timeIndex = None
+        # False while iterMeasuresArrays() loads the streams: processMore() then
+        # leaves self._measures empty
+        self._keepMeasures = True
         if unit is None:
             self._initFromJson(parent)
         else:
@@ -3820,9 +4840,308 @@ class YDataSet(object):
                 pass
             else:
                 self._streams.append(stream)
+        self._timeIndex = None
+        self._getTimeIndex()
         self._progress = 0
         return self.get_progress()
 
+    def _getTimeIndex(self):
+        # start times of the streams in milliseconds, sorted for bisection,
+        # with the position of each stream in self._streams
+        index = self._timeIndex
+        if index is None or len(index[1]) != len(self._streams):
+            entries = sorted((round(stream.get_realStartTimeUTC() * 1000), pos)
+                             for pos, stream in enumerate(self._streams))
+            index = ([entry[0] for entry in entries], [entry[1] for entry in entries])
+            self._timeIndex = index
+        return index
+
+    def get_measures_arrays(self, useNumpy=False):
+        """
+        Returns all measured values currently available for this DataSet,
+        as columns of floating-point numbers instead of a list of YMeasure
+        objects. The columns hold the same measures as get_measures(), in the
+        same order, and are built directly from the data streams already
+        loaded by loadMore().
+
+        @param useNumpy : True to get NumPy arrays (NumPy must be installed),
+                False to get array('d') objects from the standard library
+
+        @return a dictionary with the keys "startTimeUTC", "endTimeUTC", "minValue",
+                "averageValue" and "maxValue", each containing one value per measure
+
+        On failure, throws an exception.
+        """
+        return self._measuresArrays(self._streams[:max(self._progress, 0)], useNumpy)
+
+    def iterMeasures(self):
+        """
+        Loads the measures of this DataSet stream by stream, and yields them
+        one by one as YMeasure objects, in the same order as get_measures().
+        The measures of each stream are released as soon as they have been
+        yielded, so that the memory used does not depend on the length of the
+        time interval: once the iteration is done, get_measures() and
+        get_measures_arrays() only return the measures not yet consumed.
+        The summary and the preview are loaded as by loadMore(), and prefetching
+        (see set_prefetchDepth()) and the stream cache are used the same way.
+
+        @return a generator of YMeasure objects.
+
+        On failure, throws an exception.
+        """
+        # measures already loaded by loadMore() come first
+        for measure in self._takeLoadedMeasures():
+            yield measure
+        for stream in self._iterStreams():
+            for measure in self._measures:
+                yield measure
+            del self._measures[:]
+            stream._releaseData()
+
+    def iterMeasuresArrays(self, useNumpy=False):
+        """
+        Loads the measures of this DataSet stream by stream, and yields them
+        by chunks of one data stream, as columns of floating-point numbers
+        (see get_measures_arrays()). The measures of each stream are released
+        as soon as the chunk has been yielded, so that the memory used does not
+        depend on the length of the time interval. Streams without any valid
+        measure in the time interval are skipped.
+
+        @param useNumpy : True to get NumPy arrays (NumPy must be installed),
+                False to get array('d') objects from the standard library
+
+        @return a generator of dictionaries with the keys "startTimeUTC", "endTimeUTC",
+                "minValue", "averageValue" and "maxValue", each containing one value per measure
+
+        On failure, throws an exception.
+        """
+        if self._progress > 0:
+            # measures already loaded by loadMore() come first
+            chunk = self._measuresArrays(self._streams[:self._progress], useNumpy)
+            self._takeLoadedMeasures()
+            if len(chunk["averageValue"]) > 0:
+                yield chunk
+        self._keepMeasures = False
+        try:
+            for stream in self._iterStreams():
+                chunk = self._measuresArrays([stream], useNumpy)
+                stream._releaseData()
+                if len(chunk["averageValue"]) > 0:
+                    yield chunk
+        finally:
+            self._keepMeasures = True
+
+    def _takeLoadedMeasures(self):
+        # measures loaded by loadMore() before an iteration, the streams are released
+        res = self._measures
+        self._measures = []
+        for stream in self._streams[:max(self._progress, 0)]:
+            stream._releaseData()
+        return res
+
+    def _iterStreams(self):
+        # load the streams one by one, yielding each stream once processed by loadMore()
+        if self._progress < 0:
+            self._check(self.loadMore())
+            del self._measures[:]
+        while self._progress < len(self._streams):
+            idx = self._progress
+            self._check(self.loadMore())
+            yield self._streams[idx]
+
+    def _check(self, res):
+        if res < 0:
+            raise YAPI.YAPI_Exception(res, "Failed to load the measures of " + self._functionId)
+        return res
+
+    def _measuresArrays(self, streams, useNumpy):
+        if useNumpy:
+            try:
+                import numpy
+            except ImportError:
+                raise YAPI.YAPI_Exception(YAPI.NOT_SUPPORTED, "NumPy is not installed")
+            return self._numpyColumns(numpy, streams)
+        startCol = array.array('d')
+        endCol = array.array('d')
+        minCol = array.array('d')
+        avgCol = array.array('d')
+        maxCol = array.array('d')
+        startTimeMs = self._startTimeMs
+        endTimeMs = self._endTimeMs
+        isnan = math.isnan
+        for tim, fitv, itv, minv, avgv, maxv in self._loadedStreams(streams):
+            end_ = tim + fitv
+            for i in range(len(avgv)):
+                if end_ > startTimeMs and (endTimeMs == 0 or tim < endTimeMs) and not isnan(avgv[i]):
+                    startCol.append(tim / 1000)
+                    endCol.append(end_ / 1000)
+                    minCol.append(minv[i])
+                    avgCol.append(avgv[i])
+                    maxCol.append(maxv[i])
+                tim = end_
+                end_ = tim + itv
+        return {"startTimeUTC": startCol, "endTimeUTC": endCol, "minValue": minCol,
+                "averageValue": avgCol, "maxValue": maxCol}
+
+    def _numpyColumns(self, numpy, streams):
+        parts = []
+        for tim, fitv, itv, minv, avgv, maxv in self._loadedStreams(streams):
+            # array('d') columns are shared with NumPy without copy
+            minv = numpy.frombuffer(minv, dtype=numpy.float64)
+            avgv = numpy.frombuffer(avgv, dtype=numpy.float64)
+            maxv = numpy.frombuffer(maxv, dtype=numpy.float64)
+            ends = tim + fitv + itv * numpy.arange(len(avgv), dtype=numpy.float64)
+            starts = numpy.empty_like(ends)
+            starts[0] = tim
+            starts[1:] = ends[:-1]
+            keep = (ends > self._startTimeMs) & ~numpy.isnan(avgv)
+            if self._endTimeMs != 0:
+                keep &= starts < self._endTimeMs
+            parts.append((starts[keep] / 1000, ends[keep] / 1000, minv[keep], avgv[keep], maxv[keep]))
+        res = {}
+        for idx, key in enumerate(("startTimeUTC", "endTimeUTC", "minValue", "averageValue", "maxValue")):
+            if parts:
+                res[key] = numpy.concatenate([part[idx] for part in parts])
+            else:
+                res[key] = numpy.empty(0, dtype=numpy.float64)
+        return res
+
+    def set_prefetchDepth(self, depth):
+        """
+        Changes the number of data streams downloaded in advance while loading
+        the measures. When the depth is positive, each call to loadMore() starts
+        the download of the next streams in background threads, so that the
+        round-trip time to the device is paid only once for several streams.
+        Streams are still processed one by one and in order by loadMore(), and
+        get_progress() keeps reporting the streams actually processed.
+        Prefetching replaces the bulk preload of streams done by the device.
+
+        @param depth : the number of streams to download in advance (0 to disable prefetching)
+
+        @return YAPI.SUCCESS when the call succeeds.
+        """
+        if depth < 0:
+            depth = 0
+        if depth != self._prefetchDepth:
+            self._stopPrefetch()
+        self._prefetchDepth = depth
+        return YAPI.SUCCESS
+
+    def get_prefetchDepth(self):
+        """
+        Returns the number of data streams downloaded in advance while loading the measures.
+
+        @return an integer corresponding to the number of streams downloaded in advance (0 when disabled)
+        """
+        return self._prefetchDepth
+
+    def _schedulePrefetch(self):
+        if self._prefetchDepth <= 0:
+            return
+        if self._progress >= len(self._streams):
+            self._stopPrefetch()
+            return
+        if self._prefetchExecutor is None:
+            import concurrent.futures
+            self._prefetchExecutor = concurrent.futures.ThreadPoolExecutor(max_workers=self._prefetchDepth)
+        idx = max(self._progress, 0)
+        end = min(len(self._streams), idx + self._prefetchDepth)
+        while idx < end:
+            stream = self._streams[idx]
+            if not (stream._wasLoaded() or stream._loadFromCache()) and stream not in self._prefetched:
+                self._prefetched[stream] = self._prefetchExecutor.submit(self._parent._download, stream._get_url())
+            idx = idx + 1
+
+    def _stopPrefetch(self):
+        for future in self._prefetched.values():
+            future.cancel()
+        self._prefetched = {}
+        if self._prefetchExecutor is not None:
+            self._prefetchExecutor.shutdown(wait=False)
+            self._prefetchExecutor = None
+
+    def _processPrefetched(self, stream, url):
+        self._schedulePrefetch()
+        future = self._prefetched.pop(stream, None)
+        data = None
+        if future is not None:
+            try:
+                data = future.result()
+            except Exception:
+                # retry once, as done without prefetching
+                data = None
+        if data is None:
+            data = self._parent._download(url)
+        bulkLoad = self._bulkLoad
+        self._bulkLoad = 0
+        try:
+            res = self.processMore(self._progress, data)
+        finally:
+            self._bulkLoad = bulkLoad
+        self._schedulePrefetch()
+        return res
+
+    def _loadStreamRows(self, stream):
+        # make sure the rows of a stream are decoded, downloading it if needed
+        if stream._isLoaded and stream._isClosed:
+            return
+        if not stream._isLoaded and stream._loadFromCache():
+            return
+        url = stream._get_url()
+        try:
+            data = self._parent._download(url)
+        except YAPI_Exception:
+            data = self._parent._download(url)
+        # rows appended to an open stream since its last download are decoded again
+        stream._isLoaded = False
+        stream._parseStream(data)
+
+    def _streamMeasures(self, stream, firstRow):
+        # measures of the decoded rows of a stream, starting at a given row
+        # (timing as computed by processMore, invalid rows are skipped)
+        res = []
+        columns = stream._getColumns()
+        if len(columns) == 0:
+            return res
+        minv = columns[0]
+        avgv = columns[len(columns) // 2]
+        maxv = columns[-1]
+        tim = round(stream.get_realStartTimeUTC() * 1000)
+        fitv = round(stream.get_firstDataSamplesInterval() * 1000)
+        itv = round(stream.get_dataSamplesInterval() * 1000)
+        if fitv == 0:
+            fitv = itv
+        if tim < itv:
+            tim = itv
+        if firstRow > 0:
+            tim = tim + fitv + (firstRow - 1) * itv
+        end_ = tim + (fitv if firstRow == 0 else itv)
+        for i in range(firstRow, len(avgv)):
+            if not math.isnan(avgv[i]):
+                res.append(YMeasure(tim / 1000, end_ / 1000, minv[i], avgv[i], maxv[i]))
+            tim = end_
+            end_ = tim + itv
+        return res
+
+    def _loadedStreams(self, streams):
+        # streams already processed by loadMore(), with their timing and their
+        # min/avg/max columns, as computed by processMore()
+        for stream in streams:
+            columns = stream._getColumns()
+            if len(columns) == 0 or len(columns[0]) == 0:
+                continue
+            tim = round(stream.get_realStartTimeUTC() * 1000)
+            fitv = round(stream.get_firstDataSamplesInterval() * 1000)
+            itv = round(stream.get_dataSamplesInterval() * 1000)
+            if fitv == 0:
+                fitv = itv
+            if tim < itv:
+                tim = itv
+            if len(columns) > 2:
+                yield tim, fitv, itv, columns[0], columns[1], columns[2]
+            else:
+                yield tim, fitv, itv, columns[0], columns[0], columns[0]
+
     # --- (generated code: YDataSet implementation)
     def _get_calibration(self):
         return self._calib
@@ -3895,11 +5214,11 @@ class YDataSet(object):
             else:
                 # // stream that are partially in the dataset
                 # // we need to parse data to filter value outside the dataset
-                if not (y._wasLoaded()):
+                if not (y._wasLoaded() or y._loadFromCache()):
                     url = y._get_url()
                     data = self._parent._download(url)
                     y._parseStream(data)
-                dataRows = y.get_dataRows()
+                dataRows = y._loadedRows()
                 if len(dataRows) == 0:
                     return self.get_progress()
                 tim = streamStartTimeMs
@@ -4001,45 +5320,50 @@ class YDataSet(object):
             return self.loadSummary(data)
         stream = self._streams[self._progress]
         if not (stream._wasLoaded()):
-            stream._parseStream(data)
-        dataRows = stream.get_dataRows()
-        self._progress = self._progress + 1
-        if len(dataRows) == 0:
-            return self.get_progress()
-        tim = round(stream.get_realStartTimeUTC() * 1000)
-        fitv = round(stream.get_firstDataSamplesInterval() * 1000)
-        itv = round(stream.get_dataSamplesInterval() * 1000)
-        if fitv == 0:
-            fitv = itv
-        if tim < itv:
-            tim = itv
-        nCols = len(dataRows[0])
-        minCol = 0
-        if nCols > 2:
-            avgCol = 1
-        else:
-            avgCol = 0
-        if nCols > 2:
-            maxCol = 2
+            stream._parseStream(data)
+        self._progress = self._progress + 1
+        if not self._keepMeasures:
+            # iterMeasuresArrays() reads the measures from the stream columns
+            if stream._rowCount() == 0:
+                return self.get_progress()
         else:
-            maxCol = 0
-
-        firstMeasure = True
-        for y in dataRows:
-            if firstMeasure:
-                end_ = tim + fitv
-                firstMeasure = False
+            dataRows = stream._loadedRows()
+            if len(dataRows) == 0:
+                return self.get_progress()
+            tim = round(stream.get_realStartTimeUTC() * 1000)
+            fitv = round(stream.get_firstDataSamplesInterval() * 1000)
+            itv = round(stream.get_dataSamplesInterval() * 1000)
+            if fitv == 0:
+                fitv = itv
+            if tim < itv:
+                tim = itv
+            nCols = len(dataRows[0])
+            minCol = 0
+            if nCols > 2:
+                avgCol = 1
             else:
-                end_ = tim + itv
-            avgv = y[avgCol]
-            if (end_ > self._startTimeMs) and ((self._endTimeMs == 0) or (tim < self._endTimeMs)) and not (math.isnan(avgv)):
-                self._measures.append(YMeasure(tim / 1000, end_ / 1000, y[minCol], avgv, y[maxCol]))
-            tim = end_
+                avgCol = 0
+            if nCols > 2:
+                maxCol = 2
+            else:
+                maxCol = 0
+
+            firstMeasure = True
+            for y in dataRows:
+                if firstMeasure:
+                    end_ = tim + fitv
+                    firstMeasure = False
+                else:
+                    end_ = tim + itv
+                avgv = y[avgCol]
+                if (end_ > self._startTimeMs) and ((self._endTimeMs == 0) or (tim < self._endTimeMs)) and not (math.isnan(avgv)):
+                    self._measures.append(YMeasure(tim / 1000, end_ / 1000, y[minCol], avgv, y[maxCol]))
+                tim = end_
 
         # // Perform bulk preload to speed-up network transfer
         if (self._bulkLoad > 0) and (self._progress < len(self._streams)):
             stream = self._streams[self._progress]
-            if stream._wasLoaded():
+            if stream._wasLoaded() or stream._loadFromCache():
                 return self.get_progress()
             baseurl = stream._get_baseurl()
             url = stream._get_url()
@@ -4048,7 +5372,7 @@ class YDataSet(object):
             idx = self._progress + 1
             while (idx < len(self._streams)) and (len(suffixes) < self._bulkLoad):
                 stream = self._streams[idx]
-                if not (stream._wasLoaded()) and (stream._get_baseurl() == baseurl):
+                if not (stream._wasLoaded() or stream._loadFromCache()) and (stream._get_baseurl() == baseurl):
                     suffix = stream._get_urlsuffix()
                     suffixes.append(suffix)
                     url = url + "," + suffix
@@ -4186,14 +5510,19 @@ class YDataSet(object):
                 return 100
             else:
                 stream = self._streams[self._progress]
-                if stream._wasLoaded():
+                if stream._wasLoaded() or stream._loadFromCache():
                     # // Do not reload stream if it was already loaded
                     return self.processMore(self._progress, bytearray("", YAPI.DefaultEncoding))
                 url = stream._get_url()
+                if self._prefetchDepth > 0:
+                    return self._processPrefetched(stream, url)
         try:
-            return self.processMore(self._progress, self._parent._download(url))
+            res = self.processMore(self._progress, self._parent._download(url))
         except:
-            return self.processMore(self._progress, self._parent._download(url))
+            res = self.processMore(self._progress, self._parent._download(url))
+        # start downloading the first streams as soon as the summary is known
+        self._schedulePrefetch()
+        return res
 
     def get_summary(self):
         """
@@ -4261,9 +5590,11 @@ class YDataSet(object):
 
         startUtcMs = measure.get_startTimeUTC() * 1000
         stream = None
-        for y in self._streams:
-            if round(y.get_realStartTimeUTC() *1000) == startUtcMs:
-                stream = y
+        # last stream starting at this time, found by bisection
+        starts, positions = self._getTimeIndex()
+        idx = bisect.bisect_right(starts, startUtcMs) - 1
+        if idx >= 0 and starts[idx] == startUtcMs:
+            stream = self._streams[positions[idx]]
         if stream is None:
             return measures
         dataRows = stream.get_dataRows()
@@ -4351,8 +5682,157 @@ class YConsolidatedDataSet(object):
         self._nextidx = []
         self._nexttim = []
         #--- (end of generated code: YConsolidatedDataSet attributes)
+        # end times and average values of each sensor, used by nextRecords()
+        self._mergeColumns = None
         self.imm_init(start, end, sensorList)
 
+    def _initDatasets(self):
+        # retrieve the datasets, on the first call to nextRecord() or nextRecords()
+        if self._nsensors != -1:
+            return
+        self._nsensors = len(self._sensors)
+        del self._datasets[:]
+        del self._progresss[:]
+        del self._nextidx[:]
+        del self._nexttim[:]
+        for sensor in self._sensors:
+            self._datasets.append(sensor.get_recordedData(self._start, self._end))
+            self._progresss.append(0)
+            self._nextidx.append(0)
+            self._nexttim.append(0.0)
+
+    def loadAllMeasures(self, maxThreads=8):
+        """
+        Loads all measures of all sensors linked to this object, loading the
+        data loggers of several sensors in parallel. This method is called
+        automatically by nextRecords(), but can be called beforehand to
+        control the number of parallel downloads. Once loaded, the measures
+        are kept as columns of floating-point numbers, used by both nextRecord()
+        and nextRecords().
+
+        @param maxThreads : the maximal number of sensors loaded at the same time
+                (1 to load the sensors one after the other)
+
+        @return YAPI.SUCCESS when the call succeeds.
+
+        On failure, throws an exception or returns a negative error code.
+        """
+        self._initDatasets()
+        pending = [s for s in range(self._nsensors) if self._progresss[s] < 100]
+
+        def loadDataset(s):
+            # the merge columns are built from the stream columns, without YMeasure objects
+            dataset = self._datasets[s]
+            dataset._keepMeasures = False
+            try:
+                progress = 0
+                while 0 <= progress < 100:
+                    progress = dataset.loadMore()
+            finally:
+                dataset._keepMeasures = True
+            return progress
+
+        if maxThreads > 1 and len(pending) > 1:
+            import concurrent.futures
+            with concurrent.futures.ThreadPoolExecutor(max_workers=min(maxThreads, len(pending))) as executor:
+                list(executor.map(loadDataset, pending))
+        else:
+            for s in pending:
+                loadDataset(s)
+        # as in nextRecord(), a dataset that fails to load is considered complete
+        for s in pending:
+            self._progresss[s] = 100
+        if self._mergeColumns is None:
+            self._mergeColumns = []
+            for dataset in self._datasets:
+                # end times and average values, in the order of get_measures(), so that
+                # the indexes of the measures already returned by nextRecord() still apply
+                columns = dataset.get_measures_arrays()
+                self._mergeColumns.append((columns["endTimeUTC"], columns["averageValue"]))
+                # the columns replace the measures and the decoded streams
+                dataset._takeLoadedMeasures()
+        return YAPI.SUCCESS
+
+    def nextRecords(self, maxRecords, useNumpy=False):
+        """
+        Extracts the next data records from the data logger of all sensors linked to this
+        object, as columns of floating-point numbers. The records are the same as
+        those returned by successive calls to nextRecord(), and the two methods can
+        be mixed: the first column holds the timestamps of the records, and the
+        following columns the measured values of each sensor, NaN when a sensor
+        has no measure for a given timestamp. All measures are loaded by the first
+        call (see loadAllMeasures()).
+
+        @param maxRecords : the maximal number of records to extract
+        @param useNumpy : True to get NumPy arrays (NumPy must be installed),
+                False to get array('d') objects from the standard library
+
+        @return a list of columns, the timestamps followed by one column per sensor,
+                holding at most maxRecords values (empty columns once all records
+                have been extracted).
+
+        On failure, throws an exception.
+        """
+        if useNumpy:
+            try:
+                import numpy
+            except ImportError:
+                raise YAPI.YAPI_Exception(YAPI.NOT_SUPPORTED, "NumPy is not installed")
+        if self._mergeColumns is None:
+            res = self.loadAllMeasures()
+            if res < 0:
+                raise YAPI.YAPI_Exception(res, "Failed to load the measures")
+        # k-way merge of the measures of each sensor, by end time
+        heap = []
+        for s in range(self._nsensors):
+            idx = self._nextidx[s]
+            endCol = self._mergeColumns[s][0]
+            if idx < len(endCol):
+                heap.append((endCol[idx], s))
+        heapq.heapify(heap)
+        timCol = array.array('d')
+        valCols = [array.array('d') for s in range(self._nsensors)]
+        nan = float('nan')
+        nextidx = self._nextidx
+        count = 0
+        while heap and count < maxRecords:
+            tim = heap[0][0]
+            timCol.append(tim)
+            for col in valCols:
+                col.append(nan)
+            while heap and heap[0][0] == tim:
+                s = heap[0][1]
+                endCol, avgCol = self._mergeColumns[s]
+                idx = nextidx[s]
+                valCols[s][count] = avgCol[idx]
+                idx = idx + 1
+                nextidx[s] = idx
+                if idx < len(endCol):
+                    heapq.heapreplace(heap, (endCol[idx], s))
+                else:
+                    heapq.heappop(heap)
+            count = count + 1
+        # let nextRecord() find the next timestamps from the updated indexes
+        for s in range(self._nsensors):
+            self._nexttim[s] = 0.0
+        res = [timCol] + valCols
+        if useNumpy:
+            res = [numpy.frombuffer(col, dtype=numpy.float64) for col in res]
+        return res
+
+    def _nextMergedRecord(self, datarec):
+        # nextRecord() once the measures have been loaded by loadAllMeasures()
+        columns = self.nextRecords(1)
+        del datarec[:]
+        if len(columns[0]) == 0:
+            return 100
+        for col in columns:
+            datarec.append(col[0])
+        total = 0
+        for endCol, avgCol in self._mergeColumns:
+            total = total + len(endCol)
+        return min(99, int(sum(self._nextidx) * 100 / total))
+
     # --- (generated code: YConsolidatedDataSet implementation)
     def imm_init(self, startt, endt, sensorList):
         self._start = startt
@@ -4431,21 +5911,9 @@ class YConsolidatedDataSet(object):
         # //
         # // Ensure the dataset have been retrieved
         # //
-        if self._nsensors == -1:
-            self._nsensors = len(self._sensors)
-            del self._datasets[:]
-            del self._progresss[:]
-            del self._nextidx[:]
-            del self._nexttim[:]
-            s = 0
-            while s < self._nsensors:
-                sensor = self._sensors[s]
-                newdataset = sensor.get_recordedData(self._start, self._end)
-                self._datasets.append(newdataset)
-                self._progresss.append(0)
-                self._nextidx.append(0)
-                self._nexttim.append(0.0)
-                s = s + 1
+        self._initDatasets()
+        if self._mergeColumns is not None:
+            return self._nextMergedRecord(datarec)
         del datarec[:]
         # //
         # // Find next timestamp to process
@@ -4513,34 +5981,117 @@ class YConsolidatedDataSet(object):
 class YDevice:
     def __init__(self, devdesc):
         self._devdescr = devdesc
-        self._cacheStamp = datetime.datetime(year=1970, month=1, day=1)
+        self._cacheStamp = 0
         self._cacheJson = None
         self._functions = []
         self._rootdevice = ""
         self._subpath = ""
         self._subpathinit = False
+        # pending attribute changes of a transaction: funcid -> {attr: escaped value}
+        self._transaction = None
+        self._transactionFuncs = []
+        self._transactionDepth = 0
+        self._transactionOwner = None
+        # changed keys by function between the last two api.json loads (None after a full load)
+        self._cacheChanges = None
+
+    # longest request sent when committing a transaction, longer changes are split
+    _maxBatchRequestLen = 512
 
     def __del__(self):
         if self._cacheJson is not None:
             del self._cacheJson
         self._cacheJson = None
 
+    def _beginTransaction(self):
+        import threading
+        if self._transactionDepth > 0:
+            if self._transactionOwner is not threading.current_thread():
+                return YAPI.DEVICE_BUSY
+            self._transactionDepth += 1
+            return YAPI.SUCCESS
+        self._transaction = collections.OrderedDict()
+        self._transactionFuncs = []
+        self._transactionOwner = threading.current_thread()
+        self._transactionDepth = 1
+        return YAPI.SUCCESS
+
+    def _inTransaction(self):
+        if self._transactionDepth == 0:
+            return False
+        import threading
+        return self._transactionOwner is threading.current_thread()
+
+    def _queueAttr(self, func, funcid, attrname, newvalue):
+        changes = self._transaction.get(funcid)
+        if changes is None:
+            changes = collections.OrderedDict()
+            self._transaction[funcid] = changes
+        changes[attrname] = YFunction._escapeAttr(newvalue)
+        if func not in self._transactionFuncs:
+            self._transactionFuncs.append(func)
+        return YAPI.SUCCESS
+
+    def _endTransaction(self, commit, errmsgRef=None):
+        # returns the list of functions changed, or an error code
+        self._transactionDepth -= 1
+        if self._transactionDepth > 0:
+            return []
+        changes = self._transaction
+        funcs = self._transactionFuncs
+        self._transaction = None
+        self._transactionFuncs = []
+        self._transactionOwner = None
+        if not commit:
+            return []
+        # one request per function, unless its attributes do not fit in a single request
+        for funcid in changes:
+            base = "GET /api/" + funcid + "?"
+            request = base
+            for attrname in changes[funcid]:
+                param = attrname + "=" + changes[funcid][attrname] + "&"
+                if len(request) > len(base) and len(request) + len(param) > YDevice._maxBatchRequestLen:
+                    res = self._sendBatchRequest(request, errmsgRef)
+                    if YAPI.YISERR(res):
+                        return res
+                    request = base
+                request += param
+            res = self._sendBatchRequest(request, errmsgRef)
+            if YAPI.YISERR(res):
+                return res
+        # make sure that api.json is read again once for all functions
+        self._cacheStamp = YAPI.GetTickCount()
+        return funcs
+
+    def _sendBatchRequest(self, request, errmsgRef=None):
+        bufferRef = YRefParam()
+        res = self.HTTPRequest(request + ". \r\n\r\n", bufferRef, errmsgRef)
+        if YAPI.YISERR(res):
+            # make sure a device scan does not solve the issue
+            res = YAPI.yapiUpdateDeviceList(1, errmsgRef)
+            if YAPI.YISERR(res):
+                return res
+            res = self.HTTPRequest(request + ". \r\n\r\n", bufferRef, errmsgRef)
+        return res
+
     @staticmethod
     def getDevice(devdescr):
-        for idx in range(len(YAPI.YDevice_devCache)):
-            if YAPI.YDevice_devCache[idx]._devdescr == devdescr:
-                return YAPI.YDevice_devCache[idx]
-
-        dev = YDevice(devdescr)
-        YAPI.YDevice_devCache.append(dev)
+        dev = YAPI.YDevice_devCache.get(devdescr)
+        if dev is None:
+            dev = YDevice(devdescr)
+            YAPI.YDevice_devCache[devdescr] = dev
         return dev
 
     @staticmethod
     def PlugDevice(devdescr):
-        for idx in range(len(YAPI.YDevice_devCache)):
-            if YAPI.YDevice_devCache[idx]._devdescr == devdescr:
-                YAPI.YDevice_devCache[idx].clearCache()
-                YAPI.YDevice_devCache[idx]._subpathinit = False
+        dev = YAPI.YDevice_devCache.get(devdescr)
+        if dev is not None:
+            dev.clearCache()
+            dev._subpathinit = False
+
+    @staticmethod
+    def UnplugDevice(devdescr):
+        YAPI.YDevice_devCache.pop(devdescr, None)
 
     def _HTTPRequestPrepare(self, request):
         errbuf = ctypes.create_string_buffer(YAPI.YOCTO_ERRMSG_LEN)
@@ -4590,6 +6141,36 @@ class YDevice:
             return res
         return YAPI.SUCCESS
 
+    # noinspection PyUnresolvedReferences
+    def HTTPRequestFuture(self, request):
+        """
+        Sends an HTTP request to the device without waiting for the reply.
+
+        @param request : the HTTP request, as passed to HTTPRequest()
+
+        @return a concurrent.futures.Future object, resolved with the device
+                reply (bytearray) as soon as the request is completed, or
+                failed with a YAPI_Exception.
+        """
+        import concurrent.futures
+        future = concurrent.futures.Future()
+        errbuf = ctypes.create_string_buffer(YAPI.YOCTO_ERRMSG_LEN)
+        # invalidate cache
+        self._cacheStamp = YAPI.GetTickCount()
+        (res, newrequest) = self._HTTPRequestPrepare(request)
+        if YAPI.YISERR(res):
+            future.set_exception(YAPI.YAPI_Exception(res, newrequest))
+            return future
+        context = YAPI._newRequestContext(future)
+        _yCreateNativeAnchors()
+        res = YAPI._yapiHTTPRequestAsync(ctypes.create_string_buffer(self._rootdevice.encode("ASCII")),
+                                         ctypes.create_string_buffer(bytes(newrequest)),
+                                         native_yRequestAsyncAnchor, context, errbuf)
+        if YAPI.YISERR(res):
+            if YAPI._pendingRequests.pop(context, None) is not None:
+                future.set_exception(YAPI.YAPI_Exception(res, (errbuf.value).decode(YAPI.DefaultEncoding)))
+        return future
+
     # noinspection PyUnresolvedReferences,PyUnresolvedReferences
     def HTTPRequest(self, request, bufferRef, errmsgRef=None):
         (res, newrequest) = self._HTTPRequestPrepare(request)
@@ -4609,12 +6190,7 @@ class YDevice:
             if errmsgRef is not None:
                 errmsgRef.value = (errbuf.value).decode(YAPI.DefaultEncoding)
             return res
-        reply_size = neededsize_c.value
-        bb = bytearray()
-        # (xrange not supported in 2.5.x)
-        for i in range(reply_size):
-            bb.append(reply_c[i])
-        bufferRef.value = bb
+        bufferRef.value = YAPI._ptrToBytearray(reply_c, neededsize_c.value)
         res = YAPI._yapiHTTPRequestSyncDone(iohdl, errbuf)
         if YAPI.YISERR(res):
             if errmsgRef is not None:
@@ -4670,6 +6246,11 @@ class YDevice:
             if not YAPI.ExceptionsDisabled:
                 raise YAPI.YAPI_Exception(res, errmsgRef.value)
             return YAPI.IO_ERROR
+        # keep the objects of unchanged functions, and record what has changed
+        if self._cacheJson is not None:
+            self._cacheChanges = apires._diffFunctions(self._cacheJson)
+        else:
+            self._cacheChanges = None
         # store result in cache
         self._cacheJson = apires
         apiresRef.value = apires
@@ -4677,9 +6258,39 @@ class YDevice:
 
         return YAPI.SUCCESS
 
+    def requestFunctionAPI(self, funcid, apiresRef, errmsgRef=None):
+        # Loads the attributes of a single function (api/<funcid>.json), without
+        # using nor updating the device cache
+        http_data = YRefParam()
+        request = "GET /api/" + funcid + ".json \r\n\r\n"
+        res = self.HTTPRequest(request, http_data, errmsgRef)
+        if YAPI.YISERR(res):
+            # make sure a device scan does not solve the issue
+            res = YAPI.yapiUpdateDeviceList(1, errmsgRef)
+            if YAPI.YISERR(res):
+                return res
+            res = self.HTTPRequest(request, http_data, errmsgRef)
+            if YAPI.YISERR(res):
+                return res
+        buffer = (http_data.value).decode(YAPI.DefaultEncoding)
+        (httpcode, http_headerlen, errmsg) = YAPI.parseHTTP(buffer, 0, len(buffer))
+        if httpcode != 200:
+            if errmsgRef is not None:
+                errmsgRef.value = "Unexpected HTTP return code:%s" % httpcode
+            return YAPI.IO_ERROR
+        try:
+            node = YJSONObject(buffer, http_headerlen, len(buffer))
+            node.parse()
+        except YAPI_Exception as ex:
+            if errmsgRef is not None:
+                errmsgRef.value = "JSON error: " + ex.errorMessage
+            return YAPI.IO_ERROR
+        apiresRef.value = node
+        return YAPI.SUCCESS
+
     def clearCache(self):
         self._cacheJson = None
-        self._cacheStamp = datetime.datetime(year=1970, month=1, day=1)
+        self._cacheStamp = 0
 
     # noinspection PyTypeChecker,PyTypeChecker,PyTypeChecker
     def getFunctions(self, functionsRef, errmsgRef=None):
@@ -4706,26 +6317,39 @@ class YDevice:
 
 
 # - keeps a reference to our callbacks, to  protect them from GC
+# (created by InitAPI, the trampolines are not needed before the library is loaded)
+native_yLogFunctionAnchor = None
+native_yFunctionUpdateAnchor = None
+native_yTimedReportAnchor = None
+native_yDeviceArrivalAnchor = None
+native_yDeviceRemovalAnchor = None
+native_yDeviceChangeAnchor = None
+native_yDeviceConfigChangeAnchor = None
+native_yBeaconChangeCallbackAnchor = None
+native_yHubDiscoveryAnchor = None
+native_yDeviceLogAnchor = None
+native_yRequestAsyncAnchor = None
+
+
 # noinspection PyProtectedMember
-native_yLogFunctionAnchor = YAPI._yapiLogFunc(YAPI.native_yLogFunction)
-# noinspection PyProtectedMember
-native_yFunctionUpdateAnchor = YAPI._yapiFunctionUpdateFunc(YAPI.native_yFunctionUpdateCallback)
-# noinspection PyProtectedMember
-native_yTimedReportAnchor = YAPI._yapiTimedReportFunc(YAPI.native_yTimedReportCallback)
-# noinspection PyProtectedMember
-native_yDeviceArrivalAnchor = YAPI._yapiDeviceUpdateFunc(YAPI.native_yDeviceArrivalCallback)
-# noinspection PyProtectedMember
-native_yDeviceRemovalAnchor = YAPI._yapiDeviceUpdateFunc(YAPI.native_yDeviceRemovalCallback)
-# noinspection PyProtectedMember
-native_yDeviceChangeAnchor = YAPI._yapiDeviceUpdateFunc(YAPI.native_yDeviceChangeCallback)
-# noinspection PyProtectedMember
-native_yDeviceConfigChangeAnchor = YAPI._yapiDeviceUpdateFunc(YAPI.native_yDeviceConfigChangeCallback)
-# noinspection PyProtectedMember
-native_yBeaconChangeCallbackAnchor = YAPI._yapiBeaconUpdateFunc(YAPI.native_yBeaconChangeCallback)
-# noinspection PyProtectedMember
-native_yHubDiscoveryAnchor = YAPI._yapiHubDiscoveryCallback(YAPI.native_HubDiscoveryCallback)
-# noinspection PyProtectedMember
-native_yDeviceLogAnchor = YAPI._yapiDeviceLogCallback(YAPI.native_DeviceLogCallback)
+def _yCreateNativeAnchors():
+    global native_yLogFunctionAnchor, native_yFunctionUpdateAnchor, native_yTimedReportAnchor
+    global native_yDeviceArrivalAnchor, native_yDeviceRemovalAnchor, native_yDeviceChangeAnchor
+    global native_yDeviceConfigChangeAnchor, native_yBeaconChangeCallbackAnchor, native_yHubDiscoveryAnchor
+    global native_yDeviceLogAnchor, native_yRequestAsyncAnchor
+    if native_yLogFunctionAnchor is not None:
+        return
+    native_yLogFunctionAnchor = YAPI._yapiLogFunc(YAPI.native_yLogFunction)
+    native_yFunctionUpdateAnchor = YAPI._yapiFunctionUpdateFunc(YAPI.native_yFunctionUpdateCallback)
+    native_yTimedReportAnchor = YAPI._yapiTimedReportFunc(YAPI.native_yTimedReportCallback)
+    native_yDeviceArrivalAnchor = YAPI._yapiDeviceUpdateFunc(YAPI.native_yDeviceArrivalCallback)
+    native_yDeviceRemovalAnchor = YAPI._yapiDeviceUpdateFunc(YAPI.native_yDeviceRemovalCallback)
+    native_yDeviceChangeAnchor = YAPI._yapiDeviceUpdateFunc(YAPI.native_yDeviceChangeCallback)
+    native_yDeviceConfigChangeAnchor = YAPI._yapiDeviceUpdateFunc(YAPI.native_yDeviceConfigChangeCallback)
+    native_yBeaconChangeCallbackAnchor = YAPI._yapiBeaconUpdateFunc(YAPI.native_yBeaconChangeCallback)
+    native_yHubDiscoveryAnchor = YAPI._yapiHubDiscoveryCallback(YAPI.native_HubDiscoveryCallback)
+    native_yDeviceLogAnchor = YAPI._yapiDeviceLogCallback(YAPI.native_DeviceLogCallback)
+    native_yRequestAsyncAnchor = YAPI._yapiRequestAsyncCallback(YAPI.native_yRequestAsyncCallback)
 
 
 # --- (generated code: YHub class start)
@@ -4958,8 +6582,15 @@ class YFunction(object):
     """
     #--- (end of generated code: YFunction class start)
     _cache = {}
+    # load modes, see set_loadMode()
+    LOADMODE_DEVICE = 0
+    LOADMODE_FUNCTION = 1
     _FunctionCallbacks = []
     _TimedReportCallbackList = []
+    # function descriptor -> function indexes of the two lists above,
+    # rebuilt on first use after any change (None when invalid)
+    _FunctionCallbacksIndex = None
+    _TimedReportCallbackIndex = None
     _CalibHandlers = {}
 
     FUNCTIONDESCRIPTOR_INVALID = -1
@@ -4980,12 +6611,20 @@ class YFunction(object):
         self._userData = None
         self._genCallback = None
         self._dataStreams = dict()
+        self._lastParsedNode = None
+        self._changedAttributesCallback = None
+        self._loadMode = YFunction.LOADMODE_DEVICE
+        self._lastLoadTick = 0
+        self._loadExpiration = 0
+        if YAPI._cachePolicies and "_policyGettersInstalled" not in type(self).__dict__:
+            # class imported after the cache policies were set
+            YAPI._installPolicyGetters(type(self))
         # --- (generated code: YFunction attributes)
         self._callback = None
         self._logicalName = YFunction.LOGICALNAME_INVALID
         self._advertisedValue = YFunction.ADVERTISEDVALUE_INVALID
         self._valueCallbackFunction = None
-        self._cacheExpiration = datetime.datetime.fromtimestamp(86400)
+        self._cacheExpiration = 0
         self._serial = ''
         self._funId = ''
         self._hwId = ''
@@ -5016,6 +6655,7 @@ class YFunction(object):
             if func in YFunction._FunctionCallbacks:
                 index = YFunction._FunctionCallbacks.index(func)
                 del YFunction._FunctionCallbacks[index]
+        YFunction._FunctionCallbacksIndex = None
 
     @staticmethod
     def _UpdateTimedReportCallbackList(func, add):
@@ -5027,6 +6667,38 @@ class YFunction(object):
             if func in YFunction._TimedReportCallbackList:
                 index = YFunction._TimedReportCallbackList.index(func)
                 del YFunction._TimedReportCallbackList[index]
+        YFunction._TimedReportCallbackIndex = None
+
+    @staticmethod
+    def _InvalidateCallbackIndexes():
+        YFunction._FunctionCallbacksIndex = None
+        YFunction._TimedReportCallbackIndex = None
+
+    @staticmethod
+    def _BuildCallbackIndex(callbackList):
+        # the first registered function wins, as with the former linear scan
+        index = {}
+        for func in list(callbackList):
+            descriptor = func.get_functionDescriptor()
+            if descriptor != YFunction.FUNCTIONDESCRIPTOR_INVALID and descriptor not in index:
+                index[descriptor] = func
+        return index
+
+    @staticmethod
+    def _FindValueCallback(descriptor):
+        index = YFunction._FunctionCallbacksIndex
+        if index is None:
+            index = YFunction._BuildCallbackIndex(YFunction._FunctionCallbacks)
+            YFunction._FunctionCallbacksIndex = index
+        return index.get(descriptor)
+
+    @staticmethod
+    def _FindTimedReportCallback(descriptor):
+        index = YFunction._TimedReportCallbackIndex
+        if index is None:
+            index = YFunction._BuildCallbackIndex(YFunction._TimedReportCallbackList)
+            YFunction._TimedReportCallbackIndex = index
+        return index.get(descriptor)
 
     def _throw(self, errType, errorMessage):
         self._lastErrorType = errType
@@ -5045,7 +6717,9 @@ class YFunction(object):
         if YAPI.YISERR(tmp_fundescr):
             return tmp_fundescr
 
-        self._fundescr = tmp_fundescr
+        if self._fundescr != tmp_fundescr:
+            self._fundescr = tmp_fundescr
+            YFunction._InvalidateCallbackIndexes()
         fundescrRef.value = tmp_fundescr
         return YAPI.SUCCESS
 
@@ -5132,7 +6806,7 @@ class YFunction(object):
             ofs += 1
         return uchangeval
 
-    def _buildSetRequest(self, changeattr, changeval, requestRef, errmsgRef=None):
+    def _getFunctionIdForRequest(self, funcidRef, errmsgRef=None):
         fundescRef = YRefParam()
         funcid = ctypes.create_string_buffer(YAPI.YOCTO_FUNCTION_LEN)
         errbuff = ctypes.create_string_buffer(YAPI.YOCTO_ERRMSG_LEN)
@@ -5149,7 +6823,15 @@ class YFunction(object):
                 errmsgRef.value = (errbuff.value).decode(YAPI.DefaultEncoding)
             self._throw(res, errmsgRef.value)
             return res
-        requestRef.value = "GET /api/" + (funcid.value).decode(YAPI.DefaultEncoding) + "/"
+        funcidRef.value = (funcid.value).decode(YAPI.DefaultEncoding)
+        return YAPI.SUCCESS
+
+    def _buildSetRequest(self, changeattr, changeval, requestRef, errmsgRef=None):
+        funcidRef = YRefParam()
+        res = self._getFunctionIdForRequest(funcidRef, errmsgRef)
+        if YAPI.YISERR(res):
+            return res
+        requestRef.value = "GET /api/" + funcidRef.value + "/"
         if changeattr != "":
             requestRef.value += changeattr + "?" + changeattr + "=" + self._escapeAttr(changeval)
         requestRef.value += "&. \r\n\r\n"
@@ -5166,14 +6848,23 @@ class YFunction(object):
         requestRef = YRefParam()
         devRef = YRefParam()
 
-        #  Execute http request
-        res = self._buildSetRequest(attrname, newvalue, requestRef, errmsgRef)
+        # Get device Object
+        res = self._getDevice(devRef, errmsgRef)
         if YAPI.YISERR(res):
             self._throw(res, errmsgRef.value)
             return res
 
-        # Get device Object
-        res = self._getDevice(devRef, errmsgRef)
+        if devRef.value._inTransaction():
+            # sent later, together with the other changes of the transaction
+            funcidRef = YRefParam()
+            res = self._getFunctionIdForRequest(funcidRef, errmsgRef)
+            if YAPI.YISERR(res):
+                self._throw(res, errmsgRef.value)
+                return res
+            return devRef.value._queueAttr(self, funcidRef.value, attrname, newvalue)
+
+        #  Execute http request
+        res = self._buildSetRequest(attrname, newvalue, requestRef, errmsgRef)
         if YAPI.YISERR(res):
             self._throw(res, errmsgRef.value)
             return res
@@ -5191,9 +6882,150 @@ class YFunction(object):
                 self._throw(res, errmsgRef.value)
                 return res
 
-        if self._cacheExpiration != datetime.datetime.fromtimestamp(86400):
+        if self._cacheExpiration != 0:
+            self._cacheExpiration = YAPI.GetTickCount()
+
+        return YAPI.SUCCESS
+
+    def _requestFuture(self, request):
+        # asynchronous counterpart of _request(), the future fails on errors
+        import concurrent.futures
+        errmsgRef = YRefParam()
+        devRef = YRefParam()
+        res = self._getDevice(devRef, errmsgRef)
+        if YAPI.YISERR(res):
+            future = concurrent.futures.Future()
+            future.set_exception(YAPI.YAPI_Exception(res, errmsgRef.value))
+            return future
+        return devRef.value.HTTPRequestFuture(request)
+
+    def _setAttrFuture(self, attrname, newvalue):
+        import concurrent.futures
+        errmsgRef = YRefParam()
+        requestRef = YRefParam()
+        res = self._buildSetRequest(attrname, newvalue, requestRef, errmsgRef)
+        if YAPI.YISERR(res):
+            future = concurrent.futures.Future()
+            future.set_exception(YAPI.YAPI_Exception(res, errmsgRef.value))
+            return future
+        if self._cacheExpiration != 0:
             self._cacheExpiration = YAPI.GetTickCount()
+        return self._requestFuture(requestRef.value)
+
+    def setAttributeFuture(self, attrName, value):
+        """
+        Changes an attribute of the function without waiting for the device,
+        like the set_xxx() methods do, but provides the completion status of
+        the request. This makes it possible to pipeline many changes to
+        different devices from a single thread, and still check that each
+        one was acknowledged.
+
+        @param attrName : the name of the attribute, as in the REST API (eg. "logicalName")
+        @param value : a string with the new value of the attribute
+
+        @return a concurrent.futures.Future object, resolved with the device reply
+                (bytearray) when the device has acknowledged the change, or failed
+                with a YAPI_Exception.
+        """
+        return self._setAttrFuture(attrName, value)
+
+    class _Transaction(object):
+        # context manager returned by YFunction.transaction()
+        def __init__(self, func):
+            self._func = func
+
+        def __enter__(self):
+            self._func.beginTransaction()
+            return self._func
+
+        def __exit__(self, exc_type, exc_val, exc_tb):
+            if exc_type is None:
+                self._func.commitTransaction()
+            else:
+                self._func.abortTransaction()
+            return False
+
+    def transaction(self):
+        """
+        Returns a context manager grouping attribute changes, as in:
+
+            with relay.transaction():
+                relay.set_logicalName("pump")
+                relay.set_maxTimeOnStateA(5000)
+                relay.get_module().set_luminosity(20)
+
+        The changes are committed when the block ends normally, and discarded
+        if an exception is raised. See beginTransaction() for details.
+
+        @return a context manager object
+        """
+        return YFunction._Transaction(self)
+
+    def beginTransaction(self):
+        """
+        Starts collecting the attribute changes made to any function of the
+        device hosting this function, instead of sending each one of them as
+        a separate request. The changes made by the current thread are sent
+        when commitTransaction() is called, grouped by function, in as few
+        requests as possible. The attributes are then read again from the
+        device with a single api.json request. Transactions can be nested,
+        only the outermost commit sends the changes.
+
+        @return YAPI.SUCCESS when the call succeeds.
+
+        On failure, throws an exception or returns a negative error code.
+        """
+        devRef = YRefParam()
+        errmsgRef = YRefParam()
+        res = self._getDevice(devRef, errmsgRef)
+        if YAPI.YISERR(res):
+            self._throw(res, errmsgRef.value)
+            return res
+        res = devRef.value._beginTransaction()
+        if YAPI.YISERR(res):
+            self._throw(res, "A transaction is already in progress on this device in another thread")
+        return res
+
+    def commitTransaction(self):
+        """
+        Sends the attribute changes collected since beginTransaction(), and
+        reloads the attributes of the changed functions.
+
+        @return YAPI.SUCCESS when the call succeeds.
+
+        On failure, throws an exception or returns a negative error code.
+        """
+        return self._endTransaction(True)
+
+    def abortTransaction(self):
+        """
+        Discards the attribute changes collected since beginTransaction().
+
+        @return YAPI.SUCCESS when the call succeeds.
+
+        On failure, throws an exception or returns a negative error code.
+        """
+        return self._endTransaction(False)
 
+    def _endTransaction(self, commit):
+        devRef = YRefParam()
+        errmsgRef = YRefParam()
+        res = self._getDevice(devRef, errmsgRef)
+        if YAPI.YISERR(res):
+            self._throw(res, errmsgRef.value)
+            return res
+        if not devRef.value._inTransaction():
+            self._throw(YAPI.INVALID_ARGUMENT, "No transaction in progress")
+            return YAPI.INVALID_ARGUMENT
+        funcs = devRef.value._endTransaction(commit, errmsgRef)
+        if not isinstance(funcs, list):
+            self._throw(funcs, errmsgRef.value)
+            return funcs
+        for func in funcs:
+            # all functions share the api.json loaded by the first one
+            res = func.load(YAPI._yapiContext.GetCacheValidity())
+            if YAPI.YISERR(res):
+                return res
         return YAPI.SUCCESS
 
     def _request(self, request):
@@ -5239,6 +7071,7 @@ class YFunction(object):
         body += "Content-Transfer-Encoding: binary\r\n\r\n"
         content = self.any_type_to_bytearray(content)
         body = body.encode("ASCII") + content
+        import random
         boundary = "Zz%06xzZ" % (random.randint(0, 0xffffff))
         request = "POST /upload.html HTTP/1.1\r\n"
         request += "Content-Type: multipart/form-data, boundary=" + boundary + "\r\n"
@@ -5267,15 +7100,8 @@ class YFunction(object):
         return self._strip_http_header(result_buffer)
 
     def _strip_http_header(self, result_buffer):
-        found = 0
-        while found <= len(result_buffer) - 4:
-            if result_buffer[found] == 13 \
-                    and result_buffer[found + 1] == 10 \
-                    and result_buffer[found + 2] == 13 \
-                    and result_buffer[found + 3] == 10:
-                break
-            found += 1
-        if found > len(result_buffer) - 4:
+        found = result_buffer.find(b"\r\n\r\n")
+        if found < 0:
             self._throw(YAPI.IO_ERROR, "http request failed")
             return ''
         return result_buffer[found + 4:]
@@ -5322,14 +7148,12 @@ class YFunction(object):
         errbuf = ctypes.create_string_buffer(YAPI.YOCTO_ERRMSG_LEN)
         ba = bytearray(path,YAPI.DefaultEncoding)
         path_data = ctypes.create_string_buffer(bytes(ba))
-        json_data = ctypes.create_string_buffer(bytes(json))
+        # bytes objects are passed to the native code as-is, without an extra copy
+        json_data = bytes(json)
         reply_c = POINTER(ctypes.c_ubyte)()
         res = YAPI._yapiJsonGetPath(path_data, json_data, len(json), ctypes.byref(reply_c), errbuf)
         if res > 0:
-            bb = bytearray()
-            # (xrange not supported in 2.5.x)
-            for i in range(res):
-                bb.append(reply_c[i])
+            bb = YAPI._ptrToBytearray(reply_c, res)
             YAPI._yapiFreeMem(reply_c)
             return bb
         return bytearray()
@@ -5773,7 +7597,37 @@ class YFunction(object):
             return False
         return True
 
-    def load(self, msValidity):
+    def set_loadMode(self, loadMode):
+        """
+        Selects how the attributes of the function are loaded from the device.
+        By default (YFunction.LOADMODE_DEVICE), the whole device REST API
+        (api.json) is loaded and cached for all functions of the device.
+        With YFunction.LOADMODE_FUNCTION, only the attributes of this function
+        are loaded (api/<functionId>.json), which is much smaller on devices
+        hosting many functions, such as hubs. The device-wide cache is then
+        neither used nor updated.
+
+        @param loadMode : either YFunction.LOADMODE_DEVICE or YFunction.LOADMODE_FUNCTION
+
+        @return YAPI.SUCCESS when the call succeeds.
+
+        On failure, throws an exception or returns a negative error code.
+        """
+        if loadMode != YFunction.LOADMODE_DEVICE and loadMode != YFunction.LOADMODE_FUNCTION:
+            self._throw(YAPI.INVALID_ARGUMENT, "Invalid load mode")
+            return YAPI.INVALID_ARGUMENT
+        self._loadMode = loadMode
+        return YAPI.SUCCESS
+
+    def get_loadMode(self):
+        """
+        Returns how the attributes of the function are loaded from the device.
+
+        @return either YFunction.LOADMODE_DEVICE or YFunction.LOADMODE_FUNCTION
+        """
+        return self._loadMode
+
+    def load(self, msValidity, loadMode=None):
         """
         Preloads the function cache with a specified validity duration.
         By default, whenever accessing a device, all function attributes
@@ -5783,6 +7637,9 @@ class YFunction(object):
 
         @param msValidity : an integer corresponding to the validity attributed to the
                 loaded function parameters, in milliseconds
+        @param loadMode : YFunction.LOADMODE_DEVICE to load the whole device REST API,
+                YFunction.LOADMODE_FUNCTION to load only the attributes of this function,
+                or None to use the mode selected with set_loadMode()
 
         @return YAPI.SUCCESS when the call succeeds.
 
@@ -5796,17 +7653,19 @@ class YFunction(object):
         serialRef = YRefParam()
         funcNameRef = YRefParam()
         funcValRef = YRefParam()
-
+        if loadMode is None:
+            loadMode = self._loadMode
         # Resolve our reference to our device, load REST API
         res = self._getDevice(devRef, errmsgRef)
         if YAPI.YISERR(res):
             self._throw(res, errmsgRef.value)
             return res
 
-        res = devRef.value.requestAPI(apiresRef, errmsgRef)
-        if YAPI.YISERR(res):
-            self._throw(res, errmsgRef.value)
-            return res
+        if loadMode != YFunction.LOADMODE_FUNCTION:
+            res = devRef.value.requestAPI(apiresRef, errmsgRef)
+            if YAPI.YISERR(res):
+                self._throw(res, errmsgRef.value)
+                return res
 
         # Get our function Id
         fundescr = YAPI.yapiGetFunction(self._className, self._func, errmsgRef)
@@ -5818,21 +7677,60 @@ class YFunction(object):
         if YAPI.YISERR(res):
             self._throw(res, errmsgRef.value)
             return res
-        if type(msValidity) == type(int()):
-            msValidity = datetime.timedelta(milliseconds=msValidity)
-        self._cacheExpiration = YAPI.GetTickCount() + msValidity
         self._serial = str(serialRef.value)
         self._funId = str(funcIdRef.value)
         self._hwId = self._serial + '.' + self._funId
 
-        node = apiresRef.value.getYJSONObject(self._funId)
-        if node is None:
-            self._throw(YAPI.IO_ERROR, "unexpected JSON structure: missing function " + self._funId)
-            return YAPI.IO_ERROR
+        if loadMode == YFunction.LOADMODE_FUNCTION:
+            res = devRef.value.requestFunctionAPI(self._funId, apiresRef, errmsgRef)
+            if YAPI.YISERR(res):
+                self._throw(res, errmsgRef.value)
+                return res
+            node = apiresRef.value
+            if self._lastParsedNode is not None:
+                node._mergeUnchanged(self._lastParsedNode)
+        else:
+            node = apiresRef.value.getYJSONObject(self._funId)
+            if node is None:
+                self._throw(YAPI.IO_ERROR, "unexpected JSON structure: missing function " + self._funId)
+                return YAPI.IO_ERROR
+        self._lastLoadTick = YAPI.GetTickCount()
+        self._cacheExpiration = self._lastLoadTick + _yDurationMs(msValidity)
+        self._loadExpiration = self._cacheExpiration
 
-        self._parse(node)
+        prevNode = self._lastParsedNode
+        if node is prevNode:
+            # nothing has changed since the last time this function was parsed
+            return YAPI.SUCCESS
+        self._lastParsedNode = node
+        if prevNode is None:
+            changed = node._keys
+            self._parse(node)
+        else:
+            changed = node._changedKeys(prevNode)
+            subset = YJSONObject(None, 0, 0)
+            for key in changed:
+                subset._parsed[key] = node._parsed[key]
+                subset._keys.append(key)
+            self._parse(subset)
+        if self._changedAttributesCallback is not None and len(changed) > 0:
+            self._changedAttributesCallback(self, list(changed))
         return YAPI.SUCCESS
 
+    def registerChangedAttributesCallback(self, callback):
+        """
+        Registers a callback function invoked each time the attributes of the
+        function are reloaded from the device (by any get_xxx() method once the
+        cache has expired, or by load()) and some of them have changed.
+
+        @param callback : the callback function to call, or None to unregister a
+                previously registered callback. The callback function receives two
+                arguments: the function object, and the list of the names of the
+                changed attributes, as in the REST API.
+        @noreturn
+        """
+        self._changedAttributesCallback = callback
+
     def clearCache(self):
         """
         Invalidates the cache. Invalidates the cache of the function attributes. Forces the
@@ -5855,6 +7753,7 @@ class YFunction(object):
             return
         devRef.value.clearCache()
         self._cacheExpiration = YAPI.GetTickCount()
+        self._lastLoadTick = 0
 
     def get_module(self):
         """
@@ -6061,7 +7960,7 @@ class YModule(YFunction):
         On failure, throws an exception or returns YModule.PRODUCTNAME_INVALID.
         """
         # res
-        if self._cacheExpiration == datetime.datetime.fromtimestamp(86400):
+        if self._cacheExpiration == 0:
             if self.load(YAPI._yapiContext.GetCacheValidity()) != YAPI.SUCCESS:
                 return YModule.PRODUCTNAME_INVALID
         res = self._productName
@@ -6076,7 +7975,7 @@ class YModule(YFunction):
         On failure, throws an exception or returns YModule.SERIALNUMBER_INVALID.
         """
         # res
-        if self._cacheExpiration == datetime.datetime.fromtimestamp(86400):
+        if self._cacheExpiration == 0:
             if self.load(YAPI._yapiContext.GetCacheValidity()) != YAPI.SUCCESS:
                 return YModule.SERIALNUMBER_INVALID
         res = self._serialNumber
@@ -6091,7 +7990,7 @@ class YModule(YFunction):
         On failure, throws an exception or returns YModule.PRODUCTID_INVALID.
         """
         # res
-        if self._cacheExpiration == datetime.datetime.fromtimestamp(86400):
+        if self._cacheExpiration == 0:
             if self.load(YAPI._yapiContext.GetCacheValidity()) != YAPI.SUCCESS:
                 return YModule.PRODUCTID_INVALID
         res = self._productId
@@ -6107,7 +8006,7 @@ class YModule(YFunction):
         On failure, throws an exception or returns YModule.PRODUCTRELEASE_INVALID.
         """
         # res
-        if self._cacheExpiration == datetime.datetime.fromtimestamp(86400):
+        if self._cacheExpiration == 0:
             if self.load(YAPI._yapiContext.GetCacheValidity()) != YAPI.SUCCESS:
                 return YModule.PRODUCTRELEASE_INVALID
         res = self._productRelease
@@ -7723,6 +9622,80 @@ class YSensor(YFunction):
         self._calhdl = None
         #--- (end of generated code: YSensor attributes)
 
+    def syncRecordedData(self, checkpointFile, callback):
+        """
+        Retrieves the measures recorded by the data logger since the previous
+        synchronization, as saved in a checkpoint file. The checkpoint records
+        the run number and the start time of the latest stream synchronized,
+        and the number of rows of that stream already handed to the callback,
+        so that only the rows appended since then are reported.
+
+        The callback is invoked for each data stream holding new measures,
+        with two arguments: the sensor object and the list of new YMeasure
+        objects. The checkpoint file is updated after each invocation of the
+        callback, so that a synchronization interrupted by a network failure
+        resumes where it stopped. Measures are reported at least once: when
+        the synchronization is interrupted after the callback returned but
+        before the checkpoint was written, the same measures are reported
+        again by the next synchronization, so the callback must ignore the
+        measures whose startTimeUTC it has already stored.
+
+        @param checkpointFile : the name of the file holding the checkpoint
+                (JSON format), created on the first synchronization
+        @param callback : the function invoked with the new measures of each stream
+
+        @return the number of new measures reported, or a negative error code.
+
+        On failure, throws an exception or returns a negative error code.
+        """
+        hwid = self.get_hardwareId()
+        checkpoint = {"hardwareId": hwid, "runNo": 0, "utcStamp": 0, "rows": 0}
+        if os.path.exists(checkpointFile):
+            try:
+                with open(checkpointFile, "r") as f:
+                    checkpoint = json.load(f)
+            except (IOError, OSError, ValueError) as ex:
+                self._throw(YAPI.IO_ERROR, "Cannot read checkpoint " + checkpointFile + ": " + str(ex))
+                return YAPI.IO_ERROR
+            if checkpoint.get("hardwareId") != hwid:
+                self._throw(YAPI.INVALID_ARGUMENT, "Checkpoint " + checkpointFile + " belongs to " +
+                            str(checkpoint.get("hardwareId")))
+                return YAPI.INVALID_ARGUMENT
+        count = 0
+        try:
+            dataset = self.get_recordedData(checkpoint["utcStamp"], 0)
+            # load the list of streams only
+            dataset.loadMore()
+            for stream in dataset._streams:
+                firstRow = 0
+                if stream._runNo == checkpoint["runNo"] and stream._utcStamp == checkpoint["utcStamp"]:
+                    firstRow = checkpoint["rows"]
+                elif stream._runNo == checkpoint["runNo"] and stream._utcStamp < checkpoint["utcStamp"]:
+                    continue
+                if stream._isClosed and stream._nRows <= firstRow:
+                    # the header of a closed stream gives its final number of rows
+                    continue
+                dataset._loadStreamRows(stream)
+                rows = stream._rowCount()
+                if rows <= firstRow:
+                    continue
+                measures = dataset._streamMeasures(stream, firstRow)
+                if len(measures) > 0:
+                    callback(self, measures)
+                    count += len(measures)
+                checkpoint = {"hardwareId": hwid, "runNo": stream._runNo, "utcStamp": stream._utcStamp, "rows": rows}
+                tmpFile = checkpointFile + ".tmp"
+                with open(tmpFile, "w") as f:
+                    json.dump(checkpoint, f)
+                if hasattr(os, "replace"):
+                    os.replace(tmpFile, checkpointFile)
+                else:
+                    os.rename(tmpFile, checkpointFile)
+        except YAPI_Exception as ex:
+            self._throw(ex.errorType, ex.errorMessage)
+            return ex.errorType
+        return count
+
     # --- (generated code: YSensor implementation)
     def _parseAttr(self, json_val):
         if json_val.has("unit"):
@@ -8487,9 +10460,8 @@ class YSensor(YFunction):
             maxVal = maxRaw / 1000.0
             if self._caltyp != 0:
                 if self._calhdl is not None:
-                    avgVal = self._calhdl(avgVal, self._caltyp, self._calpar, self._calraw, self._calref)
-                    minVal = self._calhdl(minVal, self._caltyp, self._calpar, self._calraw, self._calref)
-                    maxVal = self._calhdl(maxVal, self._caltyp, self._calpar, self._calraw, self._calref)
+                    avgVal, minVal, maxVal = YAPI._applyCalibration(self._calhdl, [avgVal, minVal, maxVal], self._caltyp,
+                                                                    self._calpar, self._calraw, self._calref)
         return YMeasure(startTime, endTime, minVal, avgVal, maxVal)
 
     def _decodeVal(self, w):
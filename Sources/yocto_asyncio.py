@@ -0,0 +1,294 @@
+# -*- coding: utf-8 -*-
+#*********************************************************************
+#*
+#* $Id$
+#*
+#* asyncio integration layer for the Yoctopuce Python library
+#*
+#* - - - - - - - - - License information: - - - - - - - - -
+#*
+#*  Copyright (C) 2011 and beyond by Yoctopuce Sarl, Switzerland.
+#*
+#*  Yoctopuce Sarl (hereafter Licensor) grants to you a perpetual
+#*  non-exclusive license to use, modify, copy and integrate this
+#*  file into your software for the sole purpose of interfacing
+#*  with Yoctopuce products.
+#*
+#*  You may reproduce and distribute copies of this file in
+#*  source or object form, as long as the sole purpose of this
+#*  code is to interface with Yoctopuce products. You must retain
+#*  this notice in the distributed source file.
+#*
+#*  You should refer to Yoctopuce General Terms and Conditions
+#*  for additional information regarding your rights and
+#*  obligations.
+#*
+#*  THE SOFTWARE AND DOCUMENTATION ARE PROVIDED 'AS IS' WITHOUT
+#*  WARRANTY OF ANY KIND, EITHER EXPRESS OR IMPLIED, INCLUDING
+#*  WITHOUT LIMITATION, ANY WARRANTY OF MERCHANTABILITY, FITNESS
+#*  FOR A PARTICULAR PURPOSE, TITLE AND NON-INFRINGEMENT. IN NO
+#*  EVENT SHALL LICENSOR BE LIABLE FOR ANY INCIDENTAL, SPECIAL,
+#*  INDIRECT OR CONSEQUENTIAL DAMAGES, LOST PROFITS OR LOST DATA,
+#*  COST OF PROCUREMENT OF SUBSTITUTE GOODS, TECHNOLOGY OR
+#*  SERVICES, ANY CLAIMS BY THIRD PARTIES (INCLUDING BUT NOT
+#*  LIMITED TO ANY DEFENSE THEREOF), ANY CLAIMS FOR INDEMNITY OR
+#*  CONTRIBUTION, OR OTHER SIMILAR COSTS, WHETHER ASSERTED ON THE
+#*  BASIS OF CONTRACT, TORT (INCLUDING NEGLIGENCE), BREACH OF
+#*  WARRANTY, OR OTHERWISE.
+#*
+#*********************************************************************/
+
+# This module requires Python 3.6 or later (asynchronous generators).
+
+__docformat__ = 'restructuredtext en'
+import asyncio
+import concurrent.futures
+import ctypes
+import time
+from yocto_api import *
+
+
+class YAsyncAPI(object):
+    """
+    YAsyncAPI runs the Yoctopuce library on behalf of an asyncio event loop.
+    All library calls are made from a single worker thread, so that the
+    event loop is never blocked by USB or network I/O. An event pump task
+    waits for device notifications in the native library and dispatches
+    them with YAPI.HandleEvents(), so that no polling loop is needed in the
+    application. Value and timed report callbacks are delivered as
+    asynchronous iterators.
+
+    Typical use:
+
+        async with YAsyncAPI() as api:
+            await api.run(YAPI.RegisterHub, "usb")
+            sensor = api.wrap(YTemperature.FirstTemperature())
+            print(await sensor.get_currentValue())
+            async for value in api.values(sensor):
+                print(value)
+    """
+
+    def __init__(self, sliceMs=10, deviceListPeriodMs=0):
+        """
+        @param sliceMs : the longest time (in milliseconds) spent waiting for
+                notifications in the native library before handing the worker
+                thread to pending library calls.
+        @param deviceListPeriodMs : when positive, the event pump also calls
+                YAPI.UpdateDeviceList() with this period (in milliseconds), to
+                detect device arrivals and removals.
+        """
+        self._sliceMs = sliceMs
+        self._deviceListPeriodMs = deviceListPeriodMs
+        self._nextDeviceList = 0
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        self._loop = None
+        self._task = None
+        self._running = False
+        self._lastErrorType = YAPI.SUCCESS
+        self._lastErrorMsg = ""
+
+    async def __aenter__(self):
+        self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.stop()
+
+    def start(self):
+        """
+        Starts the event pump task on the running event loop.
+        """
+        if self._task is not None:
+            return
+        self._loop = asyncio.get_event_loop()
+        self._running = True
+        self._task = asyncio.ensure_future(self._pump())
+
+    async def stop(self):
+        """
+        Stops the event pump task and waits for its termination.
+        Library calls remain possible with run() after the pump is stopped.
+        """
+        self._running = False
+        if self._task is not None:
+            await self._task
+            self._task = None
+
+    async def close(self):
+        """
+        Stops the event pump and frees the worker thread.
+        """
+        await self.stop()
+        self._executor.shutdown(wait=True)
+
+    def get_errorType(self):
+        """
+        Returns the error code of the latest error reported by the event pump.
+
+        @return a number corresponding to the code of the latest error reported by the event pump
+        """
+        return self._lastErrorType
+
+    def get_errorMessage(self):
+        """
+        Returns the error message of the latest error reported by the event pump.
+
+        @return a string corresponding to the latest error message reported by the event pump
+        """
+        return self._lastErrorMsg
+
+    def _pumpSlice(self):
+        # runs in the worker thread: wait for notifications, then dispatch them
+        errmsg = YRefParam()
+        errBuffer = ctypes.create_string_buffer(YAPI.YOCTO_ERRMSG_LEN)
+        if not YAPI._apiInitialized:
+            time.sleep(self._sliceMs / 1000.0)
+            return YAPI.SUCCESS, ""
+        if self._deviceListPeriodMs > 0 and YAPI.GetTickCount() >= self._nextDeviceList:
+            self._nextDeviceList = YAPI.GetTickCount() + self._deviceListPeriodMs
+            res = YAPI.UpdateDeviceList(errmsg)
+            if YAPI.YISERR(res):
+                return res, errmsg.value
+        res = YAPI._yapiSleep(self._sliceMs, errBuffer)
+        if YAPI.YISERR(res):
+            return res, (errBuffer.value).decode(YAPI.DefaultEncoding)
+        res = YAPI.HandleEvents(errmsg)
+        if YAPI.YISERR(res):
+            return res, errmsg.value
+        return YAPI.SUCCESS, ""
+
+    async def _pump(self):
+        while self._running:
+            try:
+                res, errmsg = await self._loop.run_in_executor(self._executor, self._pumpSlice)
+            except YAPI_Exception as ex:
+                res, errmsg = ex.errorType, ex.errorMessage
+            if YAPI.YISERR(res):
+                self._lastErrorType = res
+                self._lastErrorMsg = errmsg
+                # do not spin on a persistent error (eg. hub unreachable)
+                await asyncio.sleep(self._sliceMs / 1000.0)
+
+    async def run(self, fn, *args, **kwargs):
+        """
+        Calls any function of the library from the worker thread, and
+        returns its result without blocking the event loop.
+
+        @param fn : the function or method to call
+        @param args : the arguments to pass to the function
+
+        @return the value returned by the function
+        """
+        loop = self._eventLoop()
+        if kwargs:
+            return await loop.run_in_executor(self._executor, lambda: fn(*args, **kwargs))
+        return await loop.run_in_executor(self._executor, fn, *args)
+
+    def _eventLoop(self):
+        # the loop of start(), or the running loop when start() has not been called
+        if self._loop is None:
+            return asyncio.get_event_loop()
+        return self._loop
+
+    def wrap(self, func):
+        """
+        Returns an awaitable proxy for a YFunction object, so that its
+        methods (load(), get_xxx(), set_xxx(), ...) can be awaited.
+
+        @param func : a YFunction object (or any of its subclasses)
+
+        @return a YAsyncFunction object
+        """
+        return YAsyncFunction(self, func)
+
+    def _offer(self, queue, item):
+        # runs in the event loop: keep the most recent items if the consumer lags behind
+        if queue.full():
+            queue.get_nowait()
+        queue.put_nowait(item)
+
+    async def values(self, func, maxsize=0):
+        """
+        Asynchronous iterator on the values notified by a function.
+        The value callback of the function is registered when the iteration
+        starts, and unregistered when the iteration ends. Only one iterator
+        (or value callback) can be active for a given function.
+
+        @param func : a YFunction or YAsyncFunction object
+        @param maxsize : the maximal number of values kept while the consumer is busy,
+                the oldest values are dropped first (0 for no limit)
+
+        @return an asynchronous iterator yielding the values, as strings
+        """
+        func = getattr(func, "_func", func)
+        queue = asyncio.Queue(maxsize)
+        loop = self._eventLoop()
+
+        def valueCallback(fct, value):
+            loop.call_soon_threadsafe(self._offer, queue, value)
+
+        await self.run(func.registerValueCallback, valueCallback)
+        try:
+            while True:
+                yield await queue.get()
+        finally:
+            await self.run(func.registerValueCallback, None)
+
+    async def timedReports(self, sensor, maxsize=0):
+        """
+        Asynchronous iterator on the timed reports of a sensor.
+        The timed report callback of the sensor is registered when the
+        iteration starts, and unregistered when the iteration ends.
+
+        @param sensor : a YSensor or YAsyncFunction object
+        @param maxsize : the maximal number of measures kept while the consumer is busy,
+                the oldest measures are dropped first (0 for no limit)
+
+        @return an asynchronous iterator yielding YMeasure objects
+        """
+        sensor = getattr(sensor, "_func", sensor)
+        queue = asyncio.Queue(maxsize)
+        loop = self._eventLoop()
+
+        def timedReportCallback(fct, measure):
+            loop.call_soon_threadsafe(self._offer, queue, measure)
+
+        await self.run(sensor.registerTimedReportCallback, timedReportCallback)
+        try:
+            while True:
+                yield await queue.get()
+        finally:
+            await self.run(sensor.registerTimedReportCallback, None)
+
+
+class YAsyncFunction(object):
+    """
+    Awaitable proxy for a YFunction object, created by YAsyncAPI.wrap().
+    Every method of the function returns a coroutine, run in the worker
+    thread of the YAsyncAPI object. Plain attributes are returned as is.
+    """
+
+    def __init__(self, api, func):
+        self._api = api
+        self._func = func
+
+    def get_function(self):
+        """
+        Returns the YFunction object wrapped by this proxy.
+
+        @return a YFunction object
+        """
+        return self._func
+
+    def __getattr__(self, name):
+        attr = getattr(self._func, name)
+        if not callable(attr):
+            return attr
+        api = self._api
+
+        async def call(*args, **kwargs):
+            return await api.run(attr, *args, **kwargs)
+
+        call.__name__ = name
+        call.__doc__ = attr.__doc__
+        return call
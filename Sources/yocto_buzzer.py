@@ -179,7 +179,7 @@ class YBuzzer(YFunction):
         On failure, throws an exception or returns YBuzzer.PLAYSEQMAXSIZE_INVALID.
         """
         # res
-        if self._cacheExpiration == datetime.datetime.fromtimestamp(86400):
+        if self._cacheExpiration == 0:
             if self.load(YAPI._yapiContext.GetCacheValidity()) != YAPI.SUCCESS:
                 return YBuzzer.PLAYSEQMAXSIZE_INVALID
         res = self._playSeqMaxSize
@@ -290,7 +290,7 @@ class YColorLed(YFunction):
         On failure, throws an exception or returns YColorLed.BLINKSEQMAXSIZE_INVALID.
         """
         # res
-        if self._cacheExpiration == datetime.datetime.fromtimestamp(86400):
+        if self._cacheExpiration == 0:
             if self.load(YAPI._yapiContext.GetCacheValidity()) != YAPI.SUCCESS:
                 return YColorLed.BLINKSEQMAXSIZE_INVALID
         res = self._blinkSeqMaxSize
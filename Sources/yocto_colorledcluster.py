@@ -180,7 +180,7 @@ class YColorLedCluster(YFunction):
         On failure, throws an exception or returns YColorLedCluster.MAXLEDCOUNT_INVALID.
         """
         # res
-        if self._cacheExpiration == datetime.datetime.fromtimestamp(86400):
+        if self._cacheExpiration == 0:
             if self.load(YAPI._yapiContext.GetCacheValidity()) != YAPI.SUCCESS:
                 return YColorLedCluster.MAXLEDCOUNT_INVALID
         res = self._maxLedCount
@@ -196,7 +196,7 @@ class YColorLedCluster(YFunction):
         On failure, throws an exception or returns YColorLedCluster.DYNAMICLEDCOUNT_INVALID.
         """
         # res
-        if self._cacheExpiration == datetime.datetime.fromtimestamp(86400):
+        if self._cacheExpiration == 0:
             if self.load(YAPI._yapiContext.GetCacheValidity()) != YAPI.SUCCESS:
                 return YColorLedCluster.DYNAMICLEDCOUNT_INVALID
         res = self._dynamicLedCount
@@ -211,7 +211,7 @@ class YColorLedCluster(YFunction):
         On failure, throws an exception or returns YColorLedCluster.BLINKSEQMAXCOUNT_INVALID.
         """
         # res
-        if self._cacheExpiration == datetime.datetime.fromtimestamp(86400):
+        if self._cacheExpiration == 0:
             if self.load(YAPI._yapiContext.GetCacheValidity()) != YAPI.SUCCESS:
                 return YColorLedCluster.BLINKSEQMAXCOUNT_INVALID
         res = self._blinkSeqMaxCount
@@ -226,7 +226,7 @@ class YColorLedCluster(YFunction):
         On failure, throws an exception or returns YColorLedCluster.BLINKSEQMAXSIZE_INVALID.
         """
         # res
-        if self._cacheExpiration == datetime.datetime.fromtimestamp(86400):
+        if self._cacheExpiration == 0:
             if self.load(YAPI._yapiContext.GetCacheValidity()) != YAPI.SUCCESS:
                 return YColorLedCluster.BLINKSEQMAXSIZE_INVALID
         res = self._blinkSeqMaxSize
@@ -282,7 +282,7 @@ class YDigitalIO(YFunction):
         On failure, throws an exception or returns YDigitalIO.PORTSIZE_INVALID.
         """
         # res
-        if self._cacheExpiration == datetime.datetime.fromtimestamp(86400):
+        if self._cacheExpiration == 0:
             if self.load(YAPI._yapiContext.GetCacheValidity()) != YAPI.SUCCESS:
                 return YDigitalIO.PORTSIZE_INVALID
         res = self._portSize
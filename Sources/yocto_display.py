@@ -757,7 +757,7 @@ class YDisplay(YFunction):
         On failure, throws an exception or returns YDisplay.DISPLAYWIDTH_INVALID.
         """
         # res
-        if self._cacheExpiration == datetime.datetime.fromtimestamp(86400):
+        if self._cacheExpiration == 0:
             if self.load(YAPI._yapiContext.GetCacheValidity()) != YAPI.SUCCESS:
                 return YDisplay.DISPLAYWIDTH_INVALID
         res = self._displayWidth
@@ -772,7 +772,7 @@ class YDisplay(YFunction):
         On failure, throws an exception or returns YDisplay.DISPLAYHEIGHT_INVALID.
         """
         # res
-        if self._cacheExpiration == datetime.datetime.fromtimestamp(86400):
+        if self._cacheExpiration == 0:
             if self.load(YAPI._yapiContext.GetCacheValidity()) != YAPI.SUCCESS:
                 return YDisplay.DISPLAYHEIGHT_INVALID
         res = self._displayHeight
@@ -788,7 +788,7 @@ class YDisplay(YFunction):
         On failure, throws an exception or returns YDisplay.DISPLAYTYPE_INVALID.
         """
         # res
-        if self._cacheExpiration == datetime.datetime.fromtimestamp(86400):
+        if self._cacheExpiration == 0:
             if self.load(YAPI._yapiContext.GetCacheValidity()) != YAPI.SUCCESS:
                 return YDisplay.DISPLAYTYPE_INVALID
         res = self._displayType
@@ -803,7 +803,7 @@ class YDisplay(YFunction):
         On failure, throws an exception or returns YDisplay.LAYERWIDTH_INVALID.
         """
         # res
-        if self._cacheExpiration == datetime.datetime.fromtimestamp(86400):
+        if self._cacheExpiration == 0:
             if self.load(YAPI._yapiContext.GetCacheValidity()) != YAPI.SUCCESS:
                 return YDisplay.LAYERWIDTH_INVALID
         res = self._layerWidth
@@ -818,7 +818,7 @@ class YDisplay(YFunction):
         On failure, throws an exception or returns YDisplay.LAYERHEIGHT_INVALID.
         """
         # res
-        if self._cacheExpiration == datetime.datetime.fromtimestamp(86400):
+        if self._cacheExpiration == 0:
             if self.load(YAPI._yapiContext.GetCacheValidity()) != YAPI.SUCCESS:
                 return YDisplay.LAYERHEIGHT_INVALID
         res = self._layerHeight
@@ -833,7 +833,7 @@ class YDisplay(YFunction):
         On failure, throws an exception or returns YDisplay.LAYERCOUNT_INVALID.
         """
         # res
-        if self._cacheExpiration == datetime.datetime.fromtimestamp(86400):
+        if self._cacheExpiration == 0:
             if self.load(YAPI._yapiContext.GetCacheValidity()) != YAPI.SUCCESS:
                 return YDisplay.LAYERCOUNT_INVALID
         res = self._layerCount
@@ -0,0 +1,276 @@
+# -*- coding: utf-8 -*-
+#*********************************************************************
+#*
+#* $Id$
+#*
+#* Export of data logger measures for the Yoctopuce Python library
+#*
+#* - - - - - - - - - License information: - - - - - - - - -
+#*
+#*  Copyright (C) 2011 and beyond by Yoctopuce Sarl, Switzerland.
+#*
+#*  Yoctopuce Sarl (hereafter Licensor) grants to you a perpetual
+#*  non-exclusive license to use, modify, copy and integrate this
+#*  file into your software for the sole purpose of interfacing
+#*  with Yoctopuce products.
+#*
+#*  You may reproduce and distribute copies of this file in
+#*  source or object form, as long as the sole purpose of this
+#*  code is to interface with Yoctopuce products. You must retain
+#*  this notice in the distributed source file.
+#*
+#*  You should refer to Yoctopuce General Terms and Conditions
+#*  for additional information regarding your rights and
+#*  obligations.
+#*
+#*  THE SOFTWARE AND DOCUMENTATION ARE PROVIDED 'AS IS' WITHOUT
+#*  WARRANTY OF ANY KIND, EITHER EXPRESS OR IMPLIED, INCLUDING
+#*  WITHOUT LIMITATION, ANY WARRANTY OF MERCHANTABILITY, FITNESS
+#*  FOR A PARTICULAR PURPOSE, TITLE AND NON-INFRINGEMENT. IN NO
+#*  EVENT SHALL LICENSOR BE LIABLE FOR ANY INCIDENTAL, SPECIAL,
+#*  INDIRECT OR CONSEQUENTIAL DAMAGES, LOST PROFITS OR LOST DATA,
+#*  COST OF PROCUREMENT OF SUBSTITUTE GOODS, TECHNOLOGY OR
+#*  SERVICES, ANY CLAIMS BY THIRD PARTIES (INCLUDING BUT NOT
+#*  LIMITED TO ANY DEFENSE THEREOF), ANY CLAIMS FOR INDEMNITY OR
+#*  CONTRIBUTION, OR OTHER SIMILAR COSTS, WHETHER ASSERTED ON THE
+#*  BASIS OF CONTRACT, TORT (INCLUDING NEGLIGENCE), BREACH OF
+#*  WARRANTY, OR OTHERWISE.
+#*
+#*********************************************************************/
+
+# The Arrow and Parquet formats require the pyarrow package.
+
+__docformat__ = 'restructuredtext en'
+import array
+import datetime
+import heapq
+import os
+import threading
+try:
+    import queue
+except ImportError:
+    import Queue as queue
+from yocto_api import *
+
+
+class _YCSVWriter(object):
+    # writes chunks of columns as CSV text, one write per chunk
+    def __init__(self, fileName, columnNames, timeColumns, separator, precision, isoTime):
+        self._file = open(fileName, "w")
+        # number of leading columns holding timestamps, written in ISO format
+        self._isoColumns = timeColumns if isoTime else 0
+        self._file.write(separator.join(columnNames) + "\n")
+        valueFormat = "%." + str(precision) + "f"
+        formats = ["%s"] * self._isoColumns + [valueFormat] * (len(columnNames) - self._isoColumns)
+        self._rowFormat = separator.join(formats) + "\n"
+
+    def write(self, columns):
+        if self._isoColumns > 0:
+            fromtimestamp = datetime.datetime.fromtimestamp
+            columns = ([[fromtimestamp(t).isoformat() for t in col] for col in columns[:self._isoColumns]] +
+                       list(columns[self._isoColumns:]))
+        self._file.write("".join(map(self._rowFormat.__mod__, zip(*columns))))
+
+    def close(self):
+        self._file.close()
+
+
+class _YArrowWriter(object):
+    # writes chunks of columns as record batches of an Arrow IPC or Parquet file
+    def __init__(self, fileName, columnNames, parquet):
+        try:
+            import pyarrow
+        except ImportError:
+            raise YAPI_Exception(YAPI.NOT_SUPPORTED, "pyarrow is not installed")
+        self._pyarrow = pyarrow
+        self._schema = pyarrow.schema([(name, pyarrow.float64()) for name in columnNames])
+        if parquet:
+            import pyarrow.parquet
+            self._writer = pyarrow.parquet.ParquetWriter(fileName, self._schema)
+        else:
+            import pyarrow.ipc
+            self._writer = pyarrow.ipc.new_file(fileName, self._schema)
+
+    def write(self, columns):
+        pyarrow = self._pyarrow
+        # array('d') columns are handed to Arrow without copy
+        arrays = [pyarrow.Array.from_buffers(pyarrow.float64(), len(col), [None, pyarrow.py_buffer(col)])
+                  for col in columns]
+        self._writer.write_table(pyarrow.Table.from_arrays(arrays, schema=self._schema))
+
+    def close(self):
+        self._writer.close()
+
+
+class YDataExporter(object):
+    """
+    YDataExporter writes the measures of a YDataSet or of a YConsolidatedDataSet
+    to a file, in CSV format, or in Apache Arrow or Parquet format when the
+    pyarrow package is installed. The measures are loaded stream by stream,
+    so that the memory used does not depend on the number of measures
+    exported, and handed in chunks to a background thread that formats and
+    writes them, so that loading from the data logger and writing to the
+    file overlap.
+
+    Typical use:
+
+        exporter = YDataExporter("measures.csv")
+        exporter.exportDataSet(sensor.get_recordedData(0, 0))
+    """
+
+    def __init__(self, fileName, fileFormat=None, separator=";", precision=3, isoTime=False, maxPendingChunks=4):
+        """
+        @param fileName : the name of the file to create (an existing file is replaced)
+        @param fileFormat : "csv", "arrow" or "parquet", or None to use the extension
+                of the file name (CSV when the extension is not known)
+        @param separator : the field separator of CSV files
+        @param precision : the number of decimals of the values in CSV files
+        @param isoTime : True to write the timestamps of CSV files in ISO 8601 format
+                (local time), False to write them as Unix timestamps
+        @param maxPendingChunks : the maximal number of chunks loaded but not yet written,
+                loading is suspended when this number is reached
+        """
+        if fileFormat is None:
+            ext = os.path.splitext(fileName)[1].lower()
+            if ext == ".parquet":
+                fileFormat = "parquet"
+            elif ext in (".arrow", ".feather"):
+                fileFormat = "arrow"
+            else:
+                fileFormat = "csv"
+        if fileFormat not in ("csv", "arrow", "parquet"):
+            raise YAPI_Exception(YAPI.INVALID_ARGUMENT, "Unsupported export format: " + str(fileFormat))
+        self._fileName = fileName
+        self._fileFormat = fileFormat
+        self._separator = separator
+        self._precision = precision
+        self._isoTime = isoTime
+        self._maxPendingChunks = maxPendingChunks
+
+    def exportDataSet(self, dataset, prefetchDepth=1):
+        """
+        Writes all measures of a dataset to the file, with the columns startTimeUTC,
+        endTimeUTC, minValue, averageValue and maxValue. The measures are loaded
+        using YDataSet.iterMeasuresArrays(), and are therefore released once written.
+
+        @param dataset : a YDataSet object, as returned by YSensor.get_recordedData()
+        @param prefetchDepth : the number of streams downloaded in advance
+                (see YDataSet.set_prefetchDepth())
+
+        @return the number of measures written.
+
+        On failure, throws an exception.
+        """
+        names = ["startTimeUTC", "endTimeUTC", "minValue", "averageValue", "maxValue"]
+        dataset.set_prefetchDepth(prefetchDepth)
+        return self._export(names, 2, ([chunk[name] for name in names] for chunk in dataset.iterMeasuresArrays()))
+
+    def exportConsolidatedDataSet(self, consolidated, chunkRecords=10000, prefetchDepth=1):
+        """
+        Writes all records of a consolidated dataset to the file, with the timestamp
+        of the records in the first column (timeUTC), followed by one column per
+        sensor, named by the hardware identifier of the sensor. The records are
+        the same as those returned by YConsolidatedDataSet.nextRecord(), but the
+        data loggers are read one stream of each sensor at a time, so that only
+        the streams being merged are kept in memory. All records are written,
+        whatever records have already been read from the consolidated dataset.
+
+        @param consolidated : a YConsolidatedDataSet object
+        @param chunkRecords : the number of records handed at once to the writer thread
+        @param prefetchDepth : the number of streams of each sensor downloaded in advance
+                (see YDataSet.set_prefetchDepth())
+
+        @return the number of records written.
+
+        On failure, throws an exception.
+        """
+        names = ["timeUTC"] + [sensor.get_hardwareId() for sensor in consolidated._sensors]
+        datasets = [sensor.get_recordedData(consolidated._start, consolidated._end)
+                    for sensor in consolidated._sensors]
+        for dataset in datasets:
+            dataset.set_prefetchDepth(prefetchDepth)
+        return self._export(names, 1, self._mergeRecords(datasets, chunkRecords))
+
+    def _mergeRecords(self, datasets, chunkRecords):
+        # k-way merge of the measures of the datasets by end time, as done by
+        # YConsolidatedDataSet.nextRecords(), loading the next stream of a
+        # dataset only once the measures of its current stream are merged
+        nsets = len(datasets)
+        chunkIters = [dataset.iterMeasuresArrays() for dataset in datasets]
+        endCols = [None] * nsets
+        avgCols = [None] * nsets
+        nextidx = [0] * nsets
+
+        def nextChunk(s):
+            for chunk in chunkIters[s]:
+                endCols[s] = chunk["endTimeUTC"]
+                avgCols[s] = chunk["averageValue"]
+                nextidx[s] = 0
+                return True
+            endCols[s] = avgCols[s] = None
+            return False
+
+        heap = [(endCols[s][0], s) for s in range(nsets) if nextChunk(s)]
+        heapq.heapify(heap)
+        nan = float('nan')
+        while heap:
+            timCol = array.array('d')
+            valCols = [array.array('d') for s in range(nsets)]
+            count = 0
+            while heap and count < chunkRecords:
+                tim = heap[0][0]
+                timCol.append(tim)
+                for col in valCols:
+                    col.append(nan)
+                while heap and heap[0][0] == tim:
+                    s = heap[0][1]
+                    idx = nextidx[s]
+                    valCols[s][count] = avgCols[s][idx]
+                    idx = idx + 1
+                    nextidx[s] = idx
+                    if idx < len(endCols[s]) or nextChunk(s):
+                        heapq.heapreplace(heap, (endCols[s][nextidx[s]], s))
+                    else:
+                        heapq.heappop(heap)
+                count = count + 1
+            yield [timCol] + valCols
+
+    def _openWriter(self, columnNames, timeColumns):
+        if self._fileFormat == "csv":
+            return _YCSVWriter(self._fileName, columnNames, timeColumns, self._separator, self._precision, self._isoTime)
+        return _YArrowWriter(self._fileName, columnNames, self._fileFormat == "parquet")
+
+    def _export(self, columnNames, timeColumns, chunks):
+        writer = self._openWriter(columnNames, timeColumns)
+        pending = queue.Queue(max(1, self._maxPendingChunks))
+        errors = []
+
+        def writeChunks():
+            while True:
+                columns = pending.get()
+                if columns is None:
+                    return
+                if not errors:
+                    try:
+                        writer.write(columns)
+                    except Exception as ex:
+                        # keep emptying the queue, so that the loading thread is not blocked
+                        errors.append(ex)
+
+        thread = threading.Thread(target=writeChunks, name="YDataExporter")
+        thread.daemon = True
+        thread.start()
+        count = 0
+        try:
+            for columns in chunks:
+                if errors:
+                    break
+                pending.put(columns)
+                count += len(columns[0])
+        finally:
+            pending.put(None)
+            thread.join()
+            writer.close()
+        if errors:
+            raise errors[0]
+        return count
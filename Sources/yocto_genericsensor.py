@@ -151,7 +151,7 @@ class YGenericSensor(YSensor):
         On failure, throws an exception or returns YGenericSensor.SIGNALUNIT_INVALID.
         """
         # res
-        if self._cacheExpiration == datetime.datetime.fromtimestamp(86400):
+        if self._cacheExpiration == 0:
             if self.load(YAPI._yapiContext.GetCacheValidity()) != YAPI.SUCCESS:
                 return YGenericSensor.SIGNALUNIT_INVALID
         res = self._signalUnit
@@ -49,6 +49,7 @@ class YI2cSnoopingRecord(object):
     #--- (end of generated code: YI2cSnoopingRecord class start)
     #--- (generated code: YI2cSnoopingRecord definitions)
     #--- (end of generated code: YI2cSnoopingRecord definitions)
+    __slots__ = ("_tim", "_pos", "_dir", "_msg")
 
     def __init__(self, json_str):
         #--- (generated code: YI2cSnoopingRecord attributes)
@@ -362,7 +363,7 @@ class YI2cPort(YFunction):
         On failure, throws an exception or returns YI2cPort.JOBMAXTASK_INVALID.
         """
         # res
-        if self._cacheExpiration == datetime.datetime.fromtimestamp(86400):
+        if self._cacheExpiration == 0:
             if self.load(YAPI._yapiContext.GetCacheValidity()) != YAPI.SUCCESS:
                 return YI2cPort.JOBMAXTASK_INVALID
         res = self._jobMaxTask
@@ -377,7 +378,7 @@ class YI2cPort(YFunction):
         On failure, throws an exception or returns YI2cPort.JOBMAXSIZE_INVALID.
         """
         # res
-        if self._cacheExpiration == datetime.datetime.fromtimestamp(86400):
+        if self._cacheExpiration == 0:
             if self.load(YAPI._yapiContext.GetCacheValidity()) != YAPI.SUCCESS:
                 return YI2cPort.JOBMAXSIZE_INVALID
         res = self._jobMaxSize
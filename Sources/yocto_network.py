@@ -253,7 +253,7 @@ class YNetwork(YFunction):
         On failure, throws an exception or returns YNetwork.MACADDRESS_INVALID.
         """
         # res
-        if self._cacheExpiration == datetime.datetime.fromtimestamp(86400):
+        if self._cacheExpiration == 0:
             if self.load(YAPI._yapiContext.GetCacheValidity()) != YAPI.SUCCESS:
                 return YNetwork.MACADDRESS_INVALID
         res = self._macAddress
@@ -49,6 +49,7 @@ class YSdi12SnoopingRecord(object):
     #--- (end of generated code: YSdi12SnoopingRecord class start)
     #--- (generated code: YSdi12SnoopingRecord definitions)
     #--- (end of generated code: YSdi12SnoopingRecord definitions)
+    __slots__ = ("_tim", "_pos", "_dir", "_msg")
 
     def __init__(self, json_str):
         #--- (generated code: YSdi12SnoopingRecord attributes)
@@ -614,7 +615,7 @@ class YSdi12Port(YFunction):
         On failure, throws an exception or returns YSdi12Port.JOBMAXTASK_INVALID.
         """
         # res
-        if self._cacheExpiration == datetime.datetime.fromtimestamp(86400):
+        if self._cacheExpiration == 0:
             if self.load(YAPI._yapiContext.GetCacheValidity()) != YAPI.SUCCESS:
                 return YSdi12Port.JOBMAXTASK_INVALID
         res = self._jobMaxTask
@@ -629,7 +630,7 @@ class YSdi12Port(YFunction):
         On failure, throws an exception or returns YSdi12Port.JOBMAXSIZE_INVALID.
         """
         # res
-        if self._cacheExpiration == datetime.datetime.fromtimestamp(86400):
+        if self._cacheExpiration == 0:
             if self.load(YAPI._yapiContext.GetCacheValidity()) != YAPI.SUCCESS:
                 return YSdi12Port.JOBMAXSIZE_INVALID
         res = self._jobMaxSize
@@ -50,6 +50,7 @@ class YSnoopingRecord(object):
     #--- (end of generated code: YSnoopingRecord class start)
     #--- (generated code: YSnoopingRecord definitions)
     #--- (end of generated code: YSnoopingRecord definitions)
+    __slots__ = ("_tim", "_pos", "_dir", "_msg")
 
     def __init__(self, json_str):
         #--- (generated code: YSnoopingRecord attributes)
@@ -370,7 +371,7 @@ class YSerialPort(YFunction):
         On failure, throws an exception or returns YSerialPort.JOBMAXTASK_INVALID.
         """
         # res
-        if self._cacheExpiration == datetime.datetime.fromtimestamp(86400):
+        if self._cacheExpiration == 0:
             if self.load(YAPI._yapiContext.GetCacheValidity()) != YAPI.SUCCESS:
                 return YSerialPort.JOBMAXTASK_INVALID
         res = self._jobMaxTask
@@ -385,7 +386,7 @@ class YSerialPort(YFunction):
         On failure, throws an exception or returns YSerialPort.JOBMAXSIZE_INVALID.
         """
         # res
-        if self._cacheExpiration == datetime.datetime.fromtimestamp(86400):
+        if self._cacheExpiration == 0:
             if self.load(YAPI._yapiContext.GetCacheValidity()) != YAPI.SUCCESS:
                 return YSerialPort.JOBMAXSIZE_INVALID
         res = self._jobMaxSize
@@ -49,6 +49,7 @@ class YSpiSnoopingRecord(object):
     #--- (end of generated code: YSpiSnoopingRecord class start)
     #--- (generated code: YSpiSnoopingRecord definitions)
     #--- (end of generated code: YSpiSnoopingRecord definitions)
+    __slots__ = ("_tim", "_pos", "_dir", "_msg")
 
     def __init__(self, json_str):
         #--- (generated code: YSpiSnoopingRecord attributes)
@@ -382,7 +383,7 @@ class YSpiPort(YFunction):
         On failure, throws an exception or returns YSpiPort.JOBMAXTASK_INVALID.
         """
         # res
-        if self._cacheExpiration == datetime.datetime.fromtimestamp(86400):
+        if self._cacheExpiration == 0:
             if self.load(YAPI._yapiContext.GetCacheValidity()) != YAPI.SUCCESS:
                 return YSpiPort.JOBMAXTASK_INVALID
         res = self._jobMaxTask
@@ -397,7 +398,7 @@ class YSpiPort(YFunction):
         On failure, throws an exception or returns YSpiPort.JOBMAXSIZE_INVALID.
         """
         # res
-        if self._cacheExpiration == datetime.datetime.fromtimestamp(86400):
+        if self._cacheExpiration == 0:
             if self.load(YAPI._yapiContext.GetCacheValidity()) != YAPI.SUCCESS:
                 return YSpiPort.JOBMAXSIZE_INVALID
         res = self._jobMaxSize
@@ -204,7 +204,7 @@ class YTemperature(YSensor):
         On failure, throws an exception or returns YTemperature.SIGNALUNIT_INVALID.
         """
         # res
-        if self._cacheExpiration == datetime.datetime.fromtimestamp(86400):
+        if self._cacheExpiration == 0:
             if self.load(YAPI._yapiContext.GetCacheValidity()) != YAPI.SUCCESS:
                 return YTemperature.SIGNALUNIT_INVALID
         res = self._signalUnit